@@ -0,0 +1,216 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Optional, Tuple, Union
+from core_config import CORE_CONFIGURATION as CONFIG, MOUSE_MESSAGE, difficulty_validation, getBombNumber
+
+
+class BatchMinesweeper:
+    """
+    K boards of the same shape and difficulty played in lock-step, for Monte-Carlo simulation.
+    Every board follows the rules of the core (core.py) with the same notation, but the state is stored in
+    (K, H, W) arrays and every move is a masked NumPy operation over all boards at once:
+    + self.core_matrix: (K, H, W) int8 - Bomb Notation or the number of adjacent bombs
+    + self.interface_matrix: (K, H, W) int8 - 0 (hidden), 1 (opened), Flag Notation, Question Notation
+    + self.PlayingStatus / self.VictoryStatus: (K, ) bool
+    + self.remainingFlags / self.accomplishedNodes: (K, ) int32
+    The bombs are sampled by a numpy.random.Generator: seeded with (seed), the same boards are generated again.
+    """
+    def __init__(self, boards: int, size: Union[int, Tuple[int, int]] = 16, difficulty: str = "Medium",
+                 seed: Optional[int] = None):
+        # [0]: Hyper-parameter Verification
+        if True:
+            if not isinstance(boards, int) or boards <= 0:
+                raise ValueError(" False Initialization. The number of boards should be a positive integer")
+
+            if size is None:
+                size: Tuple[int, int] = (CONFIG["Default Size"], CONFIG["Default Size"])
+            elif isinstance(size, int):
+                size: Tuple[int, int] = (size, size)
+            elif not isinstance(size, Tuple) or len(size) != 2:
+                raise TypeError("False Initialization: The size should be a tuple with two positive values")
+
+            for i in size:
+                if not isinstance(i, int) or i <= 0:
+                    raise TypeError("False Initialization: The size should be a tuple with two positive values")
+
+            difficulty_validation(key=difficulty)
+            pass
+
+        # [1]: Setup Core for Data Implementation
+        self.size: Tuple[int, int] = size
+        self.boards: int = boards
+        self.difficulty: str = difficulty
+        self._bombNumber: int = getBombNumber(size=self.size, difficulty=difficulty)
+        if self._bombNumber > self.getNumberOfNodes():
+            raise ValueError("The number of bombs ({}) is larger than the number of nodes ({})"
+                             .format(self._bombNumber, self.getNumberOfNodes()))
+
+        self.BombNotation: int = CONFIG["Bomb Notation"]
+        self.FlagNotation: int = CONFIG["Flag Notation"]
+        self.QuestionNotation: int = CONFIG["Question Notation"]
+
+        self.core_matrix: np.ndarray = np.zeros(shape=(boards, *size), dtype=np.int8)
+        self.interface_matrix: np.ndarray = np.zeros(shape=(boards, *size), dtype=np.int8)
+        self.PlayingStatus: np.ndarray = np.ones(shape=boards, dtype=np.bool_)
+        self.VictoryStatus: np.ndarray = np.zeros(shape=boards, dtype=np.bool_)
+        self.remainingFlags: np.ndarray = np.full(shape=boards, fill_value=self._bombNumber, dtype=np.int32)
+        self.accomplishedNodes: np.ndarray = np.zeros(shape=boards, dtype=np.int32)
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+        self.build()
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [1]: Building Information for Matrix before Running the Game
+    def build(self, rng: Optional[np.random.Generator] = None) -> None:
+        # Place the bombs of every board in one call: the bombNumber smallest keys of a random (K, N) matrix are an
+        # uniform sample without replacement for each row. Then count the bombs with a 3x3 window over the padded mask
+        rng: np.random.Generator = rng if rng is not None else self._rng
+        keys: np.ndarray = rng.random(size=(self.boards, self.getNumberOfNodes()))
+        bomb_index: np.ndarray = np.argpartition(keys, self._bombNumber - 1, axis=1)[:, :self._bombNumber] \
+            if 0 < self._bombNumber < self.getNumberOfNodes() else np.argsort(keys, axis=1)[:, :self._bombNumber]
+
+        mask: np.ndarray = np.zeros(shape=(self.boards, self.getNumberOfNodes()), dtype=np.bool_)
+        np.put_along_axis(mask, bomb_index, True, axis=1)
+        mask: np.ndarray = mask.reshape(self.core_matrix.shape)
+
+        padded: np.ndarray = np.pad(mask, pad_width=((0, 0), (1, 1), (1, 1)), mode="constant",
+                                    constant_values=False).astype(np.int8)
+        self.core_matrix = sliding_window_view(padded, window_shape=(3, 3), axis=(1, 2)).sum(axis=(3, 4), dtype=np.int8)
+        self.core_matrix[mask] = self.BombNotation
+
+    def reset(self, rng: Optional[np.random.Generator] = None) -> None:
+        # Generate K new boards of the same shape & difficulty (from the generator of the boards if rng is None)
+        self.interface_matrix.fill(0)
+        self.PlayingStatus.fill(True)
+        self.VictoryStatus.fill(False)
+        self.remainingFlags.fill(self._bombNumber)
+        self.accomplishedNodes.fill(0)
+        self.build(rng=rng)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [2]: Gaming Function
+    @staticmethod
+    def _dilate4(mask: np.ndarray) -> np.ndarray:
+        # Add the 4-neighbors (Top, Bottom, Left, Right) of every True node of the (B, H, W) mask
+        grown: np.ndarray = mask.copy()
+        grown[:, 1:, :] |= mask[:, :-1, :]
+        grown[:, :-1, :] |= mask[:, 1:, :]
+        grown[:, :, 1:] |= mask[:, :, :-1]
+        grown[:, :, :-1] |= mask[:, :, 1:]
+        return grown
+
+    def _floodRegions(self, boards: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+        # Same region as minesweeper.getZeroRegion(): the 4-connected empty nodes reached from the seed, plus their
+        # numbered 4-neighbors. Grown by dilation; only the boards whose region still grows are iterated
+        empty: np.ndarray = self.core_matrix[boards] == 0
+        region: np.ndarray = seeds & empty
+        growing: np.ndarray = np.arange(boards.shape[0])
+        while growing.shape[0] != 0:
+            current: np.ndarray = region[growing]
+            grown: np.ndarray = self._dilate4(current) & empty[growing]
+            changed: np.ndarray = (grown != current).any(axis=(1, 2))
+            region[growing] = grown
+            growing = growing[changed]
+        return self._dilate4(region)
+
+    def click(self, y: np.ndarray, x: np.ndarray, message: str = "LeftMouse",
+              mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply one click per board at (y[k], x[k]). Boards which are not playable, or excluded by mask, are unchanged.
+
+        :param y: (K, ) int array of the vertical position
+        :param x: (K, ) int array of the horizontal position
+        :param message: "LeftMouse" or "RightMouse" (see MOUSE_MESSAGE)
+        :param mask: (K, ) bool array of the boards receiving the click (default: all boards)
+        :return: (terminal, victory): (K, ) bool arrays
+        """
+        if message not in MOUSE_MESSAGE.keys():
+            raise ValueError("Clicked mouse has emit unknown message ({})".format(message))
+        y: np.ndarray = np.asarray(y, dtype=np.intp)
+        x: np.ndarray = np.asarray(x, dtype=np.intp)
+        if y.shape != (self.boards, ) or x.shape != (self.boards, ):
+            raise ValueError("y and x should be arrays of shape ({}, )".format(self.boards))
+        if ((y < 0) | (y >= self.size[0]) | (x < 0) | (x >= self.size[1])).any():
+            raise ValueError("The selected position cannot be found on every board")
+
+        active: np.ndarray = self.PlayingStatus.copy()
+        if mask is not None:
+            active &= np.asarray(mask, dtype=np.bool_)
+        boards: np.ndarray = np.flatnonzero(active)
+        y, x = y[boards], x[boards]
+        state: np.ndarray = self.interface_matrix[boards, y, x]
+
+        if MOUSE_MESSAGE[message] == "L":
+            # [1]: Left-mouse only works on hidden nodes
+            hidden: np.ndarray = state == 0
+            boards, y, x = boards[hidden], y[hidden], x[hidden]
+            value: np.ndarray = self.core_matrix[boards, y, x]
+
+            # [1.1]: Bomb or number: Open one node
+            single: np.ndarray = value != 0
+            self.interface_matrix[boards[single], y[single], x[single]] = 1
+            self.accomplishedNodes[boards[single]] += 1
+            lost: np.ndarray = boards[value == self.BombNotation]
+            self.PlayingStatus[lost] = False
+            self.VictoryStatus[lost] = False
+
+            # [1.2]: Empty: Open the whole region
+            empty: np.ndarray = ~single
+            if empty.any():
+                flooded: np.ndarray = boards[empty]
+                seeds: np.ndarray = np.zeros(shape=(flooded.shape[0], *self.size), dtype=np.bool_)
+                seeds[np.arange(flooded.shape[0]), y[empty], x[empty]] = True
+                interface: np.ndarray = self.interface_matrix[flooded]
+                region: np.ndarray = self._floodRegions(boards=flooded, seeds=seeds)
+                # The flags opened by the region are given back, as minesweeper.click() does
+                self.remainingFlags[flooded] += np.count_nonzero(region & (interface == self.FlagNotation),
+                                                                 axis=(1, 2)).astype(np.int32)
+                interface[region] = 1
+                self.interface_matrix[flooded] = interface
+                self.accomplishedNodes[flooded] = np.count_nonzero((interface == 1) | (interface == self.FlagNotation),
+                                                                   axis=(1, 2))
+
+        elif MOUSE_MESSAGE[message] == "R":
+            # [2]: Right-mouse cycles: Hidden --> Flag --> Question --> Hidden
+            flag: np.ndarray = state == 0
+            question: np.ndarray = state == self.FlagNotation
+            hide: np.ndarray = state == self.QuestionNotation
+            self.interface_matrix[boards[flag], y[flag], x[flag]] = self.FlagNotation
+            self.interface_matrix[boards[question], y[question], x[question]] = self.QuestionNotation
+            self.interface_matrix[boards[hide], y[hide], x[hide]] = 0
+            np.add.at(self.remainingFlags, boards[flag], -1)
+            np.add.at(self.accomplishedNodes, boards[flag], 1)
+            np.add.at(self.remainingFlags, boards[question], 1)
+            np.add.at(self.accomplishedNodes, boards[question], -1)
+
+        # [3]: Same victory rule as minesweeper.click()
+        won: np.ndarray = active & self.PlayingStatus & ~self.VictoryStatus & (self.remainingFlags == 0) & \
+            (self.accomplishedNodes == self.getNumberOfNodes())
+        self.PlayingStatus[won] = False
+        self.VictoryStatus[won] = True
+        return self.getTerminalStatus(), self.VictoryStatus.copy()
+
+    def sampleHiddenNodes(self, rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+        # One uniformly random hidden node per board (the position is (0, 0) for boards without hidden node)
+        rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
+        hidden: np.ndarray = (self.interface_matrix == 0).reshape(self.boards, -1)
+        keys: np.ndarray = np.where(hidden, rng.random(size=hidden.shape), -1.0)
+        index: np.ndarray = np.argmax(keys, axis=1)
+        return np.divmod(index, self.size[1])
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [x]: Getter Function
+    def getTerminalStatus(self) -> np.ndarray:
+        return ~self.PlayingStatus
+
+    def getVictoryStatus(self) -> np.ndarray:
+        return self.VictoryStatus.copy()
+
+    def getNumberOfNodes(self) -> int:
+        return self.size[0] * self.size[1]
+
+    def getBombNumber(self) -> int:
+        return self._bombNumber
+
+    def getHiddenNodes(self) -> np.ndarray:
+        # Number of hidden nodes of every board
+        return np.count_nonzero(self.interface_matrix == 0, axis=(1, 2))
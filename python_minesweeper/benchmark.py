@@ -0,0 +1,177 @@
+import json
+import platform
+import numpy as np
+from datetime import datetime
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from board_id import SEED_BITS
+from core import minesweeper
+from core_config import DIFFICULTY, difficulty_validation, getBombNumber
+from simulation import GameResult, getSolver, playGame
+
+# Benchmark of a solver over (size, difficulty) settings: every game is generated from its own seed (see gameSeed()),
+# so two runs with the same seed play the same boards, and the JSON reports can be compared between versions.
+# The decision latencies are accumulated in a log-scale histogram (LATENCY_BINS) so that the statistics of any number
+# of games can be merged in O(1) memory (see BenchmarkStatistics.merge()).
+LATENCY_BINS: np.ndarray = np.logspace(-7, 2, num=9 * 20 + 1)  # 100 ns --> 100 s, 20 bins per decade
+BENCHMARK_PERCENTILES: Tuple[int, ...] = (50, 90, 99)
+BENCHMARK_SIZES: Tuple[int, ...] = (8, 16, 30)
+
+
+class BenchmarkStatistics:
+    """ Aggregated results of the games played with one solver on one (size, difficulty) setting """
+    __slots__ = ("games", "victories", "moves", "guesses", "elapsed", "openedNodes", "decisions", "maxLatency",
+                 "histogram")
+
+    def __init__(self):
+        self.games: int = 0
+        self.victories: int = 0
+        self.moves: int = 0
+        self.guesses: int = 0
+        self.elapsed: float = 0
+        self.openedNodes: int = 0
+        self.decisions: int = 0
+        self.maxLatency: float = 0
+        self.histogram: np.ndarray = np.zeros(shape=LATENCY_BINS.shape[0] + 1, dtype=np.int64)
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.victories += int(result.victory)
+        self.moves += result.moves
+        self.guesses += result.guesses
+        self.elapsed += result.elapsed
+        self.openedNodes += result.openedNodes
+        if len(result.latencies) != 0:
+            latencies: np.ndarray = np.asarray(result.latencies, dtype=np.float64)
+            self.decisions += latencies.shape[0]
+            self.maxLatency = max(self.maxLatency, float(latencies.max()))
+            np.add.at(self.histogram, np.searchsorted(LATENCY_BINS, latencies), 1)
+
+    def merge(self, other: "BenchmarkStatistics") -> None:
+        self.games += other.games
+        self.victories += other.victories
+        self.moves += other.moves
+        self.guesses += other.guesses
+        self.elapsed += other.elapsed
+        self.openedNodes += other.openedNodes
+        self.decisions += other.decisions
+        self.maxLatency = max(self.maxLatency, other.maxLatency)
+        self.histogram += other.histogram
+
+    def getLatencyPercentile(self, q: float) -> float:
+        # Upper edge of the histogram bin holding the q-th percentile (seconds), at most 12 % above the exact value
+        if self.decisions == 0:
+            return 0.0
+        rank: int = int(np.searchsorted(np.cumsum(self.histogram), q / 100 * self.decisions, side="left"))
+        return min(float(LATENCY_BINS[min(rank, LATENCY_BINS.shape[0] - 1)]), self.maxLatency)
+
+    def toDict(self) -> Dict[str, Union[int, float, Dict[str, float]]]:
+        games: int = max(self.games, 1)
+        return {
+            "games": self.games,
+            "victories": self.victories,
+            "win_rate": self.victories / games,
+            "mean_moves": self.moves / games,
+            "mean_guesses": self.guesses / games,
+            "mean_opened_nodes": self.openedNodes / games,
+            "mean_game_time": self.elapsed / games,
+            "total_game_time": self.elapsed,
+            "decisions": self.decisions,
+            "latency_ms": {**{"p{}".format(q): 1e3 * self.getLatencyPercentile(q) for q in BENCHMARK_PERCENTILES},
+                           "max": 1e3 * self.maxLatency},
+        }
+
+
+def gameSeed(seed: int, size: Tuple[int, int], difficulty: str, index: int) -> int:
+    # Seed of the (index)-th game of a setting: independent of the order (and the number) of the benchmarked settings
+    entropy: List[int] = [seed, size[0], size[1], list(DIFFICULTY.keys()).index(difficulty), index]
+    return int(np.random.SeedSequence(entropy).generate_state(1, dtype=np.uint64)[0] >> np.uint64(64 - SEED_BITS))
+
+
+def playSeededGame(solver: object, size: Tuple[int, int], difficulty: str, seed: int,
+                   maxMoves: Optional[int] = None) -> GameResult:
+    # The board is the board of the seed (see minesweeper.getBoardID()), the guesses of the solver draw from an
+    # independent stream of the same seed
+    game: minesweeper = minesweeper(size=size, difficulty=difficulty, verbose=False, seed=seed)
+    rng: np.random.Generator = np.random.default_rng(np.random.SeedSequence(seed).spawn(1)[0])
+    return playGame(game, solver=solver, rng=rng, maxMoves=maxMoves)
+
+
+def _toSize(size: Union[int, Tuple[int, int]]) -> Tuple[int, int]:
+    return (size, size) if isinstance(size, int) else tuple(size)
+
+
+def runBenchmark(solver: str, sizes: Iterable[Union[int, Tuple[int, int]]] = BENCHMARK_SIZES,
+                 difficulties: Optional[Iterable[str]] = None, games: int = 100, seed: int = 0,
+                 maxMoves: Optional[int] = None, workers: int = 1, chunkSize: int = 16, verbose: bool = False) -> Dict:
+    """
+    Play (games) seeded games with the solver on every (size, difficulty) and return the report (JSON-serializable).
+
+    :param solver: The name of the solver (see simulation.SOLVERS)
+    :param sizes: The board sizes: n or (rows, columns)
+    :param difficulties: The difficulties (default: every key of DIFFICULTY)
+    :param games: The number of games per setting
+    :param seed: The seed of the benchmark (see gameSeed())
+    :param maxMoves: The maximum number of moves per game (default: see playGame())
+    :param workers: The number of processes. Above 1, the games are played by parallel.iterateChunks() and the
+                    wall time of a setting is the sum of the wall time of its chunks
+    :param chunkSize: The number of games per task when workers > 1
+    :param verbose: Print one line per setting
+    """
+    if not isinstance(games, int) or games <= 0:
+        raise ValueError("games ({}) should be a positive integer".format(games))
+    difficulties: List[str] = list(difficulties) if difficulties is not None else list(DIFFICULTY.keys())
+    for difficulty in difficulties:
+        difficulty_validation(key=difficulty)
+    settings: List[Tuple[Tuple[int, int], str]] = [(_toSize(size), difficulty) for size in sizes
+                                                    for difficulty in difficulties]
+
+    statistics: Dict[Tuple[Tuple[int, int], str], BenchmarkStatistics] = \
+        {setting: BenchmarkStatistics() for setting in settings}
+    wall_time: Dict[Tuple[Tuple[int, int], str], float] = {setting: 0.0 for setting in settings}
+    start: float = perf_counter()
+    if workers > 1:
+        from parallel import iterateChunks
+        for setting, chunk, elapsed in iterateChunks(solver, settings=settings, games=games, seed=seed,
+                                                     chunkSize=chunkSize, workers=workers, maxMoves=maxMoves):
+            statistics[setting].merge(chunk)
+            wall_time[setting] += elapsed
+    else:
+        engine: object = getSolver(solver)
+        for size, difficulty in settings:
+            timer: float = perf_counter()
+            for index in range(games):
+                statistics[(size, difficulty)].add(
+                    playSeededGame(engine, size=size, difficulty=difficulty, maxMoves=maxMoves,
+                                   seed=gameSeed(seed, size=size, difficulty=difficulty, index=index)))
+            wall_time[(size, difficulty)] = perf_counter() - timer
+
+    results: List[Dict] = []
+    for size, difficulty in settings:
+        bombs: int = getBombNumber(size=size, difficulty=difficulty)
+        results.append({"size": list(size), "difficulty": difficulty, "bombs": bombs,
+                        "bomb_ratio": bombs / (size[0] * size[1]), "wall_time": wall_time[(size, difficulty)],
+                        **statistics[(size, difficulty)].toDict()})
+        if verbose is True:
+            print("(Size: {} --- Difficulty: {}) --> Win Rate: {:.2f} % --- Mean Guess(es): {:.2f} --- "
+                  "Latency p99: {:.4f} ms".format(size, difficulty, 100 * results[-1]["win_rate"],
+                                                  results[-1]["mean_guesses"], results[-1]["latency_ms"]["p99"]))
+
+    return {
+        "solver": solver,
+        "seed": seed,
+        "games_per_setting": games,
+        "max_moves": maxMoves,
+        "workers": workers,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "wall_time": perf_counter() - start,
+        "results": results,
+    }
+
+
+def writeReport(report: Dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
@@ -0,0 +1,64 @@
+import numpy as np
+from typing import List, Optional, Tuple
+from core_config import DIFFICULTY, difficulty_validation
+
+# A board is fully defined by (size, difficulty, seed): the bombs are sampled by a numpy.random.Generator seeded with
+# the seed (see minesweeper._sampleBombPositions()), so the board ID "<rows>x<columns>-<difficulty>-<seed in base 36>"
+# (e.g. "16x30-Hard-2ej1xq8m4kbwf") regenerates the identical board without storing the bomb positions.
+# The boards generated around the first click (safe & no-guess generation) end with "-<y>.<x>": no bomb was sampled in
+# the 3x3 area of that node (e.g. "16x30-Hard-2ej1xq8m4kbwf-7.12").
+SEED_BITS: int = 63
+_DIGITS: str = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def newSeed(rng: Optional[np.random.Generator] = None) -> int:
+    # A fresh seed of SEED_BITS bits: from the rng if provided, else from the entropy of the OS
+    if rng is None:
+        return int(np.random.SeedSequence().generate_state(1, dtype=np.uint64)[0] >> np.uint64(64 - SEED_BITS))
+    return int(rng.integers(0, 2 ** SEED_BITS, dtype=np.int64))
+
+
+def validateSeed(seed: int) -> int:
+    if not isinstance(seed, (int, np.integer)) or isinstance(seed, bool) or not 0 <= seed < 2 ** SEED_BITS:
+        raise ValueError("seed ({}) should be an integer in [0, 2^{})".format(seed, SEED_BITS))
+    return int(seed)
+
+
+def encodeBoardID(size: Tuple[int, int], difficulty: str, seed: int,
+                  safeNode: Optional[Tuple[int, int]] = None) -> str:
+    difficulty_validation(key=difficulty)
+    seed: int = validateSeed(seed)
+    digits: str = ""
+    while True:
+        seed, digit = divmod(seed, 36)
+        digits = _DIGITS[digit] + digits
+        if seed == 0:
+            break
+    boardID: str = "{}x{}-{}-{}".format(size[0], size[1], difficulty, digits)
+    return boardID if safeNode is None else "{}-{}.{}".format(boardID, safeNode[0], safeNode[1])
+
+
+def decodeBoardID(boardID: str) -> Tuple[Tuple[int, int], str, int, Optional[Tuple[int, int]]]:
+    # Return (size, difficulty, seed, safe node or None) of the board ID. Raise ValueError if the board ID is in-valid
+    try:
+        parts: List[str] = boardID.strip().split("-")
+        if len(parts) not in (3, 4):
+            raise ValueError
+        shape, difficulty, digits = parts[:3]
+        rows, columns = shape.lower().split("x")
+        size: Tuple[int, int] = (int(rows), int(columns))
+        seed: int = int(digits, 36)
+        safeNode: Optional[Tuple[int, int]] = None
+        if len(parts) == 4:
+            y, x = parts[3].split(".")
+            safeNode = (int(y), int(x))
+    except (AttributeError, ValueError):
+        raise ValueError("The board ID ({}) should be <rows>x<columns>-<difficulty>-<seed>[-<y>.<x>]".format(boardID))
+    if size[0] <= 0 or size[1] <= 0:
+        raise ValueError("The board ID ({}) should have a positive size".format(boardID))
+    if safeNode is not None and not (0 <= safeNode[0] < size[0] and 0 <= safeNode[1] < size[1]):
+        raise ValueError("The board ID ({}) has a safe node outside of the board".format(boardID))
+    if difficulty not in DIFFICULTY:
+        raise ValueError("The board ID ({}) has an unknown difficulty. Only accept difficulty = {} only"
+                         .format(boardID, list(DIFFICULTY.keys())))
+    return size, difficulty, validateSeed(seed), safeNode
@@ -0,0 +1,125 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import warning
+from typing import Deque, Optional, Tuple
+from core import minesweeper
+
+# Key of the boards of the pool: ((rows, columns), difficulty, generation)
+PoolKey = Tuple[Tuple[int, int], str, str]
+
+
+class BoardPool:
+    """
+    Boards generated in advance on a worker thread, so that starting a game only takes a ready board: O(1).
+    The pool holds at most (capacity) boards of one key (the last used size, difficulty & generation). The worker only
+    generates while the pool is prepared (see prepare()): the opening, dialog and ending screens, never during a game.
+    Changing the key discards the boards of the previous key, including the board being generated.
+    The boards of safe & no-guess generation are prepared up to the first left click (see minesweeper.build()). The
+    work of that click which cannot be done in advance (the no-guess search, the labeling of the regions) runs on a
+    second worker, see searchFirstClick() & buildZeroRegions(): the window only places the bombs of the 3x3 area.
+    """
+    __slots__ = ("capacity", "hits", "misses", "_key", "_active", "_closed", "_version", "_boards", "_condition",
+                 "_thread", "_executor")
+
+    def __init__(self, capacity: int = 2):
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity ({}) should be a positive integer".format(capacity))
+        self.capacity: int = capacity
+        self.hits: int = 0  # Number of take() served by a ready board
+        self.misses: int = 0
+        self._key: Optional[PoolKey] = None
+        self._active: bool = False
+        self._closed: bool = False
+        self._version: int = 0  # Increased when the key changes: the board being generated is discarded
+        self._boards: Deque[minesweeper] = deque()
+        self._condition: threading.Condition = threading.Condition()
+        self._thread: threading.Thread = threading.Thread(target=self._run, name="BoardPool", daemon=True)
+        self._thread.start()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="BoardPool-click")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [1]: Worker Function
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and (not self._active or self._key is None or
+                                            len(self._boards) >= self.capacity):
+                    self._condition.wait()
+                if self._closed:
+                    return None
+                key, version = self._key, self._version
+
+            try:
+                board: minesweeper = minesweeper(size=key[0], difficulty=key[1], verbose=False, generation=key[2])
+            except Exception as error:  # Never kill the worker: startGame() generates the board itself
+                warning(" The board pool cannot generate the board {}: {}".format(key, error))
+                with self._condition:
+                    if self._version == version:
+                        self._active = False
+                continue
+
+            with self._condition:
+                if self._version == version and len(self._boards) < self.capacity:
+                    self._boards.append(board)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [2]: Pool Function
+    def prepare(self, size: Tuple[int, int], difficulty: str, generation: str) -> None:
+        # Generate the boards of this key in the background. The boards of another key are discarded
+        key: PoolKey = ((int(size[0]), int(size[1])), difficulty, generation)
+        with self._condition:
+            if key != self._key:
+                self._key = key
+                self._version += 1
+                self._boards.clear()
+            self._active = True
+            self._condition.notify()
+
+    def pause(self) -> None:
+        # Stop generating after the board in progress (e.g. while a game is played). The ready boards are kept
+        with self._condition:
+            self._active = False
+
+    def take(self, size: Tuple[int, int], difficulty: str, generation: str) -> Optional[minesweeper]:
+        # A ready board of this key, or None (the caller generates it). The boards of another key are discarded
+        key: PoolKey = ((int(size[0]), int(size[1])), difficulty, generation)
+        with self._condition:
+            if key == self._key and self._boards:
+                self.hits += 1
+                board: minesweeper = self._boards.popleft()
+                self._condition.notify()
+                return board
+            if key != self._key:
+                self._key = None
+                self._version += 1
+                self._boards.clear()
+            self.misses += 1
+            return None
+
+    def searchFirstClick(self, board: minesweeper, y: int, x: int) -> Future:
+        # No-guess generation: search the seed of the board in the background. The result (seed, statistics) is given
+        # to board.placeBombs() by the caller, on its own thread
+        return self._executor.submit(board.searchNoGuessSeed, y, x)
+
+    def buildZeroRegions(self, board: minesweeper) -> Future:
+        # Label the regions of the empty nodes of a board whose bombs have just been placed (minesweeper.placeBombs())
+        return self._executor.submit(board.buildZeroRegions)
+
+    def clear(self) -> None:
+        with self._condition:
+            self._key = None
+            self._version += 1
+            self._boards.clear()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            self._closed = True
+            self._boards.clear()
+            self._condition.notify_all()
+        self._executor.shutdown(wait=False)
+        self._thread.join(timeout=timeout)
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._boards)
@@ -0,0 +1,171 @@
+"""
+Headless entry point of the game: python -m python_minesweeper.cli <command> [options]
+Only NumPy and the core are imported (no PyQt5 / pandas), so that scripted games can run on servers without display.
++ new: Create a board and print it (--board <board ID> to regenerate a board)
++ play: Create a board, apply a list of moves ("<L|R|M>:<y>,<x>") and print the board
++ solve: Play a number of games with a solver and print the results
++ benchmark: Play seeded games with a solver on several sizes & difficulties and write the JSON report
+"""
+import argparse
+import os
+import sys
+from time import perf_counter
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+_start: float = perf_counter()
+import numpy as np  # noqa: E402
+from board_id import newSeed  # noqa: E402
+from core import minesweeper  # noqa: E402
+from core_config import DIFFICULTY, GENERATION_MODES  # noqa: E402
+from simulation import SOLVERS, GameResult, applyMoves, getSolver, playGame  # noqa: E402
+from benchmark import BENCHMARK_SIZES, runBenchmark, writeReport  # noqa: E402
+IMPORT_TIME: float = perf_counter() - _start
+
+
+def _parseSize(value: str):
+    # "16" -> 16, "16x30" -> (16, 30)
+    try:
+        if "x" in value.lower():
+            y, x = value.lower().split("x")
+            return int(y), int(x)
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError("The size ({}) should be an integer or <rows>x<cols>".format(value))
+
+
+def renderBoard(game: minesweeper, reveal: bool = False) -> str:
+    # Text representation of the board: "_" hidden, "F" flag, "?" question, "*" bomb, "." empty, "1"-"8" numbers
+    core: np.ndarray = game.getCoreView()
+    interface: np.ndarray = game.getInterfaceMatrix()
+    board: np.ndarray = np.full(shape=core.shape, fill_value="_", dtype="<U1")
+    opened: np.ndarray = (interface == 1) | reveal
+    board[opened] = core[opened].astype("<U1")
+    board[opened & (core == 0)] = "."
+    board[opened & (core == game.BombNotation)] = "*"
+    board[interface == game.FlagNotation] = "F"
+    board[interface == game.QuestionNotation] = "?"
+    return "\n".join(" ".join(row) for row in board.tolist())
+
+
+def _printStatus(game: minesweeper) -> None:
+    status: str = "Playing" if game.checkIfPlayable() else ("Victory" if game.checkIfVictory() else "Defeat")
+    print("Board: {} --- Size: {} --- Difficulty: {} --- Bomb(s): {} --- Remaining Flag(s): {} --- Status: {}"
+          .format(game.getBoardID(), game.size, game.difficulty, game.getBombNumber(), game.getRemainingFlags(),
+                  status))
+
+
+def _newGame(args: argparse.Namespace) -> minesweeper:
+    return minesweeper(size=args.size, difficulty=args.difficulty, seed=args.seed, boardID=args.board,
+                       generation=getattr(args, "generation", None))
+
+
+def commandNew(args: argparse.Namespace) -> int:
+    game: minesweeper = _newGame(args)
+    _printStatus(game)
+    print(renderBoard(game, reveal=True))
+    return 0
+
+
+def commandPlay(args: argparse.Namespace) -> int:
+    game: minesweeper = _newGame(args)
+    applied: int = applyMoves(game, moves=args.moves)
+    print("Applied Move(s): {} / {}".format(applied, len(args.moves)))
+    _printStatus(game)
+    print(renderBoard(game, reveal=args.reveal))
+    return 0
+
+
+def commandSolve(args: argparse.Namespace) -> int:
+    # The seed of every board (unless --board replays the same board) and the guesses are drawn from the rng of --seed
+    rng: np.random.Generator = np.random.default_rng(args.seed)
+    solver = getSolver(args.solver)
+    results: List[GameResult] = []
+    for _ in range(args.games):
+        game: minesweeper = minesweeper(size=args.size, difficulty=args.difficulty, seed=newSeed(rng),
+                                        boardID=args.board, generation=args.generation)
+        results.append(playGame(game, solver=solver, rng=rng))
+
+    victories: int = sum(result.victory for result in results)
+    latencies: np.ndarray = np.array([value for result in results for value in result.latencies], dtype=np.float64)
+    print("Solver: {} --- Game(s): {} --- Victory: {} ({} %)"
+          .format(args.solver, len(results), victories, round(100 * victories / max(len(results), 1), 2)))
+    print("Mean Move(s): {:.2f} --- Mean Guess(es): {:.2f} --- Mean Time: {:.6f} s"
+          .format(np.mean([result.moves for result in results]), np.mean([result.guesses for result in results]),
+                  np.mean([result.elapsed for result in results])))
+    if latencies.shape[0] != 0:
+        print("Decision Latency (ms): p50 = {:.4f} --- p99 = {:.4f}"
+              .format(*(np.percentile(latencies, [50, 99]) * 1e3)))
+    return 0
+
+
+def commandBenchmark(args: argparse.Namespace) -> int:
+    report = runBenchmark(solver=args.solver, sizes=args.sizes, difficulties=args.difficulties, games=args.games,
+                          seed=args.seed, maxMoves=args.max_moves, workers=args.workers, chunkSize=args.chunk_size,
+                          verbose=True)
+    print("Wall Time: {:.4f} s".format(report["wall_time"]))
+    if args.output is not None:
+        writeReport(report, path=args.output)
+        print("Report: {}".format(args.output))
+    return 0
+
+
+def buildParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m python_minesweeper.cli", description="Headless Minesweeper")
+    parser.add_argument("--timing", action="store_true", help="Print the cold-start import time of the core")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    def addBoardArguments(subparser: argparse.ArgumentParser) -> None:
+        subparser.add_argument("--size", type=_parseSize, default=16, help="<n> or <rows>x<cols> (default: 16)")
+        subparser.add_argument("--difficulty", choices=list(DIFFICULTY.keys()), default="Medium")
+        subparser.add_argument("--board", default=None,
+                               help="Board ID (<rows>x<cols>-<difficulty>-<seed>), overrides --size & --difficulty")
+
+    new = subparsers.add_parser("new", help="Create a board and print it")
+    addBoardArguments(new)
+    new.add_argument("--seed", type=int, default=None, help="Seed of the board (default: random)")
+    new.set_defaults(function=commandNew)
+
+    play = subparsers.add_parser("play", help="Apply moves (<L|R|M>:<y>,<x>) on a new board")
+    addBoardArguments(play)
+    play.add_argument("moves", nargs="+", help="e.g. L:3,4 R:0,0 M:3,4")
+    play.add_argument("--reveal", action="store_true", help="Print the hidden nodes as well")
+    play.add_argument("--seed", type=int, default=None, help="Seed of the board (default: random)")
+    play.add_argument("--generation", choices=GENERATION_MODES, default=None,
+                      help="safe / no-guess: the bombs are placed at the first left click")
+    play.set_defaults(function=commandPlay)
+
+    solve = subparsers.add_parser("solve", help="Play games with a solver and print the results")
+    addBoardArguments(solve)
+    solve.add_argument("--solver", choices=list(SOLVERS.keys()), default="random")
+    solve.add_argument("--games", type=int, default=1)
+    solve.add_argument("--seed", type=int, default=None)
+    solve.add_argument("--generation", choices=GENERATION_MODES, default=None,
+                       help="safe / no-guess: the bombs are placed at the first left click")
+    solve.set_defaults(function=commandSolve)
+
+    benchmark = subparsers.add_parser("benchmark", help="Benchmark a solver on several sizes & difficulties")
+    benchmark.add_argument("--solver", choices=list(SOLVERS.keys()), default="constraint")
+    benchmark.add_argument("--sizes", type=_parseSize, nargs="+", default=list(BENCHMARK_SIZES))
+    benchmark.add_argument("--difficulties", choices=list(DIFFICULTY.keys()), nargs="+", default=None)
+    benchmark.add_argument("--games", type=int, default=100, help="Number of games per size & difficulty")
+    benchmark.add_argument("--seed", type=int, default=0)
+    benchmark.add_argument("--max-moves", type=int, default=None)
+    benchmark.add_argument("--workers", type=int, default=1, help="Number of processes (default: 1)")
+    benchmark.add_argument("--chunk-size", type=int, default=16, help="Number of games per task of a process")
+    benchmark.add_argument("--output", default=None, help="Path of the JSON report")
+    benchmark.set_defaults(function=commandBenchmark)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args: argparse.Namespace = buildParser().parse_args(argv)
+    if args.timing is True:
+        print("Import Time: {:.4f} s".format(IMPORT_TIME))
+    return args.function(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
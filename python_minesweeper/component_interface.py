@@ -1,11 +1,11 @@
-from typing import Tuple, List, Union, Optional, Callable, Dict
-import pandas as pd
+from typing import Tuple, List, Union, Optional, Callable, Dict, Set, Iterable, Iterator, Sequence
+import numpy as np
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
 from core import minesweeper
 from config import CORE_CONFIGURATION as CONFIG, getBombNumberImage, getFlagImage, getBombImage, getQuestionImage, \
-    BOMB_NUMBER_DISPLAY as number_displayer, DIFFICULTY, DIALOG_SIZE, getDialogBackground, getExtraButton
+    BOMB_NUMBER_DISPLAY as number_displayer, DIFFICULTY, DIALOG_SIZE, getDialogBackground, getExtraButton, HINT_COLOR
 from time import sleep, time
 
 
@@ -61,58 +61,142 @@ class HoveringButton(QPushButton):
 
 
 class TableModel(QAbstractTableModel):
-    def __init__(self, data, *args, **kwargs):
+    """
+    Read-only table stored by column: self._columns[c][r] is the text of the cell (r, c), formatted once when the row
+    is received, so painting a cell is a list lookup.
+    The rows come in batches from an iterator (e.g. Leaderboard.iterateRanking()): the first batch is read at the
+    construction, the next ones only when the view asks for more rows while scrolling (canFetchMore / fetchMore), so
+    a table over the whole history never loads the history in memory.
+    """
+    def __init__(self, columns: Sequence[str], rows: Iterable[Sequence] = (),
+                 batches: Optional[Iterator[Sequence[Sequence]]] = None, *args, **kwargs):
         super(TableModel, self).__init__(*args, **kwargs)
-        self._data = data
-
-    def toDataFrame(self):
-        return self._df.copy()
-
-    def setDataFrame(self, dataframe):
-        self.beginResetModel()
-        self._data = dataframe.copy()
-        self.endResetModel()
-
-    def dataFrame(self):
-        return self._data
-
-    dataFrame = pyqtProperty(pd.DataFrame, fget=dataFrame, fset=setDataFrame)
+        self._header: List[str] = list(columns)
+        self._columns: List[List[str]] = [[] for _ in self._header]
+        self._batches: Optional[Iterator[Sequence[Sequence]]] = batches
+        self._append(list(rows))
+        if batches is not None:
+            self.fetchMore()
+
+    def _append(self, rows: Sequence[Sequence]) -> None:
+        for column, values in enumerate(zip(*rows) if rows else ()):
+            self._columns[column].extend(str(value) for value in values)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._batches is not None
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid() or self._batches is None:
+            return None
+        rows: Optional[Sequence[Sequence]] = next(self._batches, None)
+        if not rows:
+            self._batches = None  # Exhausted
+            return None
+        count: int = self.rowCount()
+        self.beginInsertRows(QModelIndex(), count, count + len(rows) - 1)
+        self._append(rows)
+        self.endInsertRows()
 
     @pyqtSlot(int, Qt.Orientation, result=str)
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-            return self._data.columns[section]
+            return self._header[section]
         return None
 
     def rowCount(self, parent=QModelIndex()):
-        if parent.isValid():
+        if parent.isValid() or not self._columns:
             return 0
-        return len(self._data.index)
+        return len(self._columns[0])
 
     def columnCount(self, parent=QModelIndex()):
         if parent.isValid():
             return 0
-        return self._data.columns.size
+        return len(self._header)
 
     def data(self, index, role=Qt.DisplayRole):
-        if index.isValid():
-            if role == Qt.DisplayRole:
-                return str(self._data.iloc[index.row(), index.column()])
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._columns[index.column()][index.row()]
         return None
 
     def roleNames(self):
-        return {Qt.DisplayRole: b'display', TableModel.DtypeRole: b'dtype', TableModel.ValueRole: b'value'}
+        return {Qt.DisplayRole: b'display'}
+
+
+class PixmapCache:
+    """
+    Process-wide cache of the board tiles, shared by every node.
+    + Asset key: (group, key) with group in ("Number", "Bomb", "Flag", "Question"), e.g. ("Number", 3),
+      ("Number", None) for the initial block, ("Number", "NULL") for the hovering block, ("Bomb", "Excited")
+    + ("Hint", None): the initial block tinted by HINT_COLOR (no image on the disk), for the nodes given by a hint
+    + Every image is decoded from the disk once, and scaled once per tile size (width, height)
+    """
+    TILE_KEYS: Tuple[Tuple[str, Optional[Union[str, int]]], ...] = \
+        tuple([("Number", None), ("Number", "NULL"), ("Hint", None)] + [("Number", value) for value in range(0, 9)] +
+              [("Bomb", "Initial"), ("Bomb", "Excited"), ("Flag", "Initial"), ("Flag", "Excited"), ("Question", None)])
+
+    _decoded: Dict[Tuple[str, Optional[Union[str, int]]], QPixmap] = {}
+    _scaled: Dict[Tuple[Tuple[str, Optional[Union[str, int]]], Tuple[int, int]], QPixmap] = {}
+
+    @staticmethod
+    def getPath(key: Tuple[str, Optional[Union[str, int]]]) -> str:
+        group, value = key
+        if group == "Number":
+            return getBombNumberImage(key=value)
+        elif group == "Bomb":
+            return getBombImage(key=value)
+        elif group == "Flag":
+            return getFlagImage(key=value)
+        elif group == "Question":
+            return getQuestionImage(get_size=False)
+        raise ValueError("key ({}) is in-valid. Only accept group = [Number, Bomb, Flag, Question] only".format(key))
+
+    @classmethod
+    def get(cls, key: Tuple[str, Optional[Union[str, int]]], size: Tuple[int, int]) -> QPixmap:
+        pixmap: Optional[QPixmap] = cls._scaled.get((key, size), None)
+        if pixmap is None:
+            if key[0] == "Hint":
+                pixmap = cls._tint(tile=cls.get(key=("Number", None), size=size), color=QColor(*HINT_COLOR))
+            else:
+                source: Optional[QPixmap] = cls._decoded.get(key, None)
+                if source is None:
+                    source = QPixmap(cls.getPath(key=key))
+                    cls._decoded[key] = source
+                pixmap = source.scaled(size[0], size[1], Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            cls._scaled[(key, size)] = pixmap
+        return pixmap
+
+    @staticmethod
+    def _tint(tile: QPixmap, color: QColor) -> QPixmap:
+        # A copy of the tile with the color painted over its opaque pixels only
+        pixmap: QPixmap = QPixmap(tile)
+        painter: QPainter = QPainter(pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceAtop)
+        painter.fillRect(pixmap.rect(), color)
+        painter.end()
+        return pixmap
+
+    @classmethod
+    def warmUp(cls, size: Tuple[int, int]) -> None:
+        # Decode & scale every tile for the tile size before the board is displayed
+        for key in cls.TILE_KEYS:
+            cls.get(key=key, size=size)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._decoded.clear()
+        cls._scaled.clear()
 
 
 class InterfaceNode(QLabel):
 
     __slots__ = ("y", "x", "_value", "_interfaceStatus", "_isMine", "_imageSize", "_imageInterface", "_scalingSize",
-                 "_bombInterface", "_flagInterface", "_questionInterface", "_currentImage", "_message")
+                 "_bombInterface", "_flagInterface", "_questionInterface", "_currentImage", "_message", "_tileSize",
+                 "_hinted")
     singleMouseSignal = pyqtSignal(int, int, str)
     multiHoverSignal = pyqtSignal(int, int)
     multiPressedSignal = pyqtSignal(int, int)
 
-    # The node for displaying function only
+    # The node for displaying function only. Every image is an asset key of PixmapCache
     # _imageInterface[0]: Starting Block when Playing, _imageInterface[1]: Value Block when Opened,
     # _bombInterface[0]: Bomb Node for Displaying, _bombInterface[1]: Bomb Exploded when Clicked,
     # _flagInterface[0]: Flag Node when Assigning, _flagInterface[1]: Flag Node if Defused,
@@ -145,29 +229,23 @@ class InterfaceNode(QLabel):
 
         self.y: int = y
         self.x: int = x
-        self._value: int = value
         self._interfaceStatus: int = 0
-        self._isMine: bool = True if CONFIG["Bomb Notation"] == self._value else False
         self._scalingSize: Tuple[float, float] = scalingFactor
 
         # [2]: Attribute Creation (by Image)
-        # _imageSize: The size of nodes in UI, _imageInterface: The image path of 'number' block,
-        # _bombInterface: The image path of 'bomb' block, _flagInterface: The image path of 'flag' block
-        # _questionInterface: The image path of 'question' block
+        # _imageSize: The size of nodes in UI, _imageInterface: The asset key of 'number' block,
+        # _bombInterface: The asset key of 'bomb' block, _flagInterface: The asset key of 'flag' block
+        # _questionInterface: The asset key of 'question' block, _tileSize: The (width, height) of the node
         self._imageSize: List[int] = list(getBombNumberImage(key=-1))
-        if self._value in range(0, 9):
-            self._imageInterface: Tuple[str, str] = (getBombNumberImage(key=None), getBombNumberImage(key=self._value))
-        elif self._isMine is True:
-            # Adaptation Purpose Only
-            self._imageInterface: Tuple[str, str] = (getBombNumberImage(key=None), getBombImage(key="Excited"))
-        else:
-            print(f"False Nodes: y:{self.y} - x:{self.x} ---> Value: {self._value}; isBomb: {self._isMine}")
-            raise ValueError("There is no compatible function for notation")
-        self._bombInterface: Tuple[str, str] = (getBombImage(key="Initial"), getBombImage(key="Excited"))
-        self._flagInterface: Tuple[str, str] = (getFlagImage(key="Initial"), getFlagImage(key="Excited"))
-        self._questionInterface: str = getQuestionImage(get_size=False)
-
-        self._currentImage: str = ""
+        self._tileSize: Tuple[int, int] = (int(self._imageSize[1] * self._scalingSize[1]),
+                                           int(self._imageSize[0] * self._scalingSize[0]))
+        self.setValue(value)
+        self._bombInterface: Tuple[Tuple, Tuple] = (("Bomb", "Initial"), ("Bomb", "Excited"))
+        self._flagInterface: Tuple[Tuple, Tuple] = (("Flag", "Initial"), ("Flag", "Excited"))
+        self._questionInterface: Tuple = ("Question", None)
+
+        self._currentImage: Tuple = self._imageInterface[0]
+        self._hinted: bool = False  # Highlighted by a hint until the next move (see self.hint())
         self._message: Dict[int, str] = {Qt.LeftButton: "LeftMouse", Qt.RightButton: "RightMouse",
                                          Qt.MidButton: "LeftMouse", Qt.MiddleButton: "LeftMouse"}
 
@@ -188,13 +266,12 @@ class InterfaceNode(QLabel):
     # [0]: Building Function
     def _initializeImage(self) -> None:
         self._currentImage = self._imageInterface[0]
-        self.setPixmap(QPixmap(self._currentImage))
+        self.setPixmap(PixmapCache.get(key=self._currentImage, size=self._tileSize))
         self._resetImageSize()
 
     def _resetImageSize(self) -> None:
         x_sep, y_sep = number_displayer["Separation"]
-        size: Tuple[int, int] = (int(self._imageSize[1] * self._scalingSize[1]),  # x-axis
-                                 int(self._imageSize[0] * self._scalingSize[0]))  # y-axis
+        size: Tuple[int, int] = self._tileSize  # (x-axis, y-axis)
         pos: List[int] = \
             [number_displayer["Initial"][1] + int(self.x * (size[0] + x_sep)),  # x-axis
              number_displayer["Initial"][0] + int(self.y * (size[1] + y_sep))]  # y-axis
@@ -218,6 +295,7 @@ class InterfaceNode(QLabel):
 
     def click(self) -> None:
         # Attached Function used to update game play
+        self._hinted = False
         if self._interfaceStatus == 1:
             self._currentImage = self._imageInterface[1]  # Representing Number
         else:
@@ -261,11 +339,17 @@ class InterfaceNode(QLabel):
     # ----------------------------------------------------------------------------------------------------------
     # [1]: Interface Function
     def hover(self) -> None:
-        self.setPixmap(QPixmap(getBombNumberImage(key="NULL")))
+        self.setPixmap(PixmapCache.get(key=("Number", "NULL"), size=self._tileSize))
         self.update()
 
+    def hint(self) -> None:
+        # Highlight the node given by a hint, distinct from hovering. Cleared by self.click()
+        self._hinted = True
+        self.press()
+
     def press(self) -> None:
-        self.setPixmap(QPixmap(self._currentImage))
+        key: Tuple = ("Hint", None) if self._hinted is True and self._interfaceStatus == 0 else self._currentImage
+        self.setPixmap(PixmapCache.get(key=key, size=self._tileSize))
         self.update()
 
     def mousePressEvent(self, e: QMouseEvent):
@@ -314,6 +398,19 @@ class InterfaceNode(QLabel):
     def getValue(self) -> int:
         return self._value
 
+    def setValue(self, value: int) -> None:
+        # The value of the core node. Set again when the bombs are placed at the first left click (deferred build)
+        self._value: int = value
+        self._isMine: bool = True if CONFIG["Bomb Notation"] == self._value else False
+        if self._value in range(0, 9):
+            self._imageInterface: Tuple[Tuple, Tuple] = (("Number", None), ("Number", self._value))
+        elif self._isMine is True:
+            # Adaptation Purpose Only
+            self._imageInterface: Tuple[Tuple, Tuple] = (("Number", None), ("Bomb", "Excited"))
+        else:
+            print(f"False Nodes: y:{self.y} - x:{self.x} ---> Value: {self._value}; isBomb: {self._isMine}")
+            raise ValueError("There is no compatible function for notation")
+
     def checkIfMine(self) -> bool:
         return self._value == CONFIG["Bomb Notation"]
 
@@ -324,6 +421,8 @@ class InterfaceNode(QLabel):
         if isinstance(scalingSize, (float, int)):
             scalingSize: Tuple[float, float] = (scalingSize, scalingSize)
             self._scalingSize = scalingSize
+            self._tileSize = (int(self._imageSize[1] * self._scalingSize[1]),
+                              int(self._imageSize[0] * self._scalingSize[0]))
 
     def updateStatus(self, interfaceStatus: int):
         if interfaceStatus in (0, 1, CONFIG["Flag Notation"], CONFIG["Question Notation"]):
@@ -332,6 +431,262 @@ class InterfaceNode(QLabel):
             print("No update has been applied")
 
 
+class BoardWidget(QWidget):
+    """
+    Single widget used to display the whole board instead of one InterfaceNode per node. The board is painted in
+    self.paintEvent() from the interface matrix of the core and the tiles of PixmapCache, and the mouse position is
+    mapped to (y, x) arithmetically. It emits the same signals as InterfaceNode.
+    """
+    singleMouseSignal = pyqtSignal(int, int, str)
+    multiHoverSignal = pyqtSignal(int, int)
+    multiPressedSignal = pyqtSignal(int, int)
+
+    def __init__(self, game: minesweeper, tileSize: Tuple[int, int], separation: Tuple[int, int],
+                 singleSlot: Callable = None, multiHoverSlot: Callable = None, multiPressedSlot: Callable = None,
+                 *args, **kwargs):
+        super(BoardWidget, self).__init__(*args, **kwargs)
+
+        # [1]: Attribute Match-up
+        self._game: minesweeper = game
+        # Read-only view: the bombs placed later by a deferred build are written in place, so it is never stale
+        self._coreMatrix: np.ndarray = game.getCoreView()
+        self._tileSize: Tuple[int, int] = (int(tileSize[0]), int(tileSize[1]))  # (x-axis, y-axis)
+        self._separation: Tuple[int, int] = (int(separation[0]), int(separation[1]))  # (x-axis, y-axis)
+
+        self._revealStatus: bool = False  # Whether the board is displayed as revealed (end of the game)
+        self._hoveringNodes: Set[Tuple[int, int]] = set()  # Nodes highlighted by multi-hovering
+        self._hintNodes: Set[Tuple[int, int]] = set()  # Nodes highlighted by a hint until the next move
+        self._currentNode: Optional[Tuple[int, int]] = None  # Node under the mouse
+        self._pressedNode: Optional[Tuple[int, int]] = None  # Node receiving the mouse press
+        self._message: Dict[int, str] = {Qt.LeftButton: "LeftMouse", Qt.RightButton: "RightMouse",
+                                         Qt.MidButton: "LeftMouse", Qt.MiddleButton: "LeftMouse"}
+        self._multiClick: bool = False
+
+        # [2]: Building Function when instantiated
+        if singleSlot is not None:
+            self.singleMouseSignal.connect(singleSlot)
+        if multiHoverSlot is not None:
+            self.multiHoverSignal.connect(multiHoverSlot)
+        if multiPressedSlot is not None:
+            self.multiPressedSignal.connect(multiPressedSlot)
+
+        self._build()
+
+    # ----------------------------------------------------------------------------------------------------------
+    # [0]: Building Function
+    def _build(self) -> None:
+        self.setMouseTracking(True)
+        self.setUpdatesEnabled(True)
+        self.setEnabled(True)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, False)
+        self.setFixedSize(*self.getBoardSize())
+        PixmapCache.warmUp(size=self._tileSize)
+        self.hide()
+
+    def getBoardSize(self) -> Tuple[int, int]:
+        max_y, max_x = self._game.getNumberOfNodesByAxis()
+        return max_x * (self._tileSize[0] + self._separation[0]), max_y * (self._tileSize[1] + self._separation[1])
+
+    def getTileSize(self) -> Tuple[int, int]:
+        return self._tileSize
+
+    def setTileSize(self, tileSize: Tuple[int, int], separation: Tuple[int, int]) -> None:
+        # Used when zooming: The tiles of the new size are scaled once by PixmapCache
+        self._tileSize = (int(tileSize[0]), int(tileSize[1]))
+        self._separation = (int(separation[0]), int(separation[1]))
+        PixmapCache.warmUp(size=self._tileSize)
+        self.setFixedSize(*self.getBoardSize())
+        self.update()
+
+    # ----------------------------------------------------------------------------------------------------------
+    # [1]: Mapping Function
+    def nodeAt(self, px: int, py: int) -> Optional[Tuple[int, int]]:
+        # Map a position of the widget to (y, x). Return None in the separation between nodes or outside the board
+        pitch_x, pitch_y = self._tileSize[0] + self._separation[0], self._tileSize[1] + self._separation[1]
+        x, offset_x = divmod(int(px), pitch_x)
+        y, offset_y = divmod(int(py), pitch_y)
+        max_y, max_x = self._game.getNumberOfNodesByAxis()
+        if not (0 <= y < max_y and 0 <= x < max_x) or offset_x >= self._tileSize[0] or offset_y >= self._tileSize[1]:
+            return None
+        return y, x
+
+    def nodeRect(self, y: int, x: int) -> QRect:
+        pitch_x, pitch_y = self._tileSize[0] + self._separation[0], self._tileSize[1] + self._separation[1]
+        return QRect(x * pitch_x, y * pitch_y, self._tileSize[0], self._tileSize[1])
+
+    def _tileKey(self, y: int, x: int) -> Tuple:
+        # Equivalent to the image chosen by InterfaceNode.click() and InterfaceNode.reveal()
+        status: int = int(self._game.interface_matrix[y, x])
+        value: int = int(self._coreMatrix[y, x])
+        isMine: bool = value == CONFIG["Bomb Notation"]
+
+        if self._revealStatus is True and status != CONFIG["Question Notation"]:
+            if isMine is False:
+                return ("Flag", "Initial") if status == CONFIG["Flag Notation"] else ("Number", value)
+            if status == CONFIG["Flag Notation"]:
+                return "Flag", "Excited"
+            return ("Bomb", "Excited") if status == 1 else ("Bomb", "Initial")
+
+        if self._revealStatus is False and status != 1 and \
+                ((y, x) in self._hoveringNodes or (y, x) == self._currentNode):
+            return "Number", "NULL"
+        if self._revealStatus is False and status == 0 and (y, x) in self._hintNodes:
+            return "Hint", None
+
+        if status == 1:
+            return ("Bomb", "Excited") if isMine is True else ("Number", value)
+        elif status == CONFIG["Flag Notation"]:
+            return "Flag", "Initial"
+        elif status == CONFIG["Question Notation"]:
+            return "Question", None
+        return "Number", None
+
+    # ----------------------------------------------------------------------------------------------------------
+    # [2]: Interface Function
+    def paintEvent(self, a0: QPaintEvent) -> None:
+        # Only the nodes intersecting the exposed region are painted
+        rect: QRect = a0.rect()
+        pitch_x, pitch_y = self._tileSize[0] + self._separation[0], self._tileSize[1] + self._separation[1]
+        max_y, max_x = self._game.getNumberOfNodesByAxis()
+        x_start, x_end = max(rect.left() // pitch_x, 0), min(rect.right() // pitch_x + 1, max_x)
+        y_start, y_end = max(rect.top() // pitch_y, 0), min(rect.bottom() // pitch_y + 1, max_y)
+
+        painter: QPainter = QPainter(self)
+        for y in range(y_start, y_end):
+            for x in range(x_start, x_end):
+                painter.drawPixmap(x * pitch_x, y * pitch_y, PixmapCache.get(key=self._tileKey(y=y, x=x),
+                                                                             size=self._tileSize))
+        painter.end()
+
+    def _updateArea(self, y: np.ndarray, x: np.ndarray) -> None:
+        # One repaint request for the bounding box of the nodes, whatever their number: Qt clips it to the visible
+        # region and self.paintEvent() only paints the exposed nodes, so the cost follows the screen area
+        if y.shape[0] == 0:
+            return None
+        top_left: QRect = self.nodeRect(y=int(y.min()), x=int(x.min()))
+        self.update(top_left.united(self.nodeRect(y=int(y.max()), x=int(x.max()))))
+
+    def _updateNodes(self, nodes: Iterable[Tuple[int, int]]) -> None:
+        position: np.ndarray = np.array(list(nodes), dtype=np.int64).reshape(-1, 2)
+        self._updateArea(y=position[:, 0], x=position[:, 1])
+
+    def refreshNodes(self, changes: np.ndarray) -> None:
+        # Repaint the nodes changed by the latest move (graph index) and clear the multi-hovering & hint highlights
+        y, x = np.divmod(np.asarray(changes, dtype=np.int64), self._game.getNumberOfNodesInHorizontalAxis())
+        self._updateArea(y=y, x=x)
+        self.clearHovering()
+        self.clearHints()
+
+    def hoverNodes(self, nodes: List[Tuple[int, int]]) -> None:
+        self._hoveringNodes.update(nodes)
+        self._updateNodes(nodes=nodes)
+
+    def clearHovering(self) -> None:
+        self._updateNodes(nodes=self._hoveringNodes)
+        self._hoveringNodes.clear()
+
+    def hintNodes(self, nodes: List[Tuple[int, int]]) -> None:
+        self._hintNodes.update(nodes)
+        self._updateNodes(nodes=nodes)
+
+    def clearHints(self) -> None:
+        self._updateNodes(nodes=self._hintNodes)
+        self._hintNodes.clear()
+
+    def reveal(self) -> None:
+        self._revealStatus = True
+        self._hoveringNodes.clear()
+        self._hintNodes.clear()
+        self.update()
+
+    def _setCurrentNode(self, node: Optional[Tuple[int, int]]) -> None:
+        if node != self._currentNode:
+            if self._currentNode is not None:
+                self.update(self.nodeRect(*self._currentNode))
+            self._currentNode = node
+            if node is not None:
+                self.update(self.nodeRect(*node))
+
+    def mouseMoveEvent(self, a0: QMouseEvent) -> None:
+        self._setCurrentNode(node=self.nodeAt(a0.x(), a0.y()) if self._pressedNode is None else self._pressedNode)
+
+    def leaveEvent(self, a0: QEvent) -> None:
+        self._setCurrentNode(node=None)
+
+    def mousePressEvent(self, e: QMouseEvent):
+        self._pressedNode = self.nodeAt(e.x(), e.y())
+        if self._pressedNode is None:
+            return None
+
+        y, x = self._pressedNode
+        if e.buttons() == Qt.LeftButton | Qt.RightButton and self._game.interface_matrix[y, x] == 1:
+            self._multiClick = True
+            self.multiHoverSignal.emit(y, x)
+
+    def mouseReleaseEvent(self, e: QMouseEvent):
+        node, self._pressedNode = self._pressedNode, None
+        if node is not None:
+            y, x = node
+            if self._multiClick is True and self._game.interface_matrix[y, x] == 1:
+                self.multiPressedSignal.emit(y, x)
+            else:
+                button = Qt.LeftButton if e.button() not in self._message.keys() else e.button()
+                self.singleMouseSignal.emit(y, x, self._message[button])
+            self.update(self.nodeRect(y=y, x=x))
+        self._multiClick = False
+
+
+class BoardView(QScrollArea):
+    """
+    Scrollable & zoomable viewport of a BoardWidget, used when the board is larger than the window.
+    Only the nodes inside the visible viewport are painted (BoardWidget.paintEvent() is clipped to the exposed
+    region), so the render cost scales with the screen area instead of the board area.
+    Zoom: Ctrl + Mouse Wheel, anchored at the node under the mouse.
+    """
+    def __init__(self, board: BoardWidget, minimumTileSize: int, maximumTileSize: int, *args, **kwargs):
+        super(BoardView, self).__init__(*args, **kwargs)
+        self._board: BoardWidget = board
+        self._minimumTileSize: int = minimumTileSize
+        self._maximumTileSize: int = maximumTileSize
+
+        self.setWidget(board)
+        self.setWidgetResizable(False)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setStyleSheet("QScrollArea {border-style: outset; background: transparent}")
+        self.viewport().setStyleSheet("background: transparent")
+        board.show()
+        self.hide()
+
+    def getBoard(self) -> BoardWidget:
+        return self._board
+
+    def zoom(self, step: int, anchor: Optional[QPoint] = None) -> None:
+        # step > 0: Zoom in, step < 0: Zoom out. anchor: Position in the viewport that should stay on the same node
+        old_size: int = self._board.getTileSize()[0]
+        new_size: int = max(self._minimumTileSize, min(self._maximumTileSize, old_size + step))
+        if new_size == old_size:
+            return None
+
+        anchor: QPoint = anchor if anchor is not None else QPoint(self.viewport().width() // 2,
+                                                                  self.viewport().height() // 2)
+        ratio: float = new_size / old_size
+        x_position: float = (self.horizontalScrollBar().value() + anchor.x()) * ratio - anchor.x()
+        y_position: float = (self.verticalScrollBar().value() + anchor.y()) * ratio - anchor.y()
+
+        self._board.setTileSize(tileSize=(new_size, new_size), separation=(new_size // 4, new_size // 4))
+        self.horizontalScrollBar().setValue(int(x_position))
+        self.verticalScrollBar().setValue(int(y_position))
+
+    def wheelEvent(self, a0: QWheelEvent) -> None:
+        if a0.modifiers() & Qt.ControlModifier:
+            step: int = 1 if a0.angleDelta().y() > 0 else -1
+            self.zoom(step=step * max(1, self._board.getTileSize()[0] // 8), anchor=a0.pos())
+            a0.accept()
+            return None
+        super(BoardView, self).wheelEvent(a0)
+
+
 class DeclaringWidget(QWidget):
     # In this task, we want to make a dialog to communicate with user about the gaming mode they want to play.
     # In fact, we don't worry about the memory as it would be deleted after its complete its job
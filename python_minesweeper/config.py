@@ -150,8 +150,19 @@ UPDATING_TIMING: int = 1000
 VIEWING_TIME_FOR_TRANSFER: int = 1500
 NODES_SIZE: Tuple[int, int] = getBombNumberImage(key=-1)
 TABLE_VIEW: Tuple[int, int] = (500, 400)
-TABLE_MAX_DISPLAY: int = 20
+TABLE_MAX_DISPLAY: int = 100  # Rows read per fetch of the ranking table (more are read while scrolling)
+MINIMUM_NODES_SIZE: int = 24  # Under this size, the board is scrolled (and zoomed) instead of shrunk
+MINIMUM_ZOOM_SIZE: int = 8  # The smallest size of the nodes when zooming out the scrollable board
+SINGLE_WIDGET_BOARD: int = 2500  # Above this number of nodes, the board is painted by one widget (BoardWidget)
 BOARD_LENGTH: int = 45
+SCORE_DIRECTORY: str = DIRECTORY + "/resources/score"  # CSV files of the previous versions, imported once
+SCORE_DATABASE: str = SCORE_DIRECTORY + "/scores.sqlite3"
+LEADERBOARD_PATH: str = SCORE_DIRECTORY + "/leaderboard.json"
+LEADERBOARD_SIZE: int = 100  # Number of the fastest winning games kept per difficulty
+HINT_BUDGET: float = 0.1  # Seconds spent estimating the bomb probabilities for a hint when no node is proven safe
+HINT_COLOR: Tuple[int, int, int, int] = (46, 204, 113, 130)  # RGBA painted over the hidden block of the hinted nodes
+GENERATION_MODE: str = "classic"  # Board generation of the game window, see core_config.GENERATION_MODES
+BOARD_POOL_SIZE: int = 2  # Boards of the last used setting generated in advance while the menus are shown
 
 BOMB_NUMBER_DISPLAY: Dict[str, List[int]] = \
     {
@@ -159,44 +170,9 @@ BOMB_NUMBER_DISPLAY: Dict[str, List[int]] = \
         "Separation": [int(NODES_SIZE[0] // 4), int(NODES_SIZE[1] // 4)]
     }
 
-# "MOUSE_MESSAGE": Used to emit a signal when clicking mouse
-MOUSE_MESSAGE: Dict[Union[int, str], Union[int, str]] = \
-    {
-        "LeftMouse": "L",
-        "RightMouse": "R",
-    }
 # -----------------------------------------------------------------------------------------------------------
-# CORE.py
-# "CORE_CONFIGURATION": Dictionary about specific notation in core.py
-CORE_CONFIGURATION: Dict[str, Union[int, float]] = \
-    {
-        "Bomb Notation": -20,
-        "Flag Notation": -1,
-        "Question Notation": -5,
-        "Default Size": 15,
-        "Maximum Stack": 48,
-        "Clean Time": 8,
-    }
-
-__EASY: Tuple[float, float] = (0.125, 1.75)
-__MEDIUM: Tuple[float, float] = (0.15, 1.8)
-__HARD: Tuple[float, float] = (0.2, 1.8)
-__EXTREME: Tuple[float, float] = (0.25, 1.875)
-
-DIFFICULTY: Dict[str, Tuple] = \
-    {
-        "Easy": __EASY,
-        "Medium": __MEDIUM,
-        "Hard": __HARD,
-        "Extreme": __EXTREME,
-    }
-
-
-def difficulty_validation(key: str) -> Tuple[int, int]:
-    if key in DIFFICULTY.keys():
-        return DIFFICULTY[key]
-    print("key ({}) is in-valid. Only accept key = {} only".format(key, list(DIFFICULTY.keys())))
-    raise ValueError("key ({}) is in-valid. Only accept key = {} only".format(key, list(DIFFICULTY.keys())))
+# CORE.py: The core configuration lives in core_config.py so that the core can run without the interface
+from core_config import CORE_CONFIGURATION, MOUSE_MESSAGE, DIFFICULTY, difficulty_validation
 
 
 # [4]: Extra Function
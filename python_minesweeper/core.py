@@ -1,9 +1,18 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from time import perf_counter
 from typing import Tuple, Union, List, Optional, Dict
 from sys import maxsize
 from logging import warning
-from config import CORE_CONFIGURATION as CONFIG, MOUSE_MESSAGE, DIFFICULTY, difficulty_validation
-import gc
+from core_config import CORE_CONFIGURATION as CONFIG, MOUSE_MESSAGE, GENERATION_MODES, getBombNumber, \
+    difficulty_validation
+from neighbor import NeighborTable, getNeighborTable
+from history import ChangeSet, HistoryEntry, HistoryStack
+from board_id import decodeBoardID, encodeBoardID, newSeed, validateSeed
+
+
+NO_CHANGES: np.ndarray = np.empty(shape=0, dtype=np.int32)
+NO_CHANGES.flags.writeable = False
 
 
 class minesweeper:
@@ -12,12 +21,26 @@ class minesweeper:
     + self.size: The shape of the self.__coreMatrix
     + self.__coreMatrix: The main matrix used to defined everything needed. Once assigned, unchanged attribute
     + self.interface_matrix: The matrix that user can see on the screen. Attached to the interface
+    + self._seed: The seed of the bomb positions. The board ID (size, difficulty, seed) regenerates the board
+    + self.generation: When & how the bombs are placed (see GENERATION_MODES)
     """
     def __init__(self, size: Union[int, Tuple[int, int]] = 16, difficulty: str = "Medium", verbose: bool = False,
-                 support_big_data: bool = False):
+                 seed: Optional[int] = None, boardID: Optional[str] = None, generation: Optional[str] = None):
         # [0]: Hyper-parameter Verification
         np.set_printoptions(threshold=maxsize)
         if True:
+            safeNode: Optional[Tuple[int, int]] = None
+            if boardID is not None:  # The board ID overrides the size, the difficulty and the seed
+                size, difficulty, seed, safeNode = decodeBoardID(boardID)
+
+            generation: str = generation if generation is not None else CONFIG["Generation Mode"]
+            if generation not in GENERATION_MODES:
+                raise ValueError("generation ({}) is in-valid. Only accept generation = {} only"
+                                 .format(generation, GENERATION_MODES))
+
+            if not isinstance(CONFIG["No Guess Budget"], (int, float)) or CONFIG["No Guess Budget"] <= 0:
+                raise ValueError("No Guess Budget ({}) should be positive".format(CONFIG["No Guess Budget"]))
+
             if size is None:
                 size: Tuple[int, int] = (CONFIG["Default Size"], CONFIG["Default Size"])
             elif not isinstance(size, (int, Tuple)):
@@ -38,11 +61,12 @@ class minesweeper:
             if not isinstance(verbose, bool):
                 raise ValueError(" False Initialization. verbose should be boolean")
 
-            if not isinstance(CONFIG["Maximum Stack"], int):
-                raise ValueError("Maximum Stack ({}) should be non-negative integer".format(CONFIG["Maximum Stack"]))
+            if not isinstance(CONFIG["History Memory"], int) or CONFIG["History Memory"] <= 0:
+                raise ValueError("History Memory ({}) should be positive integer".format(CONFIG["History Memory"]))
 
-            if CONFIG["Maximum Stack"] <= 0:
-                raise ValueError("Maximum Stack ({}) should be non-negative integer".format(CONFIG["Maximum Stack"]))
+            if not isinstance(CONFIG["Checkpoint Interval"], int) or CONFIG["Checkpoint Interval"] <= 0:
+                raise ValueError("Checkpoint Interval ({}) should be positive integer"
+                                 .format(CONFIG["Checkpoint Interval"]))
 
             if CONFIG["Bomb Notation"] in range(0, 9):
                 raise ValueError("CONFIG[Bomb Notation] should not in the range of [0, 8]")
@@ -64,17 +88,17 @@ class minesweeper:
         self.__coreMatrix: np.ndarray = np.zeros(shape=size, dtype=np.int8)
         self.size: Tuple[int, int] = size
         self.__bombPosition: List[Tuple[int, int]] = []
-        self._bombNumber: int = int(DIFFICULTY[difficulty][0] * (self.size[0] / 2 + self.size[1] / 2) **
-                                    DIFFICULTY[difficulty][1])
-        self._remainingFlags: int = self._bombNumber
-        self._accomplishedNode: int = 0
+        self._bombNumber: int = getBombNumber(size=self.size, difficulty=difficulty)
 
         # [2]: Set Configuration
         self.interface_matrix: np.ndarray = np.zeros(shape=self.size, dtype=np.int8)
-        self.adjacencyMatrixFour: np.ndarray = \
-            np.zeros(shape=(self.size[0] * self.size[1], self.size[0] * self.size[1]), dtype=np.uint8)
-        self.adjacencyMatrixEight: np.ndarray = \
-            np.zeros(shape=(self.size[0] * self.size[1], self.size[0] * self.size[1]), dtype=np.uint8)
+        # Counters of the interface matrix, updated by every write of the interface matrix (see self._countNode())
+        self._openedNodes: int = 0  # Nodes = 1 (including an opened bomb)
+        self._revealedSafeNodes: int = 0  # Nodes = 1 which are not a bomb
+        self._flagNodes: int = 0
+        self._correctFlags: int = 0  # Flags placed on a bomb
+        self._questionNodes: int = 0
+        self.neighborTable: Optional[NeighborTable] = None  # Shared (N, 8) neighbor index, see neighbor.py
         self.adjacencyMatrixStatus: bool = False
 
         self.BombNotation: int = CONFIG["Bomb Notation"]
@@ -82,10 +106,17 @@ class minesweeper:
         self.QuestionNotation: int = CONFIG["Question Notation"]
         self.difficulty: str = difficulty
 
+        # Pre-computed regions opened by clicking on an empty node: (label, offsets, nodes), see self.buildZeroRegions()
+        self._zeroRegions: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        # Deferred build: (order, count) computed before the first left click, see self._prepareDeferredBuild()
+        self._deferredField: Optional[Tuple[np.ndarray, Optional[np.ndarray]]] = None
+
         # [3]: Set Undo & Redo Features
-        self._maxStackSizeForUndoRedo = CONFIG["Maximum Stack"]
-        self.__undoStack: List[np.ndarray] = []
-        self.__redoStack: List[np.ndarray] = []
+        # Only the changed nodes of each move are saved (see history.py), bounded by CONFIG["History Memory"] bytes
+        self.__history: HistoryStack = HistoryStack(maxBytes=CONFIG["History Memory"],
+                                                    checkpointInterval=CONFIG["Checkpoint Interval"])
+        self._pendingChanges: Optional[ChangeSet] = None  # The record of the move being played
+        self._lastChanges: np.ndarray = NO_CHANGES  # Graph index of the nodes changed by the latest move
 
         # [4]: Gaming Status
         self.verbose: bool = verbose
@@ -93,18 +124,18 @@ class minesweeper:
         self.PlayingStatus: bool = True
 
         # [5]: Randomized Function & Extra Attribute
-        self.randomMaxSize: int = int(3e6) if support_big_data is False else int(1e5)
-        self.randomCounter: int = 0
-        self._random_positions: np.ndarray = self.resetRandom()
-
-        self._location: Dict[int, Tuple[int, int]] = {i: self._convertGraphToMatrixWithMath(i)
-                                                      for i in range(0, self.getNumberOfNodes())}
-        self._reversedLocation: Dict[Tuple[int, int], int] = {value: key for key, value in self.getLocation().items()}
+        # The seed of the board: the bomb positions are sampled from np.random.default_rng(seed) (see getBoardID())
+        self._seed: int = validateSeed(seed) if seed is not None else newSeed()
+        self.generation: str = generation
+        self._safeNode: Optional[Tuple[int, int]] = safeNode  # No bomb in its 3x3 area (the first left click)
+        self._pendingBuild: bool = False  # The bombs are waiting for the first left click (see self.placeBombs())
+        self._generationStatistics: Dict[str, Union[int, float, bool]] = {}
 
         # [6]: Running Function
         self.build()
         self.buildAdjacencyMatrix()
-        self.displayInformation()
+        if self.verbose is True:
+            self.displayInformation()
 
     # ----------------------------------------------------------------------------------------------------------------
     # [0]: Core Functions for Task Handling
@@ -147,7 +178,7 @@ class minesweeper:
         elif not 0 <= x < self.size[1]:
             raise TypeError("Hyper-parameter is overwhelming (x={} != [0, {}))".format(x, self.size[1]))
 
-        return int(y * self.size[0] + x)
+        return int(y * self.size[1] + x)
 
     def _convertGraphToMatrixWithMath(self, graph_index: int) -> Tuple[int, int]:
         if not isinstance(graph_index, (int, np.integer)):
@@ -159,40 +190,21 @@ class minesweeper:
 
         return int(graph_index // self.size[1]), int(graph_index % self.size[1])
 
-    def _convertMatrixToGraphWithCache(self, y: int, x: int) -> int:
-        if not isinstance(y, (int, np.integer)):
-            raise TypeError("Hyper-parameter only accepts positive integer value only (y={y})")
-        elif not 0 <= y < self.size[0]:
-            raise TypeError("Hyper-parameter is overwhelming (y={} != [0, {}))".format(y, self.size[0]))
-
-        if not isinstance(x, (int, np.integer)):
-            raise TypeError("Hyper-parameter only accepts positive integer value only (x={x})")
-        elif not 0 <= x < self.size[1]:
-            raise TypeError("Hyper-parameter is overwhelming (x={} != [0, {}))".format(x, self.size[1]))
+    def convertMatrixToGraph(self, y: Union[np.ndarray, List[int]], x: Union[np.ndarray, List[int]]) -> np.ndarray:
+        # Vectorized (y, x) --> graph index of many nodes in one call. Out-of-board positions raise ValueError
+        return np.ravel_multi_index((np.asarray(y), np.asarray(x)), dims=tuple(self.size))
 
-        return self.getReverseLocation()[(y, x)]
-
-    def _convertGraphToMatrixWithCache(self, graph_index: int) -> Tuple[int, int]:
-        if not isinstance(graph_index, (int, np.integer)):
-            raise TypeError("Hyper-parameter only accepts positive integer value only (index={index})")
-
-        if not (0 <= graph_index < self.getNumberOfNodes()):
-            raise TypeError("Hyper-parameter is overwhelming (index={} != [0, {}))"
-                            .format(graph_index, self.getNumberOfNodes()))
-
-        return self.getLocation()[graph_index]
+    def convertGraphToMatrix(self, graph_index: Union[np.ndarray, List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        # Vectorized graph index --> (y, x) of many nodes in one call. Out-of-board indices raise ValueError
+        return np.unravel_index(np.asarray(graph_index), shape=tuple(self.size))
 
     def _updateBombPosition(self, y: int, x: int) -> None:
         self.__bombPosition.append((y, x))
 
-    def resetRandom(self) -> np.ndarray:
-        data = np.uint16 if self.getNumberOfNodes() > np.iinfo(np.uint8).max else np.uint8
-        return np.random.randint(0, self.getNumberOfNodes(), self.randomMaxSize, dtype=data)
-
     # ----------------------------------------------------------------------------------------------------------------
     # [0.2]: For Interface Matrix
     def _openNodeAtInterfaceMatrixByGraph(self, graph_index: int) -> bool:
-        y, x = self._location[graph_index]
+        y, x = divmod(int(graph_index), self.size[1])
         return self._openNodeAtInterfaceMatrixByMatrix(y=y, x=x)
 
     def _openNodeAtInterfaceMatrixByMatrix(self, y: int, x: int) -> bool:
@@ -203,16 +215,55 @@ class minesweeper:
         warning("No update has been found")
         return False
 
+    def _countNode(self, index: int, before: int, after: int) -> None:
+        # Update the counters of the interface matrix when the node (index) changes from (before) to (after): O(1)
+        bomb: bool = self.__coreMatrix.item(index) == self.BombNotation
+        for value, sign in ((before, -1), (after, 1)):
+            if value == 1:
+                self._openedNodes += sign
+                self._revealedSafeNodes += 0 if bomb else sign
+            elif value == self.FlagNotation:
+                self._flagNodes += sign
+                self._correctFlags += sign if bomb else 0
+            elif value == self.QuestionNotation:
+                self._questionNodes += sign
+
+    def _countNodes(self, indices: np.ndarray, before: np.ndarray, after: np.ndarray) -> None:
+        # Vectorized self._countNode() over a group of changed nodes: O(changed nodes)
+        bomb: np.ndarray = self.__coreMatrix.ravel()[indices] == self.BombNotation
+        for value, sign in ((before, -1), (after, 1)):
+            opened: np.ndarray = value == 1
+            flag: np.ndarray = value == self.FlagNotation
+            self._openedNodes += sign * int(np.count_nonzero(opened))
+            self._revealedSafeNodes += sign * int(np.count_nonzero(opened & ~bomb))
+            self._flagNodes += sign * int(np.count_nonzero(flag))
+            self._correctFlags += sign * int(np.count_nonzero(flag & bomb))
+            self._questionNodes += sign * int(np.count_nonzero(value == self.QuestionNotation))
+
     def _setInterfaceNode(self, y: int, x: int, value: int) -> None:
+        index: int = y * self.size[1] + x
+        before: int = int(self.interface_matrix[y, x])
+        if self._pendingChanges is not None:
+            self._pendingChanges.recordNode(index=index, before=before, after=value)
+        self._countNode(index=index, before=before, after=value)
         self.interface_matrix[y, x] = value
 
+    def _openInterfaceNodes(self, graph_index: np.ndarray) -> None:
+        # Open a group of nodes at once by their graph index
+        before: np.ndarray = self.interface_matrix.ravel()[graph_index]
+        changed: np.ndarray = before != 1
+        if self._pendingChanges is not None:
+            self._pendingChanges.record(indices=graph_index[changed], before=before[changed], after=1)
+        self._countNodes(indices=graph_index[changed], before=before[changed], after=np.ones_like(before[changed]))
+        np.put(self.interface_matrix, graph_index, 1)
+
     def _checkInterfaceNode(self, y: int, x: int, value: int) -> bool:
         return True if self.getInterfaceNode(y=y, x=x) == value else False
 
     def _checkInterfaceValidity(self) -> bool:
         max_valid_nodes: int = 0
         for value in (0, 1, self.FlagNotation, self.QuestionNotation):
-            max_valid_nodes += np.argwhere(self.getInterfaceMatrix() not in value).shape[0]
+            max_valid_nodes += np.argwhere(self.getInterfaceView() not in value).shape[0]
         return True if max_valid_nodes == self.getNumberOfNodes() else False
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -223,250 +274,368 @@ class minesweeper:
             print("---------------------------------------------------------------------------------------")
             print("The game core is building the position for the bomb")
 
-        bomb: int = 0
+        # [1]: Sample all bomb positions in one call. Both implementations place the bombs of the same seed
+        bomb_index: np.ndarray = self._sampleBombPositions()
+        if CONFIG["Vectorized Generation"] is True and self._deferredField is not None:
+            core_matrix: np.ndarray = self._patchCountField(bomb_index=bomb_index)
+        elif CONFIG["Vectorized Generation"] is True:
+            core_matrix: np.ndarray = self._buildCountField(bomb_index=bomb_index)
+        else:
+            core_matrix: np.ndarray = self._buildCountFieldLegacy(bomb_index=bomb_index)
+
+        # [2]: Validate the vectorized path against the scalar (legacy) implementation when requested
+        if CONFIG["Cross Check Generation"] is True:
+            legacy_matrix: np.ndarray = self._buildCountFieldLegacy(bomb_index=bomb_index)
+            if not np.array_equal(core_matrix, legacy_matrix):
+                raise RuntimeError("The core: Vectorized count field is not matched with the legacy implementation")
+
+        # In place: the read-only views given before a deferred build (see self.getCoreView()) show the bombs as well
+        np.copyto(self.__coreMatrix, core_matrix)
+        y, x = self.convertGraphToMatrix(bomb_index)
+        self.__bombPosition.extend(zip(y.tolist(), x.tolist()))
+
+    def _sampleBombPositions(self) -> np.ndarray:
+        # Sample self._bombNumber distinct graph indices without replacement from the generator of the seed: the same
+        # (size, difficulty, seed) always gives the same bombs, and the global NumPy random state is never used
+        rng: np.random.Generator = np.random.default_rng(self._seed)
+        if self._safeNode is None:
+            return rng.choice(self.getNumberOfNodes(), size=self._bombNumber, replace=False)
+
+        # No bomb in the safe area: the first self._bombNumber nodes outside of that area of a random order of the
+        # board. The order of a deferred build is drawn before the first left click (see self._prepareDeferredBuild())
+        order: np.ndarray = self._deferredField[0] if self._deferredField is not None else \
+            rng.permutation(self.getNumberOfNodes())
+        area: np.ndarray = self._getSafeArea()
+        head: np.ndarray = order[:self._bombNumber + area.shape[0]]
+        return head[~np.isin(head, area)][:self._bombNumber]
+
+    def _getSafeArea(self) -> np.ndarray:
+        # Graph index of the 3x3 area of the safe node (only the node itself if the board is too small for that)
+        y, x = self._safeNode
+        rows: np.ndarray = np.arange(max(y - 1, 0), min(y + 2, self.size[0]))
+        columns: np.ndarray = np.arange(max(x - 1, 0), min(x + 2, self.size[1]))
+        area: np.ndarray = (rows[:, np.newaxis] * self.size[1] + columns).ravel()
+        if self.getNumberOfNodes() - area.shape[0] < self._bombNumber:
+            return np.array([y * self.size[1] + x])
+        return area
+
+    def _prepareDeferredBuild(self) -> None:
+        # Everything of the deferred build which does not depend on the first left click, e.g. done by the board pool
+        # (board_pool.py): the random order of the nodes, and the bomb count of its first self._bombNumber nodes.
+        # The first left click only moves the (at most 9) bombs of its 3x3 area, see self._patchCountField()
+        order: np.ndarray = np.random.default_rng(self._seed).permutation(self.getNumberOfNodes())
+        count: Optional[np.ndarray] = None
+        if CONFIG["Vectorized Generation"] is True:
+            mask: np.ndarray = np.zeros(shape=self.getNumberOfNodes(), dtype=np.bool_)
+            mask[order[:self._bombNumber]] = True
+            count = self._countBombs(mask=mask.reshape(self.size))
+        self._deferredField = (order, count)
+
+    def _countBombs(self, mask: np.ndarray) -> np.ndarray:
+        # The sum of the 3x3 window centered at every node over the padded bomb mask
+        padded: np.ndarray = np.pad(mask, pad_width=1, mode="constant", constant_values=False).astype(np.int8)
+        return sliding_window_view(padded, window_shape=(3, 3)).sum(axis=(2, 3), dtype=np.int8)
+
+    def _buildCountField(self, bomb_index: np.ndarray) -> np.ndarray:
+        # The count of every node is the sum of the 3x3 window centered at that node over the padded bomb mask
+        mask: np.ndarray = np.zeros(shape=self.getNumberOfNodes(), dtype=np.bool_)
+        mask[bomb_index] = True
+        mask: np.ndarray = mask.reshape(self.size)
+
+        core_matrix: np.ndarray = self._countBombs(mask=mask)
+        core_matrix[mask] = self.BombNotation
+        return core_matrix
+
+    def _patchCountField(self, bomb_index: np.ndarray) -> np.ndarray:
+        # Same result as self._buildCountField() from the count prepared before the first left click: the bombs of the
+        # safe area are removed, and the next nodes of the order are added (bomb_index ends with them)
+        order, count = self._deferredField
+        mask: np.ndarray = np.zeros(shape=self.getNumberOfNodes(), dtype=np.bool_)
+        mask[bomb_index] = True
+        base: np.ndarray = order[:self._bombNumber]
+        removed: np.ndarray = base[~mask[base]]
+        added: np.ndarray = bomb_index[self._bombNumber - removed.shape[0]:]
+
+        core_matrix: np.ndarray = count.copy()
+        for nodes, step in ((removed, -1), (added, 1)):
+            for index in nodes.tolist():
+                y, x = divmod(index, self.size[1])
+                core_matrix[max(y - 1, 0):y + 2, max(x - 1, 0):x + 2] += step
+        core_matrix[mask.reshape(self.size)] = self.BombNotation
+        return core_matrix
+
+    def _buildCountFieldLegacy(self, bomb_index: np.ndarray) -> np.ndarray:
+        # Scalar implementation: increase the count of every non-bomb neighbor when placing a bomb
+        core_matrix: np.ndarray = np.zeros(shape=self.size, dtype=np.int8)
         notation: int = self.BombNotation
         max_y, max_x = self.getNumberOfNodesByAxis()
         visitedNodes: List[bool] = [False] * self.getNumberOfNodes()
 
-        while bomb < self._bombNumber:
-            if visitedNodes[self._random_positions[self.randomCounter]] is True:
-                self.randomCounter += 1
-                if self.randomCounter == self.randomMaxSize:
-                    self.randomCounter: int = 0
-                    self._random_positions: np.ndarray = self.resetRandom()
-                continue
-            else:
-                visitedNodes[self._random_positions[self.randomCounter]] = True
-
-            y, x = self._location[self._random_positions[self.randomCounter]]
-
-            bomb += 1
-            self.__coreMatrix[y, x] = notation
-            self.__bombPosition.append((y, x))
+        for index in bomb_index.tolist():
+            visitedNodes[index] = True
+            y, x = divmod(index, max_x)
+            core_matrix[y, x] = notation
 
             # Check top
             if 0 <= y - 1 < max_y:
-                if visitedNodes[self._reversedLocation[(y - 1, x)]] is False:
-                    self.__coreMatrix[y - 1, x] += 1
+                if visitedNodes[index - max_x] is False:
+                    core_matrix[y - 1, x] += 1
 
                 # Check left
                 if 0 <= x - 1 < max_x:
-                    if visitedNodes[self._reversedLocation[(y - 1, x - 1)]] is False:
-                        self.__coreMatrix[y - 1, x - 1] += 1
+                    if visitedNodes[index - max_x - 1] is False:
+                        core_matrix[y - 1, x - 1] += 1
 
                 # Check right
                 if 0 <= x + 1 < max_x:
-                    if visitedNodes[self._reversedLocation[(y - 1, x + 1)]] is False:
-                        self.__coreMatrix[y - 1, x + 1] += 1
+                    if visitedNodes[index - max_x + 1] is False:
+                        core_matrix[y - 1, x + 1] += 1
 
             if 0 <= x - 1 < max_x:
-                if visitedNodes[self._reversedLocation[(y, x - 1)]] is False:
-                    self.__coreMatrix[y, x - 1] += 1
+                if visitedNodes[index - 1] is False:
+                    core_matrix[y, x - 1] += 1
 
             if 0 <= x + 1 < max_x:
-                if visitedNodes[self._reversedLocation[(y, x + 1)]] is False:
-                    self.__coreMatrix[y, x + 1] += 1
+                if visitedNodes[index + 1] is False:
+                    core_matrix[y, x + 1] += 1
 
             # Check bottom
             if 0 <= y + 1 < max_y:
-                if visitedNodes[self._reversedLocation[(y + 1, x)]] is False:
-                    self.__coreMatrix[y + 1, x] += 1
+                if visitedNodes[index + max_x] is False:
+                    core_matrix[y + 1, x] += 1
 
                 # Check left
                 if 0 <= x - 1 < max_x:
-                    if visitedNodes[self._reversedLocation[(y + 1, x - 1)]] is False:
-                        self.__coreMatrix[y + 1, x - 1] += 1
+                    if visitedNodes[index + max_x - 1] is False:
+                        core_matrix[y + 1, x - 1] += 1
 
                 # Check right
                 if 0 <= x + 1 < max_x:
-                    if visitedNodes[self._reversedLocation[(y + 1, x + 1)]] is False:
-                        self.__coreMatrix[y + 1, x + 1] += 1
+                    if visitedNodes[index + max_x + 1] is False:
+                        core_matrix[y + 1, x + 1] += 1
 
-            self.randomCounter += 1
-            if self.randomCounter == self.randomMaxSize:
-                self.randomCounter: int = 0
-                self._random_positions: np.ndarray = self.resetRandom()
-
-        pass
+        return core_matrix
 
     def buildAdjacencyMatrix(self) -> None:
-        if self.adjacencyMatrixStatus is False:
+        # The dense (N x N) adjacency matrices are replaced by a (N, 8) neighbor table shared by every board of the
+        # same shape. Memory: O(N) instead of O(N^2)
+        if self.adjacencyMatrixStatus is False or self.neighborTable is None or \
+                self.neighborTable.shape != tuple(self.size):
+            self.neighborTable = getNeighborTable(shape=tuple(self.size))
             self.adjacencyMatrixStatus = True
 
-        if self.adjacencyMatrixStatus is True:
-            max_y, max_x = self.getNumberOfNodesInVerticalAxis(), self.getNumberOfNodesInHorizontalAxis()
-            for y, sub_matrix in enumerate(self.__coreMatrix):
-                for x, node in enumerate(sub_matrix):
-                    graph_index = self._reversedLocation[(y, x)]
-
-                    if 0 <= y - 1 < max_y:
-                        if 0 <= x - 1 < max_x:
-                            new = self._reversedLocation[(y - 1, x - 1)]
-                            self.adjacencyMatrixEight[graph_index, new] = 1
-
-                        if 0 <= x + 1 < max_x:
-                            new = self._reversedLocation[(y - 1, x + 1)]
-                            self.adjacencyMatrixEight[graph_index, new] = 1
-
-                        new = self._reversedLocation[(y - 1, x)]
-                        self.adjacencyMatrixFour[graph_index, new] = 1
-                        self.adjacencyMatrixEight[graph_index, new] = 1
-
-                    if 0 <= y + 1 < max_y:
-                        if 0 <= x - 1 < max_x:
-                            new = self._reversedLocation[(y + 1, x - 1)]
-                            self.adjacencyMatrixEight[graph_index, new] = 1
-
-                        if 0 <= x + 1 < max_x:
-                            new = self._reversedLocation[(y + 1, x + 1)]
-                            self.adjacencyMatrixEight[graph_index, new] = 1
-
-                        new = self._reversedLocation[(y + 1, x)]
-                        self.adjacencyMatrixFour[graph_index, new] = 1
-                        self.adjacencyMatrixEight[graph_index, new] = 1
-
-                    if 0 <= x - 1 < max_x:
-                        new = self._reversedLocation[(y, x - 1)]
-                        self.adjacencyMatrixFour[graph_index, new] = 1
-                        self.adjacencyMatrixEight[graph_index, new] = 1
-
-                    if 0 <= x + 1 < max_x:
-                        new = self._reversedLocation[(y, x + 1)]
-                        self.adjacencyMatrixFour[graph_index, new] = 1
-                        self.adjacencyMatrixEight[graph_index, new] = 1
-
         return None
 
+    def buildZeroRegions(self) -> None:
+        # Label the 4-connected components of the empty nodes, then attach the numbered border (4-neighbors) of each
+        # component. The nodes of region r are stored in nodes[offsets[r]:offsets[r + 1]] (CSR layout) so opening a
+        # region costs O(region size). Assigned at once: it can run on a worker thread once the bombs are placed
+        core_matrix: np.ndarray = self.__coreMatrix.ravel()
+        table: NeighborTable = self.getNeighborTable()
+        labels, regions = table.labelComponents(mask=core_matrix == 0, connectivity=4)
+
+        empty_nodes: np.ndarray = np.flatnonzero(labels != -1)
+        source: np.ndarray = np.repeat(empty_nodes, 4)
+        border: np.ndarray = table.table[empty_nodes, :4].ravel()
+        keep: np.ndarray = border != -1
+        source, border = source[keep], border[keep]
+        keep: np.ndarray = core_matrix[border] != 0
+        source, border = source[keep], border[keep]
+
+        # Sort & drop the duplicated keys (a numbered node bordering the same region twice): faster than np.unique()
+        nodes: np.int64 = np.int64(self.getNumberOfNodes())
+        key: np.ndarray = np.sort(np.concatenate((labels[empty_nodes].astype(np.int64) * nodes + empty_nodes,
+                                                  labels[source].astype(np.int64) * nodes + border)))
+        key: np.ndarray = key[np.concatenate(([True], key[1:] != key[:-1]))] if key.shape[0] != 0 else key
+        offsets: np.ndarray = np.zeros(shape=regions + 1, dtype=np.int64)
+        np.cumsum(np.bincount(key // nodes, minlength=regions), out=offsets[1:])
+        self._zeroRegions = (labels, offsets, (key % nodes).astype(np.int32))
+
+    def _searchZeroRegion(self, index: int) -> np.ndarray:
+        # Same region as self.getZeroRegion() without the labels (see self.placeBombs()): breadth-first search of the
+        # empty nodes from the node, one frontier per step. The visited nodes are the empty nodes and their numbered
+        # 4-neighbors (never expanded): exactly the region, as no bomb is next to an empty node
+        core_matrix: np.ndarray = self.__coreMatrix.ravel()
+        table: np.ndarray = self.getNeighborTable().table[:, :4]
+        if core_matrix[index] != 0:
+            return np.zeros(shape=0, dtype=np.int32)
+
+        visited: np.ndarray = np.zeros(shape=self.getNumberOfNodes(), dtype=np.bool_)
+        visited[index] = True
+        owner: np.ndarray = np.empty(shape=self.getNumberOfNodes(), dtype=np.int32)  # De-duplicate the next frontier
+        frontier: np.ndarray = np.array([index], dtype=np.int32)
+        while frontier.shape[0] != 0:
+            neighbors: np.ndarray = table[frontier].ravel()
+            neighbors: np.ndarray = neighbors[neighbors != -1]
+            neighbors: np.ndarray = neighbors[~visited[neighbors]]
+            visited[neighbors] = True
+            neighbors: np.ndarray = neighbors[core_matrix[neighbors] == 0]
+            position: np.ndarray = np.arange(neighbors.shape[0], dtype=np.int32)
+            owner[neighbors] = position
+            frontier = neighbors[owner[neighbors] == position]
+        return np.flatnonzero(visited).astype(np.int32)
+
+    def getZeroRegion(self, y: int, x: int) -> np.ndarray:
+        # Return the graph index of all nodes opened by clicking on the empty node (y, x). Empty if (y, x) is not empty
+        regions: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = self._zeroRegions  # Read once (see above)
+        if regions is None:
+            return self._searchZeroRegion(index=y * self.size[1] + x)
+        labels, offsets, nodes = regions
+        label: int = int(labels[y * self.size[1] + x])
+        if label == -1:
+            return nodes[0:0]
+        return nodes[offsets[label]:offsets[label + 1]]
+
     def build(self) -> None:
+        # Safe & no-guess generation: the bombs are placed by the first left click (see self.placeBombs()). What does
+        # not depend on that click is prepared now
+        self._zeroRegions, self._deferredField = None, None
+        self._pendingBuild = self.generation != "classic" and self._safeNode is None
+        if self._pendingBuild is False:
+            self._buildBombPositions()
+            self.buildZeroRegions()
+        else:
+            self._prepareDeferredBuild()
+
+    def placeBombs(self, y: int, x: int, seed: Optional[int] = None,
+                   statistics: Optional[Dict[str, Union[int, float, bool]]] = None, buildRegions: bool = True) -> None:
+        """
+        Deferred build at the first left click (y, x): no bomb in its 3x3 area. In no-guess generation, the seed is
+        chosen such that the deterministic solver clears the board from (y, x) (see self.searchNoGuessSeed()),
+        unless the seed (and the statistics) of a search done beforehand, e.g. on a worker thread, is provided.
+        With buildRegions=False, the regions of the empty nodes are searched per click until self.buildZeroRegions()
+        is called (e.g. on a worker thread), so that the click only costs O(3x3 area + region size) after the
+        preparation of self.build().
+        """
+        if self._pendingBuild is False:
+            raise RuntimeError("The core: The bombs have already been placed")
+        if self.generation == "no-guess":
+            if seed is None:
+                seed, statistics = self.searchNoGuessSeed(y=y, x=x)
+            if seed != self._seed:
+                self._deferredField = None  # Prepared for the rejected seed
+            self._seed = validateSeed(seed)
+            self._generationStatistics = dict(statistics) if statistics is not None else {}
+
+        self._safeNode = (y, x)
+        self._pendingBuild = False
         self._buildBombPositions()
+        self._deferredField = None
+        if buildRegions is True:
+            self.buildZeroRegions()
+        self.calculateAccomplishedNode()  # The flags placed before the first left click
+
+    def searchNoGuessSeed(self, y: int, x: int) -> Tuple[int, Dict[str, Union[int, float, bool]]]:
+        """
+        Rejection sampling of the board: the candidate seeds are drawn from the generator of the board seed (the search
+        is reproducible), and a candidate is accepted when isSolvableWithoutGuess() clears it from the safe node (y, x).
+        After CONFIG["No Guess Budget"] seconds, the last candidate is kept: a safe first click, but guesses may be
+        needed. The board is not modified (the search can run on a worker thread): self.placeBombs() uses the result.
+
+        :return: (seed, statistics of the search: attempts, rejected, solved, elapsed)
+        """
+        from simulation import isSolvableWithoutGuess
+        from elimination import EliminationSolver
+        rng: np.random.Generator = np.random.default_rng(self._seed)
+        solver: EliminationSolver = EliminationSolver()
+        start: float = perf_counter()
+        deadline: float = start + CONFIG["No Guess Budget"]
+        seed, attempts, solved = self._seed, 0, False
+        while True:
+            attempts += 1
+            trial: minesweeper = minesweeper(boardID=encodeBoardID(self.size, self.difficulty, seed, (y, x)))
+            trial.click(y=y, x=x, message="LeftMouse", enableSaving=False)
+            if isSolvableWithoutGuess(trial, solver=solver, deadline=deadline) is True:
+                solved = True
+                break
+            if perf_counter() >= deadline:
+                break
+            seed = newSeed(rng)
+
+        if solved is False:
+            warning(" No board solvable without guess has been found in {} attempt(s) ({} s): Keep the last one"
+                    .format(attempts, CONFIG["No Guess Budget"]))
+        return seed, {"attempts": attempts, "rejected": attempts - int(solved), "solved": solved,
+                      "elapsed": perf_counter() - start}
 
     # ----------------------------------------------------------------------------------------------------------------
     # [2]: Undo - Redo Function: Functions used to perform core-task and UI-task: Stack for Undo-Redo
-    def _setInterfaceMatrix(self, new_matrix: np.ndarray) -> None:
-        del self.interface_matrix
-        self.interface_matrix = new_matrix
-        self.calculateAccomplishedNode()
+    def _beginMove(self) -> bool:
+        # Start recording the nodes changed by the move. Return True if this call owns the record
+        if self._pendingChanges is None:
+            self._pendingChanges = ChangeSet()
+            return True
+        return False
+
+    def _commitMove(self, saving: bool = True) -> np.ndarray:
+        # Stop recording, push the changed nodes of the move into the UNDO stack (if saving) and publish them
+        changes, self._pendingChanges = self._pendingChanges, None
+        entry: Optional[HistoryEntry] = changes.freeze() if changes is not None else None
+        if entry is None:
+            return self._publishChanges(indices=NO_CHANGES)
 
-    def _reset_undoStack(self) -> None:
-        del self.__undoStack
-        self.__undoStack = []
+        if saving is True:
+            self.__history.push(entry=entry, matrix=self.interface_matrix)
+        return self._publishChanges(indices=entry.indices)
 
-    def _reset_redoStack(self) -> None:
-        del self.__redoStack
-        self.__redoStack = []
+    def _publishChanges(self, indices: np.ndarray) -> np.ndarray:
+        self._lastChanges = indices
+        return indices
 
-    def clickUndo(self) -> None:
-        if not self.__undoStack:
+    def clickUndo(self) -> np.ndarray:
+        # Return the graph index of the nodes changed by the UNDO
+        if self.__history.canUndo() is False:
             warning(" No state of UNDO is saved")
         elif self.checkIfPlayable() is False:
             warning(" You cannot play at current time")
         else:
             warning(" Add to REDO")
-            self.__redoStack.append(self.getInterfaceMatrix().copy())
-
-            new_matrix = self.__undoStack.pop()
-            self._setInterfaceMatrix(new_matrix=new_matrix)
-
-            if len(self.__redoStack) > self._maxStackSizeForUndoRedo:
-                warning("The core: REDO Stack has held too many object. Automatically delete some entity")
-                if CONFIG["Clean Time"] == 1:
-                    self.__redoStack.pop(0)
-                else:
-                    self.__redoStack = self.__redoStack[CONFIG["Clean Time"]:].copy()
-                    gc.collect()
-        pass
-
-    def clickRedo(self) -> None:
-        if not self.__redoStack:
+            entry: HistoryEntry = self.__history.undo(matrix=self.interface_matrix)
+            self._countNodes(indices=entry.indices, before=entry.after, after=entry.before)
+            return self._publishChanges(indices=entry.indices)
+        return self._publishChanges(indices=NO_CHANGES)
+
+    def clickRedo(self) -> np.ndarray:
+        # Return the graph index of the nodes changed by the REDO
+        if self.__history.canRedo() is False:
             warning(" No state of REDO is saved")
         elif self.checkIfPlayable() is False:
             warning(" You cannot play at current time")
         else:
             warning(" Add to UNDO")
-            self.__undoStack.append(self.getInterfaceMatrix().copy())
-
-            new_matrix = self.__redoStack.pop()
-            self._setInterfaceMatrix(new_matrix=new_matrix)
-
-            if len(self.__undoStack) > self._maxStackSizeForUndoRedo:
-                warning("The core: UNDO Stack has held too many object. Automatically delete some entity")
-                if CONFIG["Clean Time"] == 1:
-                    self.__undoStack.pop(0)
-                else:
-                    self.__undoStack = self.__undoStack[CONFIG["Clean Time"]:].copy()
-                    gc.collect()
-        pass
+            entry: HistoryEntry = self.__history.redo(matrix=self.interface_matrix)
+            self._countNodes(indices=entry.indices, before=entry.before, after=entry.after)
+            return self._publishChanges(indices=entry.indices)
+        return self._publishChanges(indices=NO_CHANGES)
 
     def resetStack(self):
-        self._reset_undoStack()
-        self._reset_redoStack()
-        gc.collect()
-
-    def _savePreviousState(self) -> None:
-        if len(self.__undoStack) > self._maxStackSizeForUndoRedo:
-            warning("The core: UNDO Stack has held too many object. Automatically delete some entity")
-            if CONFIG["Clean Time"] == 1:
-                self.__undoStack.pop(0)
-            else:
-                self.__undoStack = self.__undoStack[CONFIG["Clean Time"]:].copy()
-                gc.collect()
-        self.__undoStack.append(self.getInterfaceMatrix().copy())
+        self.__history.clear()
 
     def _saveState(self, interface_matrix: np.ndarray):
-        if len(self.__undoStack) > self._maxStackSizeForUndoRedo:
-            warning("The core: UNDO Stack has held too many object. Automatically delete some entity")
-            if CONFIG["Clean Time"] == 1:
-                self.__undoStack.pop(0)
-            else:
-                self.__undoStack = self.__undoStack[CONFIG["Clean Time"]:].copy()
-                gc.collect()
-
+        # Save (interface_matrix) as the state to be restored by the next UNDO
         if interface_matrix.shape != self.interface_matrix.shape:
             print("interface_matrix is not in accurate state")
             raise TypeError("interface_matrix is not in accurate state")
 
-        self.__undoStack.append(interface_matrix.copy())
+        indices: np.ndarray = np.flatnonzero(interface_matrix != self.interface_matrix)
+        if indices.shape[0] != 0:
+            self.__history.push(entry=HistoryEntry(indices=indices.astype(np.int32),
+                                                   before=interface_matrix.ravel()[indices].astype(np.int8),
+                                                   after=self.interface_matrix.ravel()[indices].copy()),
+                                matrix=self.interface_matrix)
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # [3]: User Interface Function
-    def _recursiveDepthFirstFlow(self, index: int, recorded_stack: List[int]):
-        # Time Complexity: O(1.5N) - Auxiliary Space: O(N)
-        # Condition to check if that value has been pass yet, else discarded
-        if recorded_stack[index] is False:
-            # [1]: Add into the matrix
-            recorded_stack[index] = True
-
-            # [2]: Convert to Matrix Index for Calculation
-            y, x = self._location[index]
-
-            # Condition to check whether the core matrix that zero.
-            # If self.__core[y, x] = 0: No object found, continue to flow; else, don't flow it
-            if self._checkCoreNode(y=y, x=x, value=0) is True:
-                # [3]: Flow the graph into four direction: Bottom, Top, Left, Right
-                if y + 1 < self.size[0]:  # [3.1]: Flow to Bottom
-                    self._recursiveDepthFirstFlow(index=self._convertMatrixToGraphWithCache(y=y + 1, x=x),
-                                                  recorded_stack=recorded_stack)
-                if y - 1 >= 0:  # [3.2]: Flow to Top
-                    self._recursiveDepthFirstFlow(index=self._convertMatrixToGraphWithCache(y=y - 1, x=x),
-                                                  recorded_stack=recorded_stack)
-                if x - 1 >= 0:  # [3.2]: Flow to Left
-                    self._recursiveDepthFirstFlow(index=self._convertMatrixToGraphWithCache(y=y, x=x - 1),
-                                                  recorded_stack=recorded_stack)
-                if x + 1 < self.size[1]:  # [3.3]: Flow to Right
-                    self._recursiveDepthFirstFlow(index=self._convertMatrixToGraphWithCache(y=y, x=x + 1),
-                                                  recorded_stack=recorded_stack)
+    def getLastChanges(self) -> np.ndarray:
+        return self._lastChanges
 
-        pass
+    def getHistoryMemory(self) -> int:
+        return self.__history.getMemoryUsage()
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # [3]: User Interface Function
     def _graphExpansion(self, y_start: int, x_start: int) -> None:
+        # Open the pre-computed region of the empty node: Time Complexity: O(region size) - No recursion
         if self._checkCoreNode(y=y_start, x=x_start, value=0) is True:
-            visiting_stack: List[bool] = [False] * int(self.getNumberOfNodes())
-            index_start = self._convertMatrixToGraphWithCache(y=y_start, x=x_start)
-            self._recursiveDepthFirstFlow(index=index_start, recorded_stack=visiting_stack)
-
-            for graph_index, state in enumerate(visiting_stack):
-                if state is True:
-                    self._openNodeAtInterfaceMatrixByGraph(graph_index=graph_index)
+            self._openInterfaceNodes(graph_index=self.getZeroRegion(y=y_start, x=x_start))
 
         pass
 
@@ -480,19 +649,21 @@ class minesweeper:
             counter -= 1
         return neighborEightLocation
 
-    def multiClick(self, y: int, x: int) -> None:
+    def multiClick(self, y: int, x: int) -> np.ndarray:
         # To activate this function, there are some condition that needs to be validate
         # [1]: Player must be playable (Of course)
         # [2]: The node that you double click must have been previously opened
         # [3]: The node open should not be an empty node
+        # Return the graph index of the nodes changed by the move
         if self.checkIfPlayable() is False or self._checkInterfaceNode(y=y, x=x, value=1) is False or \
                 self._checkCoreNode(y=y, x=x, value=0) is True:
-            return None
+            return self._publishChanges(indices=NO_CHANGES)
 
         # [1]: Get all neighbors' position & Remove all invalid node(s)
         # Valid Node is determined if that node was not revealed. Note that the valid node could be a bomb
         neighborEightLocation = self.getNeighbor8Unrevealed(y=y, x=x)
-        print(f"Current State: ({y}, {x}) --> Neighbor: {neighborEightLocation}")
+        if self.verbose is True:
+            print(f"Current State: ({y}, {x}) --> Neighbor: {neighborEightLocation}")
         # [2]: If there are still some node that has been available: Do next move --> Else: No status would be save
         if len(neighborEightLocation) != 0:
             # Search Bomb
@@ -506,54 +677,53 @@ class minesweeper:
             if contain_bomb is False:
                 # No bomb has been found = Safe; So, we would save all current state first, then reveal all nodes
                 # without saving to avoid memory burden.
-                self._savePreviousState()
+                self._beginMove()
                 for y_, x_ in neighborEightLocation:
                     self.click(y=y_, x=x_, message="LeftMouse", enableSaving=False)
+                return self._commitMove(saving=True)
 
-        return None
+        return self._publishChanges(indices=NO_CHANGES)
 
-    def click(self, y: int, x: int, message: str, enableSaving: bool = True) -> None:
+    def click(self, y: int, x: int, message: str, enableSaving: bool = True) -> np.ndarray:
         # Attach function used when clicking image on the interface nodes
         # Note that self.click() is also responsible for controlling whether playing can continue playing the game
+        # Return the graph index of the nodes changed by the click. If the click is a part of a larger move
+        # (e.g. self.multiClick()), the changes are returned by that move instead
         if message not in MOUSE_MESSAGE.keys():
             raise ValueError("Re-check the source code for data validation. "
                              "Clicked mouse has emit unknown message ({})".format(message))
 
         if self.checkIfPlayable() is True:
             # [1]: Save the previous state
-            if enableSaving is True:
-                self._savePreviousState()
+            owner: bool = self._beginMove()
 
             # [2]: Click
             # [2.1]: Click by left-mouse
             if MOUSE_MESSAGE[message] == "L":
+                if self._pendingBuild is True and self._checkInterfaceNode(y=y, x=x, value=0) is True:
+                    self.placeBombs(y=y, x=x)
+
                 # [2.1.1]: Click by left-mouse only works on deactivated interface node.
                 # If the associated core node is empty, do graph_flowing; Else, just open
                 # self._graphExpansion guarantee it does not touch the bomb
                 if self._checkInterfaceNode(y=y, x=x, value=0) is True:
                     if self._checkCoreNode(y=y, x=x, value=0):
                         self._graphExpansion(y_start=y, x_start=x)
-                        self.calculateAccomplishedNode()
                     else:
                         self._openNodeAtInterfaceMatrixByMatrix(y=y, x=x)
                         if self.checkIfBomb(y=y, x=x) is True:
                             self.PlayingStatus = False
                             self.VictoryStatus = False
-                        self._accomplishedNode += 1
 
             # [2.2]: Click by left-mouse
             elif MOUSE_MESSAGE[message] == "R":
                 # If that interface node has not been opened. Assign as Flag
                 if self._checkInterfaceNode(y=y, x=x, value=0) is True:
                     self._setInterfaceNode(y=y, x=x, value=self.FlagNotation)
-                    self._remainingFlags -= 1
-                    self._accomplishedNode += 1
 
                 # If that interface node was assigned as Flag. Assign as Question
                 elif self._checkInterfaceNode(y=y, x=x, value=self.FlagNotation) is True:
                     self._setInterfaceNode(y=y, x=x, value=self.QuestionNotation)
-                    self._remainingFlags += 1
-                    self._accomplishedNode -= 1
 
                 # If that interface node was assigned as Question. Unassigned it
                 elif self._checkInterfaceNode(y=y, x=x, value=self.QuestionNotation):
@@ -563,9 +733,12 @@ class minesweeper:
                 self.PlayingStatus = False
                 self.VictoryStatus = True
 
-        else:
-            warning(" You cannot play at current time.")
-        pass
+            if owner is True:
+                return self._commitMove(saving=enableSaving)
+            return NO_CHANGES
+
+        warning(" You cannot play at current time.")
+        return self._publishChanges(indices=NO_CHANGES)
 
     # ----------------------------------------------------------------------------------------------------------------
     # [4]: Checking Function
@@ -583,18 +756,13 @@ class minesweeper:
         # In the game there are ton's of condition to be validate as winning the game
         # [1]: No flags remaining and No Questions Mark
         # [2]: All the flags has been assigned correctly in bomb position
-        if self.getQuestionPositions().shape[0] == 0 and self.getRemainingFlags() == 0:
-            bomb_position: List[Tuple[int, int]] = self.getBombPositions(descending=False)
-            for position in range(len(bomb_position) - 1, -1, -1):
-                y, x = bomb_position[position]
-                if self._checkInterfaceNode(y=y, x=x, value=self.FlagNotation):
-                    bomb_position.pop()
-                else:
-                    self.VictoryStatus = False
-                    break
-            if not bomb_position:
+        # Every condition is read from the counters of the interface matrix: O(1)
+        if self._questionNodes == 0 and self.getRemainingFlags() == 0:
+            if self._correctFlags == self._bombNumber:
                 self.PlayingStatus = False
                 self.VictoryStatus = True
+            else:
+                self.VictoryStatus = False
         elif self.getUnaccomplishedNodes() == 0 and self.PlayingStatus is True and self.VictoryStatus is False:
             self.PlayingStatus = False
             self.VictoryStatus = True
@@ -606,10 +774,17 @@ class minesweeper:
         return self.PlayingStatus
 
     def calculateAccomplishedNode(self):
-        x: np.ndarray = self.getInterfaceMatrix().view()
-        self._accomplishedNode: int = x[(x == 1) | (x == -1)].size
-
-    def resetGame(self, size: Optional[Union[int, Tuple[int, int]]] = 16, difficulty: str = "Medium"):
+        # Re-synchronize every counter of the interface matrix by a full scan: O(N). The moves never need it, as the
+        # counters are updated by every write of the interface matrix (click, multiClick, undo & redo)
+        indices: np.ndarray = np.arange(self.getNumberOfNodes())
+        self._openedNodes, self._revealedSafeNodes, self._flagNodes, self._correctFlags, self._questionNodes = \
+            0, 0, 0, 0, 0
+        self._countNodes(indices=indices, before=np.zeros(shape=indices.shape, dtype=np.int8),
+                         after=self.interface_matrix.ravel())
+
+    def resetGame(self, size: Optional[Union[int, Tuple[int, int]]] = 16, difficulty: str = "Medium",
+                  seed: Optional[int] = None):
+        # New board of a new seed (or of the seed if provided)
         # [1]: Validate Hyper-parameters
         if True:
             if size == -1 or size is None:
@@ -626,38 +801,34 @@ class minesweeper:
                 if self.size[0] != size[0] or self.size[1] != size[1]:
                     self.adjacencyMatrixStatus = False
                     self.size = size[:2]
-                    self._random_positions: np.ndarray = self.resetRandom()
-                    self._location = {i: self._convertGraphToMatrixWithMath(i) for i in range(self.getNumberOfNodes())}
-                    self._reversedLocation = {value: key for key, value in self.getLocation().items()}
 
             if difficulty is not None:
                 difficulty_validation(key=difficulty)
                 self.difficulty = difficulty
 
-            self._bombNumber: int = int(DIFFICULTY[self.difficulty][0] * (self.size[0] / 2 + self.size[1] / 2) **
-                                        DIFFICULTY[self.difficulty][1])
+            self._bombNumber: int = getBombNumber(size=self.size, difficulty=self.difficulty)
+            self._seed: int = validateSeed(seed) if seed is not None else newSeed()
+            self._safeNode = None
+            self._generationStatistics = {}
             pass
 
         # [2]: Reset everything having
         # [2.1]: Setup Core for Data Implementation
         self.__coreMatrix: np.ndarray = np.zeros(shape=self.size, dtype=np.int8)
         self.__bombPosition.clear()
-        self._remainingFlags: int = self._bombNumber
 
         # [2]: Set Configuration
         self.interface_matrix: np.ndarray = np.zeros(shape=self.size, dtype=np.int8)
-        self._accomplishedNode: int = 0
+        self._openedNodes, self._revealedSafeNodes, self._flagNodes, self._correctFlags, self._questionNodes = \
+            0, 0, 0, 0, 0
 
         if self.adjacencyMatrixStatus is False:
-            self.adjacencyMatrixFour: np.ndarray = \
-                np.zeros(shape=(self.getNumberOfNodes(), self.getNumberOfNodes()), dtype=np.uint8)
-            self.adjacencyMatrixEight: np.ndarray = \
-                np.zeros(shape=(self.getNumberOfNodes(), self.getNumberOfNodes()), dtype=np.uint8)
             self.buildAdjacencyMatrix()
 
         # [3]: Set Undo & Redo Features
-        self.__undoStack: List[np.ndarray] = []
-        self.__redoStack: List[np.ndarray] = []
+        self.__history.clear()
+        self._pendingChanges = None
+        self._lastChanges = NO_CHANGES
 
         # [4]: Gaming Status
         self.VictoryStatus: bool = False
@@ -665,13 +836,16 @@ class minesweeper:
 
         # [5]: Running Function
         self.build()
-        self.displayInformation()
+        if self.verbose is True:
+            self.displayInformation()
 
-    def fastReset(self):
+    def fastReset(self, seed: Optional[int] = None):
+        # Move the bombs (new seed) under the current interface matrix
+        self._seed: int = validateSeed(seed) if seed is not None else newSeed()
         self.__coreMatrix: np.ndarray = np.zeros(shape=self.size, dtype=np.int8)
         self.__bombPosition.clear()
-        self._remainingFlags: int = self._bombNumber
         self.build()
+        self.calculateAccomplishedNode()  # The bombs have moved under the current interface matrix
 
     # [x]: Getter and Display Function --------------------------------------------------------
     # [x.1] Getter Function
@@ -709,9 +883,31 @@ class minesweeper:
 
         return position
 
+    def getNeighborTable(self) -> NeighborTable:
+        if self.adjacencyMatrixStatus is False or self.neighborTable is None:
+            self.buildAdjacencyMatrix()
+        return self.neighborTable
+
+    def getNeighbors4(self, graph_index: int) -> np.ndarray:
+        return self.getNeighborTable().getNeighbors4(index=graph_index)
+
+    def getNeighbors8(self, graph_index: int) -> np.ndarray:
+        return self.getNeighborTable().getNeighbors8(index=graph_index)
+
     def getCoreMatrix(self) -> np.ndarray:
+        # Writable copy: O(N). The read-only callers should use self.getCoreView() instead
         return self.__coreMatrix.copy()
 
+    def getCoreView(self) -> np.ndarray:
+        # Read-only view of the core matrix: O(1), no copy. Any write raises ValueError
+        view: np.ndarray = self.__coreMatrix.view()
+        view.flags.writeable = False
+        return view
+
+    def getCoreNodes(self, graph_index: np.ndarray) -> np.ndarray:
+        # Bulk read of the core matrix by graph index
+        return self.__coreMatrix.ravel()[graph_index]
+
     def getHashingCoreMatrix(self, extraHash: bool = False) -> np.ndarray:
         matrix: np.ndarray = self.getCoreMatrix()
         bomb_location: List[Tuple[int, int]] = self.getBombPositions()
@@ -726,13 +922,23 @@ class minesweeper:
         return matrix
 
     def getCoreNode(self, y: int, x: int) -> np.integer:
-        return self.getCoreMatrix()[y, x]
+        return self.__coreMatrix[y, x]
 
     def getInterfaceMatrix(self) -> np.ndarray:
         return self.interface_matrix
 
+    def getInterfaceView(self) -> np.ndarray:
+        # Read-only view of the interface matrix: O(1), no copy. Any write raises ValueError
+        view: np.ndarray = self.interface_matrix.view()
+        view.flags.writeable = False
+        return view
+
+    def getInterfaceNodes(self, graph_index: np.ndarray) -> np.ndarray:
+        # Bulk read of the interface matrix by graph index
+        return self.interface_matrix.ravel()[graph_index]
+
     def getInterfaceNode(self, y: int, x: int):
-        return self.getInterfaceMatrix()[y, x]
+        return self.interface_matrix[y, x]
 
     def getNumberOfNodes(self) -> int:
         return self.getNumberOfNodesInVerticalAxis() * self.getNumberOfNodesInHorizontalAxis()
@@ -765,35 +971,51 @@ class minesweeper:
         return np.argwhere(self.getInterfaceMatrix() == self.QuestionNotation)
 
     def getRemainingFlags(self) -> int:
-        return self._remainingFlags
+        return self._bombNumber - self._flagNodes
 
     def getAccomplishedNodes(self) -> int:
-        return self._accomplishedNode
+        return self._openedNodes + self._flagNodes
 
     def getUnaccomplishedNodes(self) -> int:
-        return self.getNumberOfNodes() - self._accomplishedNode
+        return self.getNumberOfNodes() - self.getAccomplishedNodes()
+
+    def getFlagCount(self) -> int:
+        return self._flagNodes
+
+    def getSeed(self) -> int:
+        return self._seed
+
+    def getBoardID(self) -> str:
+        # Regenerate this board with minesweeper(boardID=...). Before the first left click of a deferred build (see
+        # self.checkIfBuilt()), the bombs are not placed yet and the board ID has no safe node
+        return encodeBoardID(size=self.size, difficulty=self.difficulty, seed=self._seed, safeNode=self._safeNode)
 
-    def getLocation(self) -> Dict[int, Tuple[int, int]]:
-        return self._location
+    def checkIfBuilt(self) -> bool:
+        return not self._pendingBuild
 
-    def getReverseLocation(self) -> Dict[Tuple[int, int], int]:
-        return self._reversedLocation
+    def getGenerationStatistics(self) -> Dict[str, Union[int, float, bool]]:
+        # No-guess generation: attempts, rejected (boards needing a guess), solved, elapsed (seconds)
+        return dict(self._generationStatistics)
+
+    def getQuestionCount(self) -> int:
+        return self._questionNodes
+
+    def getRevealedSafeNodes(self) -> int:
+        return self._revealedSafeNodes
+
+    def getCorrectFlags(self) -> int:
+        return self._correctFlags
 
     def identifyBombByTanh(self) -> np.ndarray:
-        # If tanhMatrix, convert affection nodes first
-        tanhMatrix = self.getCoreMatrix()
-        for value in range(1, 9):
-            tanhMatrix[tanhMatrix == value] = 1
-        tanhMatrix[tanhMatrix == self.BombNotation] = 2
+        # 0: Empty, 1: Number, 2: Bomb. One pass over the core matrix, without intermediate copy
+        tanhMatrix: np.ndarray = (self.__coreMatrix > 0).astype(np.int8)
+        tanhMatrix[self.__coreMatrix == self.BombNotation] = 2
 
         return tanhMatrix
 
     def identifyBombBySigmoid(self) -> np.ndarray:
-        # If tanhMatrix, convert affection nodes first
-        sigmoidMatrix = self.getCoreMatrix()
-        for value in range(1, 9):
-            sigmoidMatrix[sigmoidMatrix == value] = 0
-        sigmoidMatrix[sigmoidMatrix == self.BombNotation] = 1
+        # 0: Empty or Number, 1: Bomb
+        sigmoidMatrix: np.ndarray = (self.__coreMatrix == self.BombNotation).astype(np.int8)
 
         return sigmoidMatrix
 
@@ -815,7 +1037,7 @@ class minesweeper:
     def displayCoreMatrix(self) -> None:
         print("=" * 100)
         print("Core Matrix: ")
-        print(self.getCoreMatrix())
+        print(self.getCoreView())
         print("Matrix Size: {} --> Association Node: {} <---> Bomb Number: {}"
               .format(self.size, self.getNumberOfNodes(), self.getBombNumber()))
         print("=" * 100)
@@ -824,7 +1046,7 @@ class minesweeper:
     def displayBetterCoreMatrix(self) -> None:
         print("=" * 100)
         print("Better Core Matrix: ")
-        matrix: np.ndarray = np.array(self.getCoreMatrix(), dtype=np.object_)
+        matrix: np.ndarray = self.getCoreView().astype(np.object_)
         matrix[matrix == self.BombNotation] = "*"
         matrix[matrix == 0] = "_"
         for value in range(1, 9):
@@ -864,7 +1086,7 @@ class minesweeper:
     def displayInterfaceMatrix(self) -> None:
         print("=" * 100)
         print("Interface Matrix: ")
-        matrix = self.getInterfaceMatrix()
+        matrix: np.ndarray = self.getInterfaceView()
         for row in range(0, matrix.shape[0]):
             print(matrix[row].tolist())
         print("=" * 100)
@@ -873,7 +1095,7 @@ class minesweeper:
     def displayBetterInterfaceMatrix(self) -> None:
         print("=" * 100)
         print("Better Interface Matrix: ")
-        matrix: np.ndarray = np.array(self.getInterfaceMatrix().copy(), dtype=np.object_)
+        matrix: np.ndarray = self.getInterfaceView().astype(np.object_)
         matrix[matrix == 1] = "O"
         matrix[matrix == 0] = "_"
         matrix[matrix == self.FlagNotation] = "F"
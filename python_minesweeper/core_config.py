@@ -0,0 +1,59 @@
+from typing import Dict, Tuple, Union
+
+# Configuration used by the core (core.py). This module is imported by the headless core, so it must not import
+# anything from the interface (PyQt5) or the score I/O (pandas). config.py re-exports everything here.
+
+# "MOUSE_MESSAGE": Used to emit a signal when clicking mouse
+MOUSE_MESSAGE: Dict[Union[int, str], Union[int, str]] = \
+    {
+        "LeftMouse": "L",
+        "RightMouse": "R",
+    }
+# -----------------------------------------------------------------------------------------------------------
+# CORE.py
+# "CORE_CONFIGURATION": Dictionary about specific notation in core.py
+CORE_CONFIGURATION: Dict[str, Union[int, float]] = \
+    {
+        "Bomb Notation": -20,
+        "Flag Notation": -1,
+        "Question Notation": -5,
+        "Default Size": 15,
+        "History Memory": 16 * 1024 * 1024,  # Maximum bytes held by the Undo - Redo history
+        "Checkpoint Interval": 32,  # Save a full copy of the interface matrix every K moves
+        "Vectorized Generation": True,  # Place bombs & count neighbors with NumPy array operations
+        "Cross Check Generation": False,  # Validate the vectorized generation against the legacy (scalar) one
+        "Generation Mode": "classic",  # Default of minesweeper(generation=...), see GENERATION_MODES
+        "No Guess Budget": 2.0,  # Seconds spent searching a board solvable without guess, per board
+    }
+
+# "GENERATION_MODES": When & how the bombs are placed
+# + classic: When the board is built. The first click can be a bomb
+# + safe: At the first left click, outside of the 3x3 area of the clicked node
+# + no-guess: Same as "safe", and the board is re-sampled until the deterministic solver clears it from the first click
+GENERATION_MODES: Tuple[str, ...] = ("classic", "safe", "no-guess")
+
+__EASY: Tuple[float, float] = (0.125, 1.75)
+__MEDIUM: Tuple[float, float] = (0.15, 1.8)
+__HARD: Tuple[float, float] = (0.2, 1.8)
+__EXTREME: Tuple[float, float] = (0.25, 1.875)
+
+DIFFICULTY: Dict[str, Tuple] = \
+    {
+        "Easy": __EASY,
+        "Medium": __MEDIUM,
+        "Hard": __HARD,
+        "Extreme": __EXTREME,
+    }
+
+
+def difficulty_validation(key: str) -> Tuple[int, int]:
+    if key in DIFFICULTY.keys():
+        return DIFFICULTY[key]
+    print("key ({}) is in-valid. Only accept key = {} only".format(key, list(DIFFICULTY.keys())))
+    raise ValueError("key ({}) is in-valid. Only accept key = {} only".format(key, list(DIFFICULTY.keys())))
+
+
+def getBombNumber(size: Tuple[int, int], difficulty: str) -> int:
+    # The number of bombs of a (rows, columns) board: the only place of the formula (core, batch & benchmark)
+    ratio, power = difficulty_validation(key=difficulty)
+    return int(ratio * (size[0] / 2 + size[1] / 2) ** power)
@@ -0,0 +1,140 @@
+import numpy as np
+from math import gcd
+from typing import Dict, List, Set, Tuple
+from core import minesweeper
+from probability import Constraint, readConstraints, splitComponents, getSignature, toConstraints
+
+
+def _normalize(row: Dict[int, int], rhs: int) -> Tuple[Dict[int, int], int]:
+    # Divide the row by the gcd of its coefficients, with a positive leading coefficient
+    divisor: int = abs(rhs)
+    for coefficient in row.values():
+        divisor = gcd(divisor, coefficient)
+    if row and row[min(row)] < 0:
+        divisor = -divisor
+    if divisor not in (0, 1):
+        return {column: coefficient // divisor for column, coefficient in row.items()}, rhs // divisor
+    return row, rhs
+
+
+def _forcedByBounds(row: Dict[int, int], rhs: int, safe: Set[int], mines: Set[int]) -> bool:
+    # Every node is 0 or 1: the row lies in [sum of negative coefficients, sum of positive coefficients]. When the right
+    # hand side reaches one of the bounds, every node of the row is forced. Return True if the row is consistent
+    lower: int = sum(coefficient for coefficient in row.values() if coefficient < 0)
+    upper: int = sum(coefficient for coefficient in row.values() if coefficient > 0)
+    if rhs < lower or rhs > upper:
+        return False
+    if rhs == lower or rhs == upper:
+        positive: Set[int] = mines if rhs == upper else safe
+        negative: Set[int] = safe if rhs == upper else mines
+        for column, coefficient in row.items():
+            (positive if coefficient > 0 else negative).add(column)
+    return True
+
+
+def reduceComponent(constraints: List[Constraint]) -> Tuple[Set[int], Set[int]]:
+    """
+    Sparse integer (fraction-free) Gauss-Jordan elimination of one frontier component: every constraint is a row
+    sum(x[cell]) = bombs with x in {0, 1}. The forced nodes of the reduced rows are substituted back into the system
+    and the elimination is repeated until no new node is found.
+    :return: (graph index of the safe nodes, graph index of the bombs)
+    """
+    safe, mines = set(), set()
+    while True:
+        # [1]: Build the sparse rows with the known nodes substituted
+        rows: List[Dict[int, int]] = []
+        rhs: List[int] = []
+        for cells, bombs in constraints:
+            row: Dict[int, int] = {cell: 1 for cell in cells if cell not in safe and cell not in mines}
+            if row:
+                rows.append(row)
+                rhs.append(bombs - sum(1 for cell in cells if cell in mines))
+
+        # [2]: Gauss-Jordan elimination. columns[c] holds the rows with a non-zero coefficient on column c. A row whose
+        # bounds are tight before the elimination may be combined into a loose one, so it is checked first
+        found_safe, found_mines = set(), set()
+        for row, value in zip(rows, rhs):
+            _forcedByBounds(row, value, found_safe, found_mines)
+
+        columns: Dict[int, Set[int]] = {}
+        for i, row in enumerate(rows):
+            for column in row:
+                columns.setdefault(column, set()).add(i)
+
+        used: Set[int] = set()
+        for column in sorted(columns):
+            candidates: List[int] = [i for i in columns[column] if i not in used]
+            if not candidates:
+                continue
+            pivot: int = min(candidates, key=lambda i: len(rows[i]))
+            used.add(pivot)
+            pivot_row, pivot_rhs = rows[pivot], rhs[pivot]
+            for i in list(columns[column]):
+                if i == pivot:
+                    continue
+                factor, scale = rows[i][column], pivot_row[column]
+                row: Dict[int, int] = {key: value * scale for key, value in rows[i].items()}
+                for key, value in pivot_row.items():
+                    merged: int = row.get(key, 0) - factor * value
+                    if merged != 0:
+                        row[key] = merged
+                    elif key in row:
+                        del row[key]
+                for key in rows[i]:
+                    if key not in row:
+                        columns[key].discard(i)
+                for key in row:
+                    columns.setdefault(key, set()).add(i)
+                rows[i], rhs[i] = _normalize(row, rhs[i] * scale - factor * pivot_rhs)
+
+        # [3]: Forced nodes of every reduced row
+        for row, value in zip(rows, rhs):
+            if row:
+                _forcedByBounds(row, value, found_safe, found_mines)
+        if found_safe & found_mines or not (found_safe - safe or found_mines - mines):
+            return safe, mines  # Nothing new (or an inconsistent state, e.g. wrong flags)
+        safe |= found_safe
+        mines |= found_mines
+
+
+class EliminationSolver:
+    """
+    Deterministic solver by linear algebra over the frontier: the constraints of the opened numbers form a sparse 0/1
+    system reduced by integer Gaussian elimination (see reduceComponent()), which also finds the moves combining several
+    constraints that the subset rules of ConstraintSolver miss.
+    The system is split into independent components, and the reduction of a component is cached by its constraint
+    signature, so after a move only the components changed by that move are reduced again.
+    """
+    __slots__ = ("_cache", )
+
+    def __init__(self):
+        self._cache: Dict[bytes, Tuple[Set[int], Set[int]]] = {}
+
+    def reset(self) -> None:
+        self._cache.clear()
+
+    def solveIndices(self, game: minesweeper) -> Tuple[Set[int], Set[int]]:
+        # Return the graph index of every unknown node guaranteed to be safe, and to be a bomb
+        cells, bombs, unknown, remaining = readConstraints(game)
+        if remaining == 0 or remaining == unknown.shape[0]:
+            nodes: Set[int] = set(unknown.tolist())
+            return (nodes, set()) if remaining == 0 else (set(), nodes)
+
+        safe, mines = set(), set()
+        cache: Dict[bytes, Tuple[Set[int], Set[int]]] = {}
+        for block, count in splitComponents(cells, bombs, size=game.getNumberOfNodes()):
+            signature: bytes = getSignature(block, count)
+            result: Tuple[Set[int], Set[int]] = self._cache[signature] if signature in self._cache \
+                else reduceComponent(toConstraints(block, count))
+            cache[signature] = result
+            safe |= result[0]
+            mines |= result[1]
+        self._cache = cache
+        return safe, mines
+
+    def solve(self, game: minesweeper) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+        safe, mines = self.solveIndices(game)
+        interface: np.ndarray = game.getInterfaceMatrix().ravel()
+        max_x: int = game.getNumberOfNodesInHorizontalAxis()
+        return {divmod(index, max_x) for index in safe if interface[index] == 0}, \
+               {divmod(index, max_x) for index in mines if interface[index] == 0}
@@ -0,0 +1,162 @@
+import numpy as np
+from collections import deque
+from typing import Deque, List, Optional
+
+# Estimated Python overhead of one entry (the object and its array headers), so that tiny moves are also bounded
+ENTRY_OVERHEAD: int = 512
+
+
+class ChangeSet:
+    """
+    The nodes changed by one move of the interface matrix, recorded while the move is running.
+    + self._indices: Graph index (flat index) of the changed nodes
+    + self._before: Value of the nodes before the move
+    + self._after: Value of the nodes after the move
+    """
+    __slots__ = ("_indices", "_before", "_after")
+
+    def __init__(self):
+        self._indices: List[np.ndarray] = []
+        self._before: List[np.ndarray] = []
+        self._after: List[np.ndarray] = []
+
+    def record(self, indices: np.ndarray, before: np.ndarray, after: np.ndarray) -> None:
+        indices: np.ndarray = np.asarray(indices, dtype=np.int32).ravel()
+        if indices.shape[0] != 0:
+            self._indices.append(indices)
+            self._before.append(np.asarray(before, dtype=np.int8).ravel())
+            self._after.append(np.broadcast_to(np.asarray(after, dtype=np.int8), indices.shape).ravel())
+
+    def recordNode(self, index: int, before: int, after: int) -> None:
+        if before != after:
+            self.record(indices=np.array([index], dtype=np.int32), before=np.array([before], dtype=np.int8),
+                        after=np.array([after], dtype=np.int8))
+
+    def isEmpty(self) -> bool:
+        return len(self._indices) == 0
+
+    def freeze(self) -> Optional["HistoryEntry"]:
+        # Merge the record of the move: keep the first 'before' and the last 'after' value of every node, and drop
+        # the nodes that were changed back to their initial value
+        if self.isEmpty() is True:
+            return None
+
+        indices: np.ndarray = np.concatenate(self._indices)
+        before: np.ndarray = np.concatenate(self._before)
+        after: np.ndarray = np.concatenate(self._after)
+
+        unique, first = np.unique(indices, return_index=True)
+        last: np.ndarray = indices.shape[0] - 1 - np.unique(indices[::-1], return_index=True)[1]
+        before, after = before[first], after[last]
+        changed: np.ndarray = before != after
+        if not changed.any():
+            return None
+        return HistoryEntry(indices=unique[changed].astype(np.int32), before=before[changed], after=after[changed])
+
+
+class HistoryEntry:
+    """ One move of the history: O(changed nodes) memory, with an optional full checkpoint of the state before it """
+    __slots__ = ("indices", "before", "after", "checkpoint")
+
+    def __init__(self, indices: np.ndarray, before: np.ndarray, after: np.ndarray):
+        self.indices: np.ndarray = indices
+        self.before: np.ndarray = before
+        self.after: np.ndarray = after
+        self.checkpoint: Optional[np.ndarray] = None
+
+    @property
+    def nbytes(self) -> int:
+        size: int = self.indices.nbytes + self.before.nbytes + self.after.nbytes + ENTRY_OVERHEAD
+        return size if self.checkpoint is None else size + self.checkpoint.nbytes
+
+    def undo(self, matrix: np.ndarray) -> None:
+        if self.checkpoint is not None:
+            np.copyto(matrix, self.checkpoint)
+        else:
+            np.put(matrix, self.indices, self.before)
+
+    def redo(self, matrix: np.ndarray) -> None:
+        np.put(matrix, self.indices, self.after)
+
+
+class HistoryStack:
+    """
+    Undo - Redo history of the interface matrix. Every move is stored as a delta (HistoryEntry), and every
+    checkpointInterval moves the entry also keeps a full copy of the state before it, so that undo re-synchronizes the
+    matrix on a regular basis. Both stacks are deques bounded by maxBytes (the oldest moves are dropped first).
+    Undo & Redo cost O(changed nodes) (O(N) once per checkpointInterval moves).
+    """
+    __slots__ = ("_undoStack", "_redoStack", "_maxBytes", "_checkpointInterval", "_counter", "_bytes")
+
+    def __init__(self, maxBytes: int, checkpointInterval: int):
+        if not isinstance(maxBytes, int) or maxBytes <= 0:
+            raise ValueError("maxBytes ({}) should be positive integer".format(maxBytes))
+        if not isinstance(checkpointInterval, int) or checkpointInterval <= 0:
+            raise ValueError("checkpointInterval ({}) should be positive integer".format(checkpointInterval))
+
+        self._undoStack: Deque[HistoryEntry] = deque()
+        self._redoStack: Deque[HistoryEntry] = deque()
+        self._maxBytes: int = maxBytes
+        self._checkpointInterval: int = checkpointInterval
+        self._counter: int = 0
+        self._bytes: int = 0
+
+    def push(self, entry: HistoryEntry, matrix: np.ndarray) -> None:
+        # matrix: The state after the move. A new move invalidates every state that could be redone
+        self._counter += 1
+        if self._counter % self._checkpointInterval == 0:
+            entry.checkpoint = matrix.copy()
+            np.put(entry.checkpoint, entry.indices, entry.before)
+
+        self._clearRedo()
+        self._undoStack.append(entry)
+        self._bytes += entry.nbytes
+        self._shrink()
+
+    def undo(self, matrix: np.ndarray) -> Optional[HistoryEntry]:
+        if not self._undoStack:
+            return None
+        entry: HistoryEntry = self._undoStack.pop()
+        entry.undo(matrix)
+        self._redoStack.append(entry)
+        return entry
+
+    def redo(self, matrix: np.ndarray) -> Optional[HistoryEntry]:
+        if not self._redoStack:
+            return None
+        entry: HistoryEntry = self._redoStack.pop()
+        entry.redo(matrix)
+        self._undoStack.append(entry)
+        return entry
+
+    def clear(self) -> None:
+        self._undoStack.clear()
+        self._redoStack.clear()
+        self._counter = 0
+        self._bytes = 0
+
+    def _clearRedo(self) -> None:
+        while self._redoStack:
+            self._bytes -= self._redoStack.pop().nbytes
+
+    def _shrink(self) -> None:
+        while self._bytes > self._maxBytes and self._undoStack:
+            self._bytes -= self._undoStack.popleft().nbytes
+        while self._bytes > self._maxBytes and self._redoStack:
+            self._bytes -= self._redoStack.popleft().nbytes
+
+    # [x]: Getter Function
+    def canUndo(self) -> bool:
+        return len(self._undoStack) != 0
+
+    def canRedo(self) -> bool:
+        return len(self._redoStack) != 0
+
+    def getUndoSize(self) -> int:
+        return len(self._undoStack)
+
+    def getRedoSize(self) -> int:
+        return len(self._redoStack)
+
+    def getMemoryUsage(self) -> int:
+        return self._bytes
@@ -1,16 +1,21 @@
 import gc
 
 import numpy as np
+from concurrent.futures import Future
 from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from time import time, sleep
 import config
-from typing import Tuple, List, Union, Optional, Callable
+from typing import Tuple, List, Union, Optional, Callable, Dict
 from core import minesweeper
-from component_interface import InterfaceNode, DeclaringWidget, HoveringButton, TableModel
-from preprocessing import ReadFile, ExportFile
-import pandas as pd
+from component_interface import InterfaceNode, DeclaringWidget, HoveringButton, TableModel, PixmapCache, \
+    BoardWidget, BoardView
+from solver import ConstraintSolver
+from sampling import SamplingEstimator
+from score_store import ScoreStore, SCORE_COLUMNS
+from leaderboard import Leaderboard
+from board_pool import BoardPool
 
 
 class GameWindow(QMainWindow):
@@ -33,6 +38,19 @@ class GameWindow(QMainWindow):
         self._playingDifficulty: Optional[str] = None
         self._playerName: Optional[str] = None
         self.__gameCore: Optional[minesweeper] = None
+        self._solver: ConstraintSolver = ConstraintSolver()  # Used for hints (press H while playing)
+        self._estimator: SamplingEstimator = SamplingEstimator(budget=config.HINT_BUDGET)
+        self._scoreStore: ScoreStore = ScoreStore(path=config.SCORE_DATABASE)
+        self._scoreStore.importDirectory(config.SCORE_DIRECTORY)  # Only the files never imported before
+        self._leaderboard: Leaderboard = Leaderboard.load(config.LEADERBOARD_PATH, store=self._scoreStore,
+                                                          difficulties=list(config.DIFFICULTY.keys()),
+                                                          capacity=config.LEADERBOARD_SIZE)
+        # The next boards are generated by a worker thread while the opening, dialog & ending screens are shown
+        self._boardPool: BoardPool = BoardPool(capacity=config.BOARD_POOL_SIZE)
+        # No-guess generation: (board, y, x, search) of the first left click, searched by the pool while the window runs
+        self._firstClick: Optional[Tuple[minesweeper, int, int, Future]] = None
+        self._firstClickTimer: QTimer = QTimer(self)
+        self._firstClickTimer.timeout.connect(self._finishFirstClick)
 
         # [2.2]: Setup Associated Attribute
         self._gameSetting: bool = False
@@ -78,6 +96,9 @@ class GameWindow(QMainWindow):
         # In the playing background we have timer to display, number of assigned flags, redo - undo button
         # [4.1]: Setup Core
         self.IO_nodeMatrix: Optional[List[List[Union[InterfaceNode, int]]]] = None
+        self.IO_board: Optional[BoardWidget] = None  # Used instead of self.IO_nodeMatrix for large board
+        self.IO_boardView: Optional[BoardView] = None  # Scrollable viewport of self.IO_board for oversized board
+        self._hoveringNodes: List[Tuple[int, int]] = []  # Nodes highlighted by self.multiHover() to be repainted
         self.playing_background: QLabel = QLabel(self)
         self.displayGamingStatus: bool = False
 
@@ -339,6 +360,12 @@ class GameWindow(QMainWindow):
         self.setDifficultyLevel(difficulty=difficulty)
         self.setPlayerName(name=name)
 
+    def _prepareBoards(self) -> None:
+        # Generate the boards of the last used setting in the background (see BoardPool)
+        if self._playingMatrixSize is not None and self._playingDifficulty is not None:
+            self._boardPool.prepare(size=self._playingMatrixSize, difficulty=self._playingDifficulty,
+                                    generation=config.GENERATION_MODE)
+
     def _makeDialog(self) -> None:
         # [1]: Hide the main window and resize its later
         self.move((config.WINDOW_SIZE[0] - config.DIALOG_SIZE[0]) // 2,
@@ -349,6 +376,7 @@ class GameWindow(QMainWindow):
         self.show()
 
         self.activateDialog()
+        self._prepareBoards()
 
     def _initializeOpeningInterface(self) -> None:
         # [1]: Make background and associated title
@@ -380,6 +408,7 @@ class GameWindow(QMainWindow):
 
         # [2]: Display Result
         self.activateOpeningInterface()
+        self._prepareBoards()
 
         self.update()
         self.show()
@@ -393,8 +422,18 @@ class GameWindow(QMainWindow):
         if self.__gameCore is not None:
             del self.__gameCore  # Adaptation when replay
 
-        self.__gameCore = minesweeper(size=self._playingMatrixSize, difficulty=self._playingDifficulty, verbose=False)
-        getNode: Callable = self.__gameCore.getCoreNode
+        # A board generated in advance by the pool if ready. No generation in the background while playing
+        self._boardPool.pause()
+        self._firstClickTimer.stop()
+        self._firstClick = None  # The search of the previous game (if any) is discarded
+        self.__gameCore = self._boardPool.take(size=self._playingMatrixSize, difficulty=self._playingDifficulty,
+                                               generation=config.GENERATION_MODE)
+        if self.__gameCore is None:
+            self.__gameCore = minesweeper(size=self._playingMatrixSize, difficulty=self._playingDifficulty,
+                                          verbose=False, generation=config.GENERATION_MODE)
+        self._solver.reset()
+        self._estimator.reset()
+        core: List[List[int]] = self.__gameCore.getCoreView().tolist()  # One pass, no copy of the board per node
         max_y: int = self.__gameCore.getNumberOfNodesInVerticalAxis()
         max_x: int = self.__gameCore.getNumberOfNodesInHorizontalAxis()
 
@@ -402,30 +441,67 @@ class GameWindow(QMainWindow):
         # extra section on top for drawing
 
         size: List[int] = list(config.NODES_SIZE)  # The size of each nodes on the tables (x, y)
-        maximum_nodes: int = (min(config.WINDOW_SIZE) - config.BOARD_LENGTH - 75) // \
-                             (min(size) + min(config.BOMB_NUMBER_DISPLAY["Separation"]))
+        config.BOMB_NUMBER_DISPLAY["Separation"] = [int(size[0] // 4), int(size[1] // 4)]
+        viewport: int = min(config.WINDOW_SIZE) - config.BOARD_LENGTH - 75  # The maximum length of the board
+        maximum_nodes: int = viewport // (min(size) + min(config.BOMB_NUMBER_DISPLAY["Separation"]))
 
-        while maximum_nodes <= max_x:  # Adaptation Only
+        # The nodes are shrunk until the board fits the window, but never under config.MINIMUM_NODES_SIZE. Beyond
+        # that, the board is displayed in a scrollable & zoomable viewport
+        while maximum_nodes <= max(max_x, max_y) and min(size) > config.MINIMUM_NODES_SIZE:  # Adaptation Only
             # Update Nodes Size - Update Separation - Calculate max nodes again
             size[0] -= 1
             size[1] -= 1
             config.BOMB_NUMBER_DISPLAY["Separation"] = [int(size[0] // 4), int(size[1] // 4)]
-            maximum_nodes: int = (min(config.WINDOW_SIZE) - config.BOARD_LENGTH - 75) // \
-                                 (min(size) + min(config.BOMB_NUMBER_DISPLAY["Separation"]))
+            maximum_nodes: int = viewport // (min(size) + min(config.BOMB_NUMBER_DISPLAY["Separation"]))
+
+        scrolling: bool = maximum_nodes <= max(max_x, max_y)
 
         # Get Image Scaling Factor
         scale: Tuple[float, float] = (size[0] / config.getBombNumberImage(key=-1)[0],
                                       size[1] / config.getBombNumberImage(key=-1)[1])
+        PixmapCache.warmUp(size=(int(config.getBombNumberImage(key=-1)[1] * scale[1]),
+                                 int(config.getBombNumberImage(key=-1)[0] * scale[0])))
 
         # [2]: Build Interface Matrix
         if self.IO_nodeMatrix:
+            for sub_matrix in self.IO_nodeMatrix:
+                for node in sub_matrix:
+                    node.deleteLater()
             self.IO_nodeMatrix.clear()  # Adaptation when replay
             gc.collect()
-
-        self.IO_nodeMatrix = [[InterfaceNode(y, x, int(getNode(y=y, x=x)), tuple(scale), self.clickOnNodes,
-                                                self.multiHover, self.multiClick, self)
-                                  for x in range(0, max_x)] for y in range(0, max_y)]
-        sleep(0.05)
+        if self.IO_boardView is not None:
+            self.IO_boardView.deleteLater()
+            self.IO_boardView = None
+        elif self.IO_board is not None:
+            self.IO_board.deleteLater()
+        self.IO_board = None
+
+        if scrolling is True:
+            self.IO_nodeMatrix = []
+            self.IO_board = BoardWidget(self.__gameCore, tuple(size), tuple(config.BOMB_NUMBER_DISPLAY["Separation"]),
+                                        self.clickOnNodes, self.multiHover, self.multiClick)
+            self.IO_boardView = BoardView(self.IO_board, config.MINIMUM_ZOOM_SIZE, config.NODES_SIZE[0], self)
+            self.IO_boardView.setGeometry(config.BOMB_NUMBER_DISPLAY["Initial"][1],
+                                          config.BOMB_NUMBER_DISPLAY["Initial"][0],
+                                          min(self.IO_board.width(), viewport), min(self.IO_board.height(), viewport))
+            self._playingWidth = self.IO_boardView.width() + 2 * config.BOMB_NUMBER_DISPLAY["Initial"][1]
+            self._playingHeight = self.IO_boardView.height() + config.BOMB_NUMBER_DISPLAY["Initial"][1] + \
+                config.BOARD_LENGTH
+            return None
+
+        if max_y * max_x > config.SINGLE_WIDGET_BOARD:
+            # One widget painting the whole board
+            self.IO_nodeMatrix = []
+            self.IO_board = BoardWidget(self.__gameCore, (int(config.getBombNumberImage(key=-1)[1] * scale[1]),
+                                                          int(config.getBombNumberImage(key=-1)[0] * scale[0])),
+                                        tuple(config.BOMB_NUMBER_DISPLAY["Separation"]), self.clickOnNodes,
+                                        self.multiHover, self.multiClick, self)
+            self.IO_board.move(config.BOMB_NUMBER_DISPLAY["Initial"][1], config.BOMB_NUMBER_DISPLAY["Initial"][0])
+        else:
+            self.IO_nodeMatrix = [[InterfaceNode(y, x, core[y][x], tuple(scale), self.clickOnNodes,
+                                                 self.multiHover, self.multiClick, self)
+                                   for x in range(0, max_x)] for y in range(0, max_y)]
+            sleep(0.05)
         self._playingWidth = max_x * (size[0] + config.BOMB_NUMBER_DISPLAY["Separation"][0]) + \
                              config.BOMB_NUMBER_DISPLAY["Initial"][1]
         self._playingHeight = max_y * (size[1] + config.BOMB_NUMBER_DISPLAY["Separation"][1]) + \
@@ -515,6 +591,10 @@ class GameWindow(QMainWindow):
 
     # [4.2]: (Interface) Matrix Clicking
     def _revealAllNodes(self) -> None:
+        if self.IO_board is not None:
+            self.IO_board.reveal()
+            return None
+
         max_y: int = self.__gameCore.getNumberOfNodesInVerticalAxis()
         max_x: int = self.__gameCore.getNumberOfNodesInHorizontalAxis()
         for y in range(0, max_y):
@@ -522,43 +602,117 @@ class GameWindow(QMainWindow):
                 self.IO_nodeMatrix[y][x].updateStatus(interfaceStatus=self.__gameCore.getInterfaceNode(y=y, x=x))
                 self.IO_nodeMatrix[y][x].reveal()
 
-    def _updateAllNodes(self) -> None:
-        max_y: int = self.__gameCore.getNumberOfNodesInVerticalAxis()
+    def _updateNodes(self, changes: np.ndarray) -> None:
+        # Repaint only the nodes changed by the latest move (and the nodes highlighted by self.multiHover())
+        if self.IO_board is not None:
+            self.IO_board.refreshNodes(changes=changes)
+            return None
+
         max_x: int = self.__gameCore.getNumberOfNodesInHorizontalAxis()
-        for y in range(0, max_y):
-            for x in range(0, max_x):
-                self.IO_nodeMatrix[y][x].updateStatus(interfaceStatus=self.__gameCore.getInterfaceNode(y=y, x=x))
-                self.IO_nodeMatrix[y][x].click()
+        for index in changes.tolist():
+            y, x = divmod(index, max_x)
+            self.IO_nodeMatrix[y][x].updateStatus(interfaceStatus=self.__gameCore.getInterfaceNode(y=y, x=x))
+            self.IO_nodeMatrix[y][x].click()
 
-    def _updateInterface(self):
+        for y, x in self._hoveringNodes:
+            self.IO_nodeMatrix[y][x].click()
+        self._hoveringNodes.clear()
+
+    def _updateInterface(self, changes: np.ndarray):
         # [2]: Get the interface matrix & Update
         # If the core does not allow to continue playing. Stopping the game
-        self._updateAllNodes() if self.__gameCore.checkIfPlayable() is True else self._revealAllNodes()
+        self._updateNodes(changes=changes) if self.__gameCore.checkIfPlayable() is True else self._revealAllNodes()
 
         # [3]: Update when needed
         self.update()
 
     def multiHover(self, y: int, x: int) -> None:
         doubleMouseNeighbor: List[Tuple[int, int]] = self.__gameCore.getNeighbor8Unrevealed(y=y, x=x)
-        if len(doubleMouseNeighbor) != 0:
+        if len(doubleMouseNeighbor) != 0 and self.IO_board is not None:
+            self.IO_board.hoverNodes(nodes=doubleMouseNeighbor)
+        elif len(doubleMouseNeighbor) != 0:
             for y_, x_ in doubleMouseNeighbor:
                 self.IO_nodeMatrix[y_][x_].hover()
+            self._hoveringNodes.extend(doubleMouseNeighbor)
+
+    def showHint(self) -> None:
+        # Highlight the hidden nodes which are guaranteed to be safe, else the hidden node with the lowest estimated
+        # bomb probability. The highlight is cleared by the next move
+        if self.displayGamingStatus is False or self.__gameCore.checkIfPlayable() is False:
+            return None
+
+        safe, _ = self._solver.solve(self.__gameCore)
+        if len(safe) == 0:
+            hidden: np.ndarray = self.__gameCore.getInterfaceMatrix() == 0
+            probabilities: np.ndarray = self._estimator.getProbabilities(self.__gameCore)
+            probabilities: np.ndarray = np.where(hidden & ~np.isnan(probabilities), probabilities, np.inf)
+            if np.isfinite(probabilities).any():
+                y, x = np.unravel_index(int(np.argmin(probabilities)), probabilities.shape)
+                safe = {(int(y), int(x))}
+        if len(safe) != 0 and self.IO_board is not None:
+            self.IO_board.hintNodes(nodes=list(safe))
+        elif len(safe) != 0:
+            for y, x in safe:
+                self.IO_nodeMatrix[y][x].hint()
+            self._hoveringNodes.extend(safe)  # Repainted (& un-highlighted) by the next move
 
     def multiClick(self, y: int, x: int) -> None:
         # Attached function that become an observer to receive - transmit communication
+        if self._firstClick is not None:
+            return None
+
         # [1]: Update the core matrix
-        self.__gameCore.multiClick(y=y, x=x)
+        changes: np.ndarray = self.__gameCore.multiClick(y=y, x=x)
 
         # [2]: Get the interface matrix & Update
-        self._updateInterface()
+        self._updateInterface(changes=changes)
+
+    def _placeBombs(self, y: int, x: int, seed: Optional[int] = None,
+                    statistics: Optional[Dict[str, Union[int, float, bool]]] = None) -> None:
+        # The first left click of safe & no-guess generation: place the bombs prepared by the pool, then label the
+        # regions in the background (the regions are searched per click meanwhile). Then give the values to the nodes
+        # (self.IO_board paints from the core view, which is updated in place)
+        self.__gameCore.placeBombs(y=y, x=x, seed=seed, statistics=statistics, buildRegions=False)
+        self._boardPool.buildZeroRegions(self.__gameCore)
+        if self.IO_nodeMatrix:
+            core: List[List[int]] = self.__gameCore.getCoreView().tolist()
+            for row in self.IO_nodeMatrix:
+                for node in row:
+                    node.setValue(core[node.y][node.x])
+
+    def _finishFirstClick(self) -> None:
+        # Poll the no-guess search of the first left click (see self.clickOnNodes()), then play the click
+        board, y, x, search = self._firstClick
+        if search.done() is False:
+            return None
+
+        self._firstClickTimer.stop()
+        self._firstClick = None
+        if board is not self.__gameCore or self.displayGamingStatus is False or board.checkIfBuilt() is True:
+            return None  # The game has changed meanwhile
+        seed, statistics = search.result()
+        self._placeBombs(y=y, x=x, seed=seed, statistics=statistics)
+        self.clickOnNodes(y=y, x=x, mouse="LeftMouse")
 
     def clickOnNodes(self, y: int, x: int, mouse: str) -> None:
         # Attached function that become an observer to receive - transmit communication
+        # [0]: No-guess generation: the first left click waits for the search of the board, done by the pool. The
+        # clicks are ignored meanwhile
+        if self._firstClick is not None:
+            return None
+        if self.__gameCore.checkIfBuilt() is False and mouse == "LeftMouse" and \
+                self.__gameCore.getInterfaceNode(y=y, x=x) == 0:
+            if self.__gameCore.generation == "no-guess":
+                self._firstClick = (self.__gameCore, y, x, self._boardPool.searchFirstClick(self.__gameCore, y=y, x=x))
+                self._firstClickTimer.start(config.CLOCK_UPDATE_SPEED)
+                return None
+            self._placeBombs(y=y, x=x)
+
         # [1]: Update the core matrix
-        self.__gameCore.click(y=y, x=x, message=mouse)
+        changes: np.ndarray = self.__gameCore.click(y=y, x=x, message=mouse)
 
         # [2]: Get the interface matrix & Update
-        self._updateInterface()
+        self._updateInterface(changes=changes)
 
     def clickUndoButton(self) -> None:
         # This function only works if you can continue playing the game
@@ -567,10 +721,10 @@ class GameWindow(QMainWindow):
 
         if self.__gameCore.checkIfPlayable() is True:
             # [1]: Click Undo Button
-            self.__gameCore.clickUndo()
+            changes: np.ndarray = self.__gameCore.clickUndo()
 
             # [2]: Get the interface matrix & Update
-            self._updateInterface()
+            self._updateInterface(changes=changes)
 
         return None
 
@@ -581,10 +735,10 @@ class GameWindow(QMainWindow):
 
         if self.__gameCore.checkIfPlayable() is True:
             # [1]: Click Redo Button
-            self.__gameCore.clickRedo()
+            changes: np.ndarray = self.__gameCore.clickRedo()
 
             # [2]: Get the interface matrix & Update
-            self._updateInterface()
+            self._updateInterface(changes=changes)
 
         return None
 
@@ -640,25 +794,40 @@ class GameWindow(QMainWindow):
         # [3]: Viewing Pandas Record
         t = config.TABLE_VIEW
         self.ending_displayRanking.setGeometry((config.WINDOW_SIZE[0] - t[0]) // 2, 2 * 35 + x[1] + y[1], *t)
+        self.ending_matchResult.setAlignment(Qt.AlignCenter)
+        self.ending_matchResult.setGeometry((config.WINDOW_SIZE[0] - t[0]) // 2, 2 * 35 + x[1] + y[1] + t[1], t[0], 40)
 
     def _updatePlayerPerformance(self) -> None:
-        path: str = config.DIRECTORY + "/resources/score/{}.csv".format(self._playingDifficulty)
-        value, columns = ReadFile(FilePath=path, header=0, get_values=True, get_columns=True)
         if self.__gameCore.checkIfPlayable() is True:
             winningStatus: str = "DROP"
         elif self.__gameCore.checkIfVictory() is True:
             winningStatus: str = "WIN"
         else:
             winningStatus: str = "LOSE"
-        add_new = [[self._startingDate, self._startingTime, self._playerName,
-                    round(self._playingRunningTime, 3), winningStatus]]
-
-        ExportFile(DataFrame=pd.DataFrame(data=np.concatenate((add_new, value), axis=0), columns=columns, index=None),
-                   FilePath=path, )
+        identifier: int = self._scoreStore.record(difficulty=self._playingDifficulty, startingDate=self._startingDate,
+                                                  startingTime=self._startingTime, player=self._playerName,
+                                                  playingTime=round(self._playingRunningTime, 3),
+                                                  performance=winningStatus)
+
+        # Leaderboard: The fastest winning games of the difficulty & the personal best of the player
+        best: Optional[float] = self._leaderboard.getPlayerBest(self._playingDifficulty, self._playerName)
+        if winningStatus == "WIN":
+            rank: Optional[int] = self._leaderboard.add(self._playingDifficulty, identifier, self._startingDate,
+                                                        self._startingTime, self._playerName,
+                                                        round(self._playingRunningTime, 3))
+            self._leaderboard.save(config.LEADERBOARD_PATH)
+            message: str = "Victory in {:.3f} s --- Rank: {}".format(self._playingRunningTime, rank) \
+                if rank is not None else "Victory in {:.3f} s".format(self._playingRunningTime)
+            if best is None or self._playingRunningTime < best:
+                message += " --- New personal best"
+        else:
+            message: str = "{} --- Personal best: {}".format("Defeat" if winningStatus == "LOSE" else "Dropped",
+                                                             "{:.3f} s".format(best) if best is not None else "None")
+        self.ending_matchResult.setText(message)
 
-        df = ReadFile(FilePath=config.DIRECTORY + "/resources/score/{}.csv".format(self._playingDifficulty),
-                      nrows=config.TABLE_MAX_DISPLAY, header=0)
-        self.ending_displayRanking.setModel(TableModel(df))
+        batches = self._leaderboard.iterateRanking(self._playingDifficulty, store=self._scoreStore,
+                                                   batchSize=config.TABLE_MAX_DISPLAY)
+        self.ending_displayRanking.setModel(TableModel(columns=SCORE_COLUMNS, batches=batches))
 
     def stopGame(self) -> None:
         # [0]: Set corresponding window size
@@ -679,6 +848,7 @@ class GameWindow(QMainWindow):
 
         # [4]: Activate everything of the ending interface and display result
         self.activateEndingInterface()
+        self._prepareBoards()
 
         self.update()
         self.show()
@@ -739,6 +909,10 @@ class GameWindow(QMainWindow):
         for y in range(len(self.IO_nodeMatrix)):
             for x in range(len(self.IO_nodeMatrix[y])):
                 self.IO_nodeMatrix[y][x].show()
+        if self.IO_boardView is not None:
+            self.IO_boardView.show()
+        elif self.IO_board is not None:
+            self.IO_board.show()
 
         self.displayGamingStatus = True
 
@@ -758,6 +932,10 @@ class GameWindow(QMainWindow):
         for sub_matrix in self.IO_nodeMatrix:
             for node in sub_matrix:
                 node.hide()
+        if self.IO_boardView is not None:
+            self.IO_boardView.hide()
+        elif self.IO_board is not None:
+            self.IO_board.hide()
 
         self.displayGamingStatus = False
 
@@ -795,6 +973,10 @@ class GameWindow(QMainWindow):
 
     # ----------------------------------------------------------------------------------------------------------
     # [8]: Set Size
+    def closeEvent(self, a0: QCloseEvent) -> None:
+        self._boardPool.close(timeout=1.0)
+        super(GameWindow, self).closeEvent(a0)
+
     def keyPressEvent(self, a0: QKeyEvent) -> None:
         self.keyClickEvent.append(a0.key())
 
@@ -808,6 +990,10 @@ class GameWindow(QMainWindow):
 
             self.keyClickEvent.pop()
 
+        elif self.keyClickEvent[0] == Qt.Key_H:
+            self.showHint()
+            self.keyClickEvent.clear()
+
         elif self.keyClickEvent[0] == Qt.Key_Control:
             if len(self.keyClickEvent) == 2:
                 if self.keyClickEvent[1] == Qt.Key_Z:
@@ -850,6 +1036,9 @@ class GameWindow(QMainWindow):
         self._gameSetting = False
 
     def displayInterfaceMatrixStatus(self) -> None:
+        if self.IO_board is not None:
+            self.__gameCore.displayInterfaceMatrix()
+            return None
         copy_version = np.zeros(shape=(self._playingMatrixSize[0], self._playingMatrixSize[1]), dtype=np.uint8)
         for row in range(len(self.IO_nodeMatrix)):
             for col in range(len(self.IO_nodeMatrix[row])):
@@ -858,6 +1047,9 @@ class GameWindow(QMainWindow):
         return None
 
     def displayInterfaceNodesValue(self) -> None:
+        if self.IO_board is not None:
+            self.__gameCore.displayCoreMatrix()
+            return None
         copy_version = np.zeros(shape=(self._playingMatrixSize[0], self._playingMatrixSize[1]), dtype=np.int8)
         for row in range(len(self.IO_nodeMatrix)):
             for col in range(len(self.IO_nodeMatrix[row])):
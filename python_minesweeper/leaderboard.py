@@ -0,0 +1,127 @@
+import json
+import os
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple
+from score_store import Score, ScoreStore
+
+# Entry of the leaderboard: (playing time, id of the result in the ScoreStore, starting date, starting time, player)
+Entry = Tuple[float, int, str, str, str]
+
+
+class Leaderboard:
+    """
+    The K fastest winning games of every difficulty, kept ordered as the results arrive, and the best time of every
+    player. The entries of a difficulty are a sorted list of (playing time, id): a new result is placed by bisection
+    and the list is truncated to K entries, so recording a result costs O(log K + K) whatever the size of the history.
+    The leaderboard is saved as JSON next to the score database and loaded at startup; only when the file is missing,
+    it is rebuilt from the indexed queries of the ScoreStore.
+    """
+    __slots__ = ("capacity", "_entries", "_keys", "_bests")
+
+    def __init__(self, capacity: int = 100):
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity ({}) should be a positive integer".format(capacity))
+        self.capacity: int = capacity
+        self._entries: Dict[str, List[Entry]] = {}
+        self._keys: Dict[str, List[Tuple[float, int]]] = {}  # (playing time, id) of self._entries, for bisect
+        self._bests: Dict[str, Dict[str, float]] = {}  # Difficulty --> Player --> Best playing time
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [1]: Updating Function
+    def add(self, difficulty: str, identifier: int, startingDate: str, startingTime: str, player: str,
+            playingTime: float) -> Optional[int]:
+        # Record a winning game. Return its rank (1 = fastest) or None if it is not in the K fastest games
+        playingTime: float = float(playingTime)
+        bests: Dict[str, float] = self._bests.setdefault(difficulty, {})
+        if player not in bests or playingTime < bests[player]:
+            bests[player] = playingTime
+
+        keys: List[Tuple[float, int]] = self._keys.setdefault(difficulty, [])
+        key: Tuple[float, int] = (playingTime, identifier)
+        index: int = bisect_right(keys, key)
+        if index >= self.capacity:
+            return None
+        entries: List[Entry] = self._entries.setdefault(difficulty, [])
+        keys.insert(index, key)
+        entries.insert(index, (playingTime, identifier, startingDate, startingTime, player))
+        if len(keys) > self.capacity:
+            keys.pop()
+            entries.pop()
+        return index + 1
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [2]: Query Function
+    def getTop(self, difficulty: str, n: Optional[int] = None) -> List[Entry]:
+        entries: List[Entry] = self._entries.get(difficulty, [])
+        return entries[:n] if n is not None else list(entries)
+
+    def getRank(self, difficulty: str, playingTime: float) -> Optional[int]:
+        # The rank a winning game of this playing time would take (ties: after the existing entries)
+        index: int = bisect_right(self._keys.get(difficulty, []), (float(playingTime), float("inf")))
+        return index + 1 if index < self.capacity else None
+
+    def getPlayerBest(self, difficulty: str, player: str) -> Optional[float]:
+        return self._bests.get(difficulty, {}).get(player, None)
+
+    def getScores(self, difficulty: str, n: Optional[int] = None) -> List[Score]:
+        # The entries in the format of the ScoreStore (see SCORE_COLUMNS)
+        return [(date, time, player, playing_time, "WIN")
+                for playing_time, _, date, time, player in self.getTop(difficulty, n)]
+
+    def iterateRanking(self, difficulty: str, store: Optional[ScoreStore] = None,
+                       batchSize: int = 100) -> Iterator[List[Score]]:
+        # Every winning game of the difficulty, fastest first, by batches: the leaderboard first (in memory), then the
+        # pages of the store after its last entry (see ScoreStore.getTopEntries())
+        entries: List[Entry] = self.getTop(difficulty)
+        scores: List[Score] = self.getScores(difficulty)
+        for start in range(0, len(scores), batchSize):
+            yield scores[start:start + batchSize]
+        if store is None or len(entries) < self.capacity:
+            return None
+        after: Tuple[float, int] = (entries[-1][0], entries[-1][1])
+        while True:
+            rows = store.getTopEntries(difficulty, n=batchSize, after=after)
+            if not rows:
+                return None
+            yield [(date, time, player, playing_time, "WIN") for _, date, time, player, playing_time in rows]
+            after = (rows[-1][4], rows[-1][0])
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [3]: Persistence Function
+    def save(self, path: str) -> None:
+        # Written to a temporary file first, so that a crash never leaves a truncated leaderboard
+        data = {"capacity": self.capacity, "entries": self._entries, "bests": self._bests}
+        temporary: str = path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temporary, path)
+
+    @classmethod
+    def fromStore(cls, store: ScoreStore, difficulties: List[str], capacity: int = 100) -> "Leaderboard":
+        leaderboard: Leaderboard = cls(capacity=capacity)
+        for difficulty in difficulties:
+            for identifier, date, time, player, playing_time in store.getTopEntries(difficulty, n=capacity):
+                leaderboard.add(difficulty, identifier, date, time, player, playing_time)
+            leaderboard._bests[difficulty] = store.getPlayerBests(difficulty)
+        return leaderboard
+
+    @classmethod
+    def load(cls, path: str, store: Optional[ScoreStore] = None, difficulties: Optional[List[str]] = None,
+             capacity: int = 100) -> "Leaderboard":
+        # Load the saved leaderboard. If the file is missing (or unreadable), rebuild it from the store if provided
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            leaderboard: Leaderboard = cls(capacity=capacity)
+            for difficulty, entries in data["entries"].items():
+                entries: List[Entry] = sorted(tuple(entry) for entry in entries)[:capacity]
+                leaderboard._entries[difficulty] = entries
+                leaderboard._keys[difficulty] = [(entry[0], entry[1]) for entry in entries]
+            leaderboard._bests = {difficulty: dict(bests) for difficulty, bests in data["bests"].items()}
+            if data["capacity"] >= capacity or store is None:
+                return leaderboard
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        if store is None:
+            return cls(capacity=capacity)
+        return cls.fromStore(store, difficulties=difficulties or [], capacity=capacity)
@@ -0,0 +1,136 @@
+import numpy as np
+from functools import lru_cache
+from typing import Tuple
+
+# Direction offsets (dy, dx). The first four columns of the neighbor table are the 4-neighborhood (Top, Bottom, Left,
+# Right), the remaining four are the diagonals (Top-Left, Top-Right, Bottom-Left, Bottom-Right).
+NEIGHBOR_OFFSETS: Tuple[Tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (0, 1),
+                                                 (-1, -1), (-1, 1), (1, -1), (1, 1))
+NO_NEIGHBOR: int = -1
+
+
+class NeighborTable:
+    """
+    Compact replacement of the dense (N x N) adjacency matrices of the board (N = rows * cols).
+    + self.table: (N, 8) int32 array. Row i holds the graph index of the neighbors of node i in the order of
+                  NEIGHBOR_OFFSETS, padded with NO_NEIGHBOR (-1) where the neighbor lies outside the board.
+    The memory grows linearly with the board (32 bytes per node) and the table is read-only so that it can be shared
+    by every board of the same shape (see getNeighborTable()).
+    """
+    __slots__ = ("shape", "table", "_four", "_eight")
+
+    def __init__(self, shape: Tuple[int, int]):
+        if len(shape) != 2 or shape[0] <= 0 or shape[1] <= 0:
+            raise ValueError("The shape should be a tuple with two positive values (shape={})".format(shape))
+
+        self.shape: Tuple[int, int] = (int(shape[0]), int(shape[1]))
+        max_y, max_x = self.shape
+
+        y, x = np.divmod(np.arange(max_y * max_x, dtype=np.int32), max_x)
+        table: np.ndarray = np.full(shape=(max_y * max_x, len(NEIGHBOR_OFFSETS)), fill_value=NO_NEIGHBOR,
+                                    dtype=np.int32)
+        for column, (dy, dx) in enumerate(NEIGHBOR_OFFSETS):
+            ny, nx = y + dy, x + dx
+            valid: np.ndarray = (0 <= ny) & (ny < max_y) & (0 <= nx) & (nx < max_x)
+            table[valid, column] = ny[valid] * max_x + nx[valid]
+
+        table.flags.writeable = False
+        self.table: np.ndarray = table
+        self._four: np.ndarray = table[:, :4]
+        self._eight: np.ndarray = table
+
+    def __len__(self) -> int:
+        return self.table.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+    # [1]: Query Function
+    def getNeighbors4(self, index: int) -> np.ndarray:
+        # Return the graph index of the 4-neighborhood of node (index)
+        row: np.ndarray = self._four[index]
+        return row[row != NO_NEIGHBOR]
+
+    def getNeighbors8(self, index: int) -> np.ndarray:
+        # Return the graph index of the 8-neighborhood of node (index)
+        row: np.ndarray = self._eight[index]
+        return row[row != NO_NEIGHBOR]
+
+    def getNeighbors(self, index: int, connectivity: int = 8) -> np.ndarray:
+        if connectivity == 4:
+            return self.getNeighbors4(index)
+        elif connectivity == 8:
+            return self.getNeighbors8(index)
+        raise ValueError("connectivity ({}) is in-valid. Only accept connectivity = [4, 8] only".format(connectivity))
+
+    def isAdjacent(self, index: int, other: int, connectivity: int = 8) -> bool:
+        # Equivalent to the lookup adjacencyMatrix[index, other] == 1 of the dense representation
+        row: np.ndarray = self._four[index] if connectivity == 4 else self._eight[index]
+        return bool((row == other).any()) if other != NO_NEIGHBOR else False
+
+    def getDegree(self, connectivity: int = 8) -> np.ndarray:
+        # Number of valid neighbors of every node (the row-sum of the dense adjacency matrix)
+        block: np.ndarray = self._four if connectivity == 4 else self._eight
+        return np.count_nonzero(block != NO_NEIGHBOR, axis=1)
+
+    # [2]: Graph Function
+    def labelComponents(self, mask: np.ndarray, connectivity: int = 4) -> Tuple[np.ndarray, int]:
+        """
+        Connected-component labeling of the nodes where mask is True, without recursion.
+        Roots are hooked onto the smallest adjacent root and compressed by pointer jumping until no edge crosses two
+        components, so the number of rounds grows with log(component size) rather than with the component diameter.
+
+        :param mask: Boolean array of N nodes (any shape, read in C order)
+        :param connectivity: 4 or 8
+        :return: (labels, number of components). labels[i] in [0, number of components) for masked nodes, else -1
+        """
+        mask: np.ndarray = np.asarray(mask, dtype=np.bool_).ravel()
+        if mask.shape[0] != len(self):
+            raise ValueError("The mask ({}) is not matched with the number of nodes ({})"
+                             .format(mask.shape[0], len(self)))
+        block: np.ndarray = self._four if connectivity == 4 else self._eight
+
+        nodes: np.ndarray = np.flatnonzero(mask).astype(np.int32)
+        source: np.ndarray = np.repeat(nodes, block.shape[1])
+        target: np.ndarray = block[nodes].ravel()
+        keep: np.ndarray = target > source  # Each undirected edge once, also drop the NO_NEIGHBOR padding
+        source, target = source[keep], target[keep]
+        keep: np.ndarray = mask[target]
+        source, target = source[keep], target[keep]
+
+        return labelGraph(size=len(self), nodes=nodes, source=source, target=target)
+
+
+def labelGraph(size: int, nodes: np.ndarray, source: np.ndarray, target: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Connected-component labeling of an arbitrary graph without recursion (see NeighborTable.labelComponents()).
+    :param size: Number of nodes (node index in [0, size))
+    :param nodes: Index of the nodes to label
+    :param source, target: The edges between those nodes
+    :return: (labels, number of components). labels[i] in [0, number of components) for the labeled nodes, else -1
+    """
+    parent: np.ndarray = np.arange(size, dtype=np.int32)
+    while True:
+        root_source, root_target = parent[source], parent[target]
+        crossing: np.ndarray = root_source != root_target
+        if not crossing.any():
+            break
+        low: np.ndarray = np.minimum(root_source[crossing], root_target[crossing])
+        high: np.ndarray = np.maximum(root_source[crossing], root_target[crossing])
+        np.minimum.at(parent, high, low)
+        while True:
+            jumped: np.ndarray = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+    labels: np.ndarray = np.full(shape=size, fill_value=NO_NEIGHBOR, dtype=np.int32)
+    roots, labels[nodes] = np.unique(parent[nodes], return_inverse=True)
+    return labels, int(roots.shape[0])
+
+
+@lru_cache(maxsize=8)
+def getNeighborTable(shape: Tuple[int, int]) -> NeighborTable:
+    # Every board of the same shape shares the same (read-only) table
+    return NeighborTable(shape=(int(shape[0]), int(shape[1])))
@@ -0,0 +1,84 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from benchmark import BenchmarkStatistics, gameSeed, playSeededGame
+from simulation import getSolver
+
+# Parallel game simulation over a process pool. The games of every (size, difficulty) are split into chunks of
+# consecutive indices; a worker plays a whole chunk with the seeds of gameSeed() (the same boards as the sequential
+# benchmark) and only sends back its aggregated statistics, never the board arrays. Only the core, NumPy and the
+# solvers are imported in the workers (no PyQt5 / pandas).
+Setting = Tuple[Tuple[int, int], str]  # ((rows, columns), difficulty)
+_WORKER_SOLVERS: Dict[str, object] = {}  # Solver instances of the worker process, built once per solver name
+
+
+def _playChunk(solver: str, size: Tuple[int, int], difficulty: str, seed: int, start: int, stop: int,
+               maxMoves: Optional[int]) -> Tuple[BenchmarkStatistics, float]:
+    # Executed in the worker: play the games [start, stop) of the setting. Return the statistics and the wall time
+    if solver not in _WORKER_SOLVERS:
+        _WORKER_SOLVERS[solver] = getSolver(solver)
+    engine: object = _WORKER_SOLVERS[solver]
+    statistics: BenchmarkStatistics = BenchmarkStatistics()
+    timer: float = perf_counter()
+    for index in range(start, stop):
+        statistics.add(playSeededGame(engine, size=size, difficulty=difficulty, maxMoves=maxMoves,
+                                      seed=gameSeed(seed, size=size, difficulty=difficulty, index=index)))
+    return statistics, perf_counter() - timer
+
+
+def iterateChunks(solver: str, settings: Iterable[Setting], games: int, seed: int = 0, chunkSize: int = 16,
+                  workers: Optional[int] = None, maxMoves: Optional[int] = None) \
+        -> Iterator[Tuple[Setting, BenchmarkStatistics, float]]:
+    """
+    Play (games) seeded games of every setting over a pool of (workers) processes, and yield
+    (setting, statistics of the chunk, wall time of the chunk) as soon as every chunk is completed.
+    At most 2 chunks per worker are queued, so the memory of the parent does not grow with the number of games.
+
+    :param solver: The name of the solver (see simulation.SOLVERS)
+    :param settings: The (size, difficulty) to be played, size = (rows, columns)
+    :param games: The number of games per setting
+    :param seed: The seed of the simulation (see benchmark.gameSeed())
+    :param chunkSize: The number of games played by a worker per task
+    :param workers: The number of processes (default: os.cpu_count())
+    :param maxMoves: The maximum number of moves per game (default: see playGame())
+    """
+    if not isinstance(games, int) or games <= 0:
+        raise ValueError("games ({}) should be a positive integer".format(games))
+    if not isinstance(chunkSize, int) or chunkSize <= 0:
+        raise ValueError("chunkSize ({}) should be a positive integer".format(chunkSize))
+    workers: int = workers if workers is not None else (os.cpu_count() or 1)
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError("workers ({}) should be a positive integer".format(workers))
+
+    tasks: Iterator[Tuple[Setting, int, int]] = ((setting, start, min(start + chunkSize, games))
+                                                 for setting in settings for start in range(0, games, chunkSize))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Dict[Future, Setting] = {}
+        while True:
+            for setting, start, stop in tasks:
+                future: Future = executor.submit(_playChunk, solver, setting[0], setting[1], seed, start, stop,
+                                                 maxMoves)
+                pending[future] = setting
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            done: Set[Future] = wait(pending.keys(), return_when=FIRST_COMPLETED)[0]
+            for future in done:
+                statistics, elapsed = future.result()
+                yield pending.pop(future), statistics, elapsed
+
+
+def runParallel(solver: str, settings: Iterable[Union[Setting, Tuple[int, str]]], games: int, seed: int = 0,
+                chunkSize: int = 16, workers: Optional[int] = None,
+                maxMoves: Optional[int] = None) -> Dict[Setting, BenchmarkStatistics]:
+    # Aggregate the chunks of iterateChunks() per setting. The statistics are identical to the sequential benchmark
+    # (same seeds), except the timing
+    settings: List[Setting] = [((size, size) if isinstance(size, int) else tuple(size), difficulty)
+                               for size, difficulty in settings]
+    results: Dict[Setting, BenchmarkStatistics] = {setting: BenchmarkStatistics() for setting in settings}
+    for setting, statistics, _ in iterateChunks(solver, settings=settings, games=games, seed=seed,
+                                                chunkSize=chunkSize, workers=workers, maxMoves=maxMoves):
+        results[setting].merge(statistics)
+    return results
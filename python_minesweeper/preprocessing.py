@@ -1,8 +1,11 @@
+from bisect import bisect_left
 from time import time
-from typing import Tuple, Union, List, Optional, Callable
+from typing import Tuple, Union, List, Optional, Callable, TYPE_CHECKING
 from logging import warning
 from numpy import ndarray
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd  # Imported on demand by the score I/O functions only
 
 
 def measure_execution_time(Function: Callable):
@@ -81,18 +84,9 @@ def timing_profiler(Function: Callable):
 
 
 def binarySearch(array: List[int], value: int) -> int:
-    if array:
-        start, end = 0, len(array)
-        while start <= end:
-            mid = (start + end) // 2
-            if value < array[mid]:
-                end = mid
-            elif value > array[mid]:
-                start = mid
-            else:
-                return mid
-        return -1
-    return -1
+    # Index of (value) in the sorted (array), -1 if not found
+    index: int = bisect_left(array, value)
+    return index if index < len(array) and array[index] == value else -1
 
 
 def FixPath(FileName: str, extension: str):
@@ -109,7 +103,7 @@ def ReadFile(FilePath: Optional[str], header: Optional[int] = 0, dtype=None, get
              get_columns: bool = False, nrows: Optional[int] = None, blocksize: Union[float, int] = 64e6,
              dtypes_memory_identifier: Union[float, int] = 1, usecols: Union[List[int], List[str]] = None,
              skiprows: Optional[Union[List, int]] = None) \
-        -> Optional[Union[pd.DataFrame, List, ndarray, Tuple[ndarray, List]]]:
+        -> Optional[Union["pd.DataFrame", List, ndarray, Tuple[ndarray, List]]]:
     """
     Default implementation used to call a .csv documentation.
     1 MiB = 2^10 KiB = 2^20 bytes = 1048576 bytes
@@ -164,6 +158,8 @@ def ReadFile(FilePath: Optional[str], header: Optional[int] = 0, dtype=None, get
 
         pass
 
+    import pandas as pd
+
     FilePath: str = FixPath(FileName=FilePath, extension=".csv")
     File: pd.DataFrame = pd.read_csv(FilePath, dtype=dtype, nrows=nrows, skiprows=skiprows, usecols=usecols,
                                      header=header, low_memory=True, cache_dates=False)
@@ -178,7 +174,8 @@ def ReadFile(FilePath: Optional[str], header: Optional[int] = 0, dtype=None, get
     return File.to_numpy(), File.columns.tolist()
 
 
-def ExportFile(DataFrame: pd.DataFrame, FilePath: str, index: bool = False, index_label: Optional[str] = None) -> None:
+def ExportFile(DataFrame: "pd.DataFrame", FilePath: str, index: bool = False,
+               index_label: Optional[str] = None) -> None:
     """
     Default implementation used to return the .csv documentation from DataFrame
     :param DataFrame: The DataFrame needs for creating the .csv file (pd.DataFrame).
@@ -196,6 +193,8 @@ def ExportFile(DataFrame: pd.DataFrame, FilePath: str, index: bool = False, inde
 
     :return: None
     """
+    import pandas as pd
+
     if not isinstance(DataFrame, pd.DataFrame):
         raise TypeError("DataFrame must be a DataFrame")
     if FilePath is not None:
@@ -0,0 +1,287 @@
+import numpy as np
+from math import lgamma
+from typing import Dict, List, Optional, Set, Tuple
+from core import minesweeper
+from solver import ConstraintSolver
+from neighbor import labelGraph
+
+# Constraint: (sorted graph index of the unknown neighbors of an opened number, number of bombs among them)
+Constraint = Tuple[Tuple[int, ...], int]
+MAX_COMPONENT_NODES: int = 512  # Bound of the recursion depth of the backtracking
+
+
+class EnumerationLimitError(RuntimeError):
+    """ Raised when a frontier component needs more backtracking steps than allowed """
+    pass
+
+
+def _logBinomial(n: int, k: int) -> float:
+    return lgamma(n + 1) - lgamma(k + 1) - lgamma(n - k + 1) if 0 <= k <= n else -np.inf
+
+
+def readConstraints(game: minesweeper) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Read the visible state of the game: the unknown nodes are hidden or question nodes, flags are trusted as bombs.
+    :return: (cells, bombs, unknown, remaining)
+             + cells: (M, 8) int32 - Sorted graph index of the unknown neighbors of every opened number on the frontier,
+                      padded with -1 at the end
+             + bombs: (M, ) int64 - The number of bombs among those neighbors
+             + unknown: Graph index of all unknown nodes
+             + remaining: The number of bombs which are not flagged
+    """
+    interface: np.ndarray = game.getInterfaceMatrix().ravel()
+    table: np.ndarray = game.getNeighborTable().table
+    flagged: np.ndarray = interface == game.FlagNotation
+    unknown: np.ndarray = (interface != 1) & ~flagged
+
+    opened: np.ndarray = np.flatnonzero(interface == 1)
+    rows: np.ndarray = table[opened]
+    valid: np.ndarray = rows != -1
+    unknown_rows: np.ndarray = valid & unknown[rows]
+    frontier: np.ndarray = unknown_rows.any(axis=1)
+    opened, rows, valid, unknown_rows = opened[frontier], rows[frontier], valid[frontier], unknown_rows[frontier]
+    bombs: np.ndarray = game.getCoreView().ravel()[opened].astype(np.int64) - \
+        np.count_nonzero(valid & flagged[rows], axis=1)
+
+    padding: int = game.getNumberOfNodes()
+    cells: np.ndarray = np.sort(np.where(unknown_rows, rows, padding), axis=1)
+    cells[cells == padding] = -1
+    return cells, bombs, np.flatnonzero(unknown), game.getBombNumber() - int(np.count_nonzero(flagged))
+
+
+def splitComponents(cells: np.ndarray, bombs: np.ndarray, size: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Split the constraints (see readConstraints()) into independent components: two constraints are linked when they
+    share an unknown node. The constraints of a component are sorted, so that the bytes of a component are its signature
+    :return: [(cells, bombs) of every component]
+    """
+    if cells.shape[0] == 0:
+        return []
+    valid: np.ndarray = cells != -1
+    source: np.ndarray = np.repeat(cells[:, 0], cells.shape[1])[valid.ravel()]
+    target: np.ndarray = cells[valid]
+    labels, _ = labelGraph(size=size, nodes=np.unique(target), source=source, target=target)
+
+    component: np.ndarray = labels[cells[:, 0]]
+    order: np.ndarray = np.lexsort((bombs, ) + tuple(cells[:, j] for j in range(cells.shape[1] - 1, -1, -1)) +
+                                   (component, ))
+    cells, bombs, component = cells[order], bombs[order], component[order]
+    unique: np.ndarray = np.ones(shape=cells.shape[0], dtype=np.bool_)  # Two numbers may give the same constraint
+    unique[1:] = (cells[1:] != cells[:-1]).any(axis=1) | (bombs[1:] != bombs[:-1])
+    cells, bombs, component = cells[unique], bombs[unique], component[unique]
+    bounds: np.ndarray = np.flatnonzero(np.diff(component)) + 1
+    return list(zip(np.split(cells, bounds), np.split(bombs, bounds)))
+
+
+def getSignature(cells: np.ndarray, bombs: np.ndarray) -> bytes:
+    # The number of constraints is given by the length, so the concatenation is unambiguous
+    return cells.tobytes() + bombs.tobytes()
+
+
+def toConstraints(cells: np.ndarray, bombs: np.ndarray) -> List[Constraint]:
+    return [(tuple(row[row != -1].tolist()), count) for row, count in zip(cells, bombs.tolist())]
+
+
+class ComponentSolution:
+    """
+    Every valid assignment of one frontier component, grouped by the number of bombs used.
+    + self.cells: Graph index of the component nodes
+    + self.bombs: (M, ) int - The possible numbers of bombs in the component
+    + self.weights: (M, ) float - The number of assignments using self.bombs[i] bombs
+    + self.counts: (M, len(cells)) float - Per node, the number of those assignments where the node is a bomb
+    """
+    __slots__ = ("cells", "bombs", "weights", "counts")
+
+    def __init__(self, cells: Tuple[int, ...], bombs: np.ndarray, weights: np.ndarray, counts: np.ndarray):
+        self.cells: Tuple[int, ...] = cells
+        self.bombs: np.ndarray = bombs
+        self.weights: np.ndarray = weights
+        self.counts: np.ndarray = counts
+
+
+def enumerateComponent(constraints: List[Constraint], maxSteps: int) -> ComponentSolution:
+    # Backtracking over the nodes in the order they are reached from the first constraint, so that every constraint is
+    # closed as early as possible and the branches breaking it are pruned
+    order: List[int] = []
+    seen: Set[int] = set()
+    for cells, _ in constraints:
+        for cell in cells:
+            if cell not in seen:
+                seen.add(cell)
+                order.append(cell)
+    position: Dict[int, int] = {cell: i for i, cell in enumerate(order)}
+    size: int = len(order)
+    if size > MAX_COMPONENT_NODES:
+        raise EnumerationLimitError("The component of {} nodes is too large to be enumerated".format(size))
+
+    need: List[int] = [count for _, count in constraints]
+    left: List[int] = [len(cells) for cells, _ in constraints]
+    related: List[List[int]] = [[] for _ in range(size)]
+    for j, (cells, _) in enumerate(constraints):
+        for cell in cells:
+            related[position[cell]].append(j)
+
+    assignment: np.ndarray = np.zeros(shape=size, dtype=np.int64)
+    weights: Dict[int, int] = {}
+    counts: Dict[int, np.ndarray] = {}
+    steps: List[int] = [0]
+
+    def backtrack(i: int, bombs: int) -> None:
+        if i == size:
+            if bombs not in weights:
+                weights[bombs] = 0
+                counts[bombs] = np.zeros(shape=size, dtype=np.int64)
+            weights[bombs] += 1
+            counts[bombs] += assignment
+            return None
+
+        steps[0] += 1
+        if steps[0] > maxSteps:
+            raise EnumerationLimitError("The component of {} nodes needs more than {} steps".format(size, maxSteps))
+        for value in (0, 1):
+            valid: bool = True
+            for j in related[i]:
+                left[j] -= 1
+                need[j] -= value
+                if need[j] < 0 or need[j] > left[j]:
+                    valid = False
+            if valid is True:
+                assignment[i] = value
+                backtrack(i + 1, bombs + value)
+            for j in related[i]:
+                left[j] += 1
+                need[j] += value
+        assignment[i] = 0
+
+    backtrack(0, 0)
+    bombs: np.ndarray = np.array(sorted(weights.keys()), dtype=np.int64)
+    return ComponentSolution(cells=tuple(order), bombs=bombs,
+                             weights=np.array([weights[k] for k in bombs.tolist()], dtype=np.float64),
+                             counts=np.array([counts[k] for k in bombs.tolist()], dtype=np.float64).reshape(-1, size))
+
+
+class ProbabilityEngine:
+    """
+    Exact bomb probability of every unknown node, given the visible state and the number of remaining bombs.
+    [1]: The frontier constraints are split into independent components, each one enumerated by backtracking. The
+         result of a component is memoized by its constraint signature, so only the components changed by the last
+         move are enumerated again.
+    [2]: The components are combined by convolution of their bomb counts, each total weighted by the number of ways
+         to place the remaining bombs in the unconstrained interior: C(interior, remaining - frontier bombs)
+    """
+    __slots__ = ("maxSteps", "_cache", "_fallback", "_sampler")
+
+    def __init__(self, maxSteps: int = 200000):
+        if not isinstance(maxSteps, int) or maxSteps <= 0:
+            raise ValueError("maxSteps ({}) should be positive integer".format(maxSteps))
+        self.maxSteps: int = maxSteps
+        self._cache: Dict[bytes, ComponentSolution] = {}
+        self._fallback: ConstraintSolver = ConstraintSolver()
+        self._sampler = None  # SamplingEstimator, built at the first component too large to be enumerated
+
+    def reset(self) -> None:
+        self._cache.clear()
+        self._fallback.reset()
+        if self._sampler is not None:
+            self._sampler.reset()
+
+    def _solveComponent(self, cells: np.ndarray, bombs: np.ndarray,
+                        cache: Dict[bytes, ComponentSolution]) -> ComponentSolution:
+        signature: bytes = getSignature(cells, bombs)
+        solution: Optional[ComponentSolution] = self._cache.get(signature)
+        if solution is None:
+            solution = enumerateComponent(toConstraints(cells, bombs), maxSteps=self.maxSteps)
+        cache[signature] = solution
+        return solution
+
+    def getProbabilities(self, game: minesweeper) -> np.ndarray:
+        """
+        Return a (H, W) float array: the probability that every unknown node is a bomb, NaN for the other nodes.
+        Raise EnumerationLimitError if a component is too large to be enumerated.
+        """
+        cells, bombs, unknown, remaining = readConstraints(game)
+        probabilities: np.ndarray = np.full(shape=game.getNumberOfNodes(), fill_value=np.nan, dtype=np.float64)
+        if unknown.shape[0] == 0:
+            return probabilities.reshape(game.size)
+
+        # [1]: Solve every component (memoized). Only the components of the current state are kept in the cache
+        cache: Dict[bytes, ComponentSolution] = {}
+        solutions: List[ComponentSolution] = [self._solveComponent(block, count, cache) for block, count in
+                                              splitComponents(cells, bombs, size=game.getNumberOfNodes())]
+        self._cache = cache
+        solutions = [solution for solution in solutions if solution.bombs.shape[0] != 0]
+        frontier: int = sum(len(solution.cells) for solution in solutions)
+        interior: int = unknown.shape[0] - frontier
+
+        # [2]: Distribution of the frontier bombs: dense (normalized) weight arrays indexed by the number of bombs
+        def distribution(solution: ComponentSolution) -> np.ndarray:
+            dense: np.ndarray = np.zeros(shape=int(solution.bombs[-1]) + 1, dtype=np.float64)
+            dense[solution.bombs] = solution.weights / solution.weights.max()
+            return dense
+
+        dense: List[np.ndarray] = [distribution(solution) for solution in solutions]
+        prefix: List[np.ndarray] = [np.ones(shape=1, dtype=np.float64)]
+        for array in dense:
+            merged: np.ndarray = np.convolve(prefix[-1], array)
+            prefix.append(merged / merged.max())
+        suffix: List[np.ndarray] = [np.ones(shape=1, dtype=np.float64)]
+        for array in reversed(dense):
+            merged: np.ndarray = np.convolve(suffix[-1], array)
+            suffix.append(merged / merged.max())
+        suffix.reverse()
+
+        # [3]: Weight of every total of frontier bombs: C(interior, remaining - total)
+        total: np.ndarray = np.arange(prefix[-1].shape[0])
+        log_interior: np.ndarray = np.array([_logBinomial(interior, remaining - k) for k in total.tolist()])
+        if not np.isfinite(log_interior).any() or not (prefix[-1] > 0).any():
+            # The visible state is inconsistent (e.g. wrong flags): Every unknown node is equally likely
+            probabilities[unknown] = min(max(remaining / unknown.shape[0], 0.0), 1.0)
+            return probabilities.reshape(game.size)
+        log_interior -= log_interior[np.isfinite(log_interior)].max()
+        interior_weight: np.ndarray = np.exp(log_interior)
+        normalization: float = float(np.dot(prefix[-1], interior_weight))
+
+        # [4]: Probability of the frontier nodes: the weight of the other components is prefix[c] * suffix[c + 1]
+        for c, solution in enumerate(solutions):
+            others: np.ndarray = np.convolve(prefix[c], suffix[c + 1])
+            denominator: float = float(np.dot(np.convolve(others, dense[c]), interior_weight))
+            weighted: np.ndarray = np.zeros(shape=len(solution.cells), dtype=np.float64)
+            for k, count in zip(solution.bombs.tolist(), solution.counts):
+                # Weight of every total reachable with k bombs in this component
+                reachable: np.ndarray = interior_weight[k:k + others.shape[0]]
+                weighted += count / solution.weights.max() * float(np.dot(others, reachable))
+            probabilities[list(solution.cells)] = weighted / denominator if denominator > 0 else np.nan
+
+        # [5]: Probability of the interior nodes: the expected number of remaining bombs shared by every interior node
+        if interior > 0:
+            interior_nodes: np.ndarray = np.setdiff1d(unknown, np.array([cell for solution in solutions
+                                                                          for cell in solution.cells], dtype=np.int64))
+            expected: float = float(np.dot(prefix[-1] * interior_weight, remaining - total)) / normalization
+            probabilities[interior_nodes] = expected / interior
+        return probabilities.reshape(game.size)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Solver Interface (see simulation.py)
+    def solve(self, game: minesweeper) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+        try:
+            probabilities: np.ndarray = self.getProbabilities(game)
+        except EnumerationLimitError:
+            return self._fallback.solve(game)
+        hidden: np.ndarray = game.getInterfaceMatrix() == 0
+        safe: np.ndarray = np.argwhere(hidden & (probabilities <= 1e-9))
+        mines: np.ndarray = np.argwhere(hidden & (probabilities >= 1 - 1e-9))
+        return {(int(y), int(x)) for y, x in safe}, {(int(y), int(x)) for y, x in mines}
+
+    def guess(self, game: minesweeper, rng: np.random.Generator) -> Tuple[int, int]:
+        # Open the hidden node with the lowest bomb probability (ties broken at random)
+        hidden: np.ndarray = (game.getInterfaceMatrix() == 0).ravel()
+        try:
+            probabilities: np.ndarray = self.getProbabilities(game).ravel()
+        except EnumerationLimitError:
+            if self._sampler is None:
+                from sampling import SamplingEstimator
+                self._sampler = SamplingEstimator()
+            probabilities: np.ndarray = self._sampler.getProbabilities(game).ravel()
+        probabilities: np.ndarray = np.where(hidden & ~np.isnan(probabilities), probabilities, np.inf)
+        candidates: np.ndarray = np.flatnonzero(probabilities <= probabilities.min() + 1e-12)
+        return divmod(int(candidates[rng.integers(0, candidates.shape[0])]), game.getNumberOfNodesInHorizontalAxis())
@@ -0,0 +1,361 @@
+import numpy as np
+from math import exp
+from random import Random
+from time import perf_counter
+from typing import Dict, List, Optional, Set, Tuple
+from core import minesweeper
+from probability import readConstraints, getSignature
+from solver import ConstraintSolver
+
+
+class _IndexedSet:
+    """ Set of integers with O(1) insertion, removal and uniform random choice """
+    __slots__ = ("items", "position")
+
+    def __init__(self, items):
+        self.items: List[int] = list(items)
+        self.position: Dict[int, int] = {item: i for i, item in enumerate(self.items)}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: int) -> bool:
+        return item in self.position
+
+    def add(self, item: int) -> None:
+        if item not in self.position:
+            self.position[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item: int) -> None:
+        i: Optional[int] = self.position.pop(item, None)
+        if i is not None:
+            last: int = self.items.pop()
+            if last != item:
+                self.items[i] = last
+                self.position[last] = i
+
+    def choice(self, random: Random) -> int:
+        return self.items[int(random.random() * len(self.items))]
+
+
+class _Chain:
+    """
+    State of the chain over the frontier (local index 0 .. size - 1) and the number of bombs in the interior.
+    + self.members[j]: Frontier nodes of constraint j. self.related[i]: Constraints of frontier node i
+    + self.neighbors[i]: Frontier nodes sharing a constraint with node i
+    + self.current[j]: Bombs placed in constraint j. self.violated: Constraints with current != need
+    """
+    __slots__ = ("size", "interior", "members", "related", "neighbors", "need", "current", "state", "mines", "free",
+                 "interiorBombs", "energy", "violated")
+
+    def __init__(self, members: List[List[int]], need: List[int], size: int, interior: int, state: List[int],
+                 interiorBombs: int):
+        self.size: int = size
+        self.interior: int = interior
+        self.members: List[List[int]] = members
+        self.need: List[int] = need
+        self.related: List[List[int]] = [[] for _ in range(size)]
+        neighbors: List[Set[int]] = [set() for _ in range(size)]
+        for j, row in enumerate(members):
+            for cell in row:
+                self.related[cell].append(j)
+                neighbors[cell].update(row)
+        self.neighbors: List[List[int]] = [sorted(group - {cell}) for cell, group in enumerate(neighbors)]
+
+        self.state: List[int] = state
+        self.interiorBombs: int = interiorBombs
+        self.current: List[int] = [sum(state[cell] for cell in row) for row in members]
+        self.mines: _IndexedSet = _IndexedSet(cell for cell in range(size) if state[cell] == 1)
+        self.free: _IndexedSet = _IndexedSet(cell for cell in range(size) if state[cell] == 0)
+        self.violated: _IndexedSet = _IndexedSet(j for j in range(len(members)) if self.current[j] != need[j])
+        self.energy: int = sum(abs(value - target) for value, target in zip(self.current, need))
+
+    def delta(self, cell: int, change: int) -> int:
+        # Energy change when the value of the frontier node (cell) changes by (change)
+        total: int = 0
+        for j in self.related[cell]:
+            total += abs(self.current[j] + change - self.need[j]) - abs(self.current[j] - self.need[j])
+        return total
+
+    def apply(self, cell: int, change: int) -> None:
+        for j in self.related[cell]:
+            self.energy += abs(self.current[j] + change - self.need[j]) - abs(self.current[j] - self.need[j])
+            self.current[j] += change
+            if self.current[j] != self.need[j]:
+                self.violated.add(j)
+            else:
+                self.violated.discard(j)
+        self.state[cell] += change
+        if change == 1:
+            self.free.discard(cell)
+            self.mines.add(cell)
+        else:
+            self.mines.discard(cell)
+            self.free.add(cell)
+
+    def getNeighbors(self, cell: int, value: int) -> List[int]:
+        # Frontier nodes sharing a constraint with the node (cell), which are free (value = 0) or bombs (value = 1)
+        return [other for other in self.neighbors[cell] if self.state[other] == value]
+
+
+class SamplingEstimator:
+    """
+    Anytime estimation of the bomb probability of every unknown node, for frontiers too large to be enumerated.
+    The state is a placement of the bombs on the frontier plus the number of bombs in the interior (every interior
+    node is equivalent, so a state stands for C(interior, interior bombs) placements). The energy is the violation of
+    the constraints: sum(|bombs around the number - number|).
+    [1]: A focused local search (WalkSAT) moves the state to a placement consistent with the visible board
+    [2]: A Metropolis chain then samples the consistent placements, with the weight C(interior, interior bombs). Moves:
+         swap a bomb with a free node sharing a constraint (with the Hastings correction), swap two random nodes of the
+         frontier, or move one bomb between the frontier and the interior. Only the states of zero energy are counted
+    The chain is kept between calls: it continues while the visible board is unchanged, so repeated calls refine the
+    estimation, and restarts from the previous placement after a move.
+    """
+    __slots__ = ("budget", "temperature", "noise", "_random", "_signature", "_chain", "_frontier", "_placement",
+                 "_counts", "_interiorCounts", "_samples", "_relaxedCounts", "_relaxedInterior", "_relaxedSamples",
+                 "_fallback")
+
+    def __init__(self, budget: float = 0.05, temperature: float = 0.3, noise: float = 0.3, seed: Optional[int] = None):
+        if budget <= 0:
+            raise ValueError("budget ({}) should be positive".format(budget))
+        if temperature <= 0:
+            raise ValueError("temperature ({}) should be positive".format(temperature))
+        if not 0 <= noise <= 1:
+            raise ValueError("noise ({}) should be in the range of [0, 1]".format(noise))
+        self.budget: float = budget
+        self.temperature: float = temperature
+        self.noise: float = noise  # Probability of a random step in the local search
+        self._random: Random = Random(seed)
+        self._signature: Optional[bytes] = None
+        self._chain: Optional[_Chain] = None
+        self._frontier: Optional[np.ndarray] = None
+        self._placement: Dict[int, int] = {}  # Graph index --> 0 / 1 of the frontier nodes in the last state
+        self._counts: Optional[np.ndarray] = None
+        self._interiorCounts: float = 0
+        self._samples: int = 0
+        self._relaxedCounts: Optional[np.ndarray] = None
+        self._relaxedInterior: float = 0
+        self._relaxedSamples: int = 0
+        self._fallback: ConstraintSolver = ConstraintSolver()
+
+    def reset(self) -> None:
+        self._signature = None
+        self._chain = None
+        self._placement.clear()
+        self._fallback.reset()
+
+    def getSamples(self) -> int:
+        # Number of consistent states counted in the current estimation
+        return self._samples
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [1]: Chain Function
+    def _prepare(self, cells: np.ndarray, bombs: np.ndarray, unknown: np.ndarray, remaining: int) -> None:
+        # Build a new chain when the visible board has changed, starting from the previous placement where possible
+        signature: bytes = getSignature(cells, bombs) + unknown.tobytes() + np.int64(remaining).tobytes()
+        if signature == self._signature:
+            return None
+
+        frontier: np.ndarray = np.unique(cells[cells != -1])
+        size: int = frontier.shape[0]
+        interior: int = unknown.shape[0] - size
+        local: np.ndarray = np.searchsorted(frontier, cells)
+        members: List[List[int]] = [row[mask].tolist() for row, mask in zip(local, cells != -1)]
+
+        state: List[int] = [self._placement.get(node, -1) for node in frontier.tolist()]
+        missing: List[int] = [cell for cell in range(size) if state[cell] == -1]
+        density: float = remaining / unknown.shape[0]
+        for cell in missing:
+            state[cell] = 1 if self._random.random() < density else 0
+        # Fit the total number of bombs: the interior takes the rest, within [0, interior]
+        interior_bombs: int = remaining - sum(state)
+        order: List[int] = list(range(size))
+        self._random.shuffle(order)
+        for cell in order:
+            if 0 <= interior_bombs <= interior:
+                break
+            if interior_bombs < 0 and state[cell] == 1:
+                state[cell], interior_bombs = 0, interior_bombs + 1
+            elif interior_bombs > interior and state[cell] == 0:
+                state[cell], interior_bombs = 1, interior_bombs - 1
+
+        self._signature = signature
+        self._frontier = frontier
+        self._chain = _Chain(members=members, need=bombs.tolist(), size=size, interior=interior, state=state,
+                             interiorBombs=interior_bombs)
+        self._counts = np.zeros(shape=size, dtype=np.float64)
+        self._relaxedCounts = np.zeros(shape=size, dtype=np.float64)
+        self._interiorCounts, self._relaxedInterior = 0, 0
+        self._samples, self._relaxedSamples = 0, 0
+
+    def _flip(self, chain: _Chain, cell: int) -> bool:
+        # Move one bomb between the frontier node (cell) and the interior. Return False if the interior is full/empty
+        if chain.state[cell] == 1 and chain.interiorBombs < chain.interior:
+            chain.apply(cell, -1)
+            chain.interiorBombs += 1
+            return True
+        elif chain.state[cell] == 0 and chain.interiorBombs > 0:
+            chain.apply(cell, 1)
+            chain.interiorBombs -= 1
+            return True
+        return False
+
+    def _search(self, chain: _Chain, deadline: float) -> None:
+        # [1]: Focused local search: repair a random violated constraint with the best (or a random) node of it
+        random: Random = self._random
+        steps: int = 0
+        while chain.energy != 0:
+            steps += 1
+            if steps & 255 == 0 and perf_counter() >= deadline:
+                break
+            j: int = chain.violated.choice(random)
+            change: int = -1 if chain.current[j] > chain.need[j] else 1
+            value: int = 1 if change == -1 else 0
+            candidates: List[int] = [cell for cell in chain.members[j] if chain.state[cell] == value]
+            if random.random() < self.noise:
+                cell: int = candidates[int(random.random() * len(candidates))]
+            else:
+                cell: int = min(candidates, key=lambda node: (chain.delta(node, change), random.random()))
+            if self._flip(chain, cell) is False:
+                # The interior cannot absorb the bomb: swap with a random frontier node of the opposite value
+                others: _IndexedSet = chain.free if change == -1 else chain.mines
+                if len(others) != 0:
+                    other: int = others.choice(random)
+                    chain.apply(cell, change)
+                    chain.apply(other, -change)
+
+    def _sample(self, chain: _Chain, deadline: float) -> None:
+        # [2]: Metropolis chain over the placements, weighted by C(interior, interior bombs) * exp(-energy / T)
+        random: Random = self._random
+        temperature: float = self.temperature
+        counts: np.ndarray = np.zeros(shape=chain.size, dtype=np.float64)
+        relaxed: np.ndarray = np.zeros(shape=chain.size, dtype=np.float64)
+        samples, interior_counts, relaxed_samples, relaxed_interior = 0, 0, 0, 0
+        steps: int = 0
+        while True:
+            steps += 1
+            if steps & 255 == 0 and perf_counter() >= deadline:
+                break
+            if steps & 7 == 0:
+                if chain.energy == 0:
+                    counts[chain.mines.items] += 1
+                    interior_counts += chain.interiorBombs
+                    samples += 1
+                relaxed[chain.mines.items] += 1
+                relaxed_interior += chain.interiorBombs
+                relaxed_samples += 1
+
+            move: float = random.random()
+            if move < 0.6 and len(chain.mines) != 0:
+                # Local swap: a bomb moves to a free node sharing a constraint. A double swap then moves a bomb around
+                # the new position, which crosses the patterns needing two moves at once (e.g. the 2x2 50/50).
+                # Proposal ratio of the reversed path: (choices of the forward path) / (choices of the reversed path)
+                bomb: int = chain.mines.choice(random)
+                free: List[int] = chain.getNeighbors(bomb, 0)
+                if not free:
+                    continue
+                node: int = free[int(random.random() * len(free))]
+                before: int = chain.energy
+                chain.apply(bomb, -1)
+                chain.apply(node, 1)
+                if move < 0.3:
+                    ratio: float = len(free) / len(chain.getNeighbors(node, 0))
+                    path: Tuple[Tuple[int, int], ...] = ((bomb, node), )
+                else:
+                    second: List[int] = chain.getNeighbors(node, 1)
+                    other: int = second[int(random.random() * len(second))] if second else -1
+                    target: List[int] = chain.getNeighbors(other, 0) if other != -1 else []
+                    if not target:
+                        chain.apply(node, -1)
+                        chain.apply(bomb, 1)
+                        continue
+                    last: int = target[int(random.random() * len(target))]
+                    reverse: Tuple[int, int] = (len(chain.getNeighbors(other, 1)), len(chain.getNeighbors(node, 0)))
+                    chain.apply(other, -1)
+                    chain.apply(last, 1)
+                    ratio: float = len(free) * len(second) * len(target) / \
+                        (len(chain.getNeighbors(last, 0)) * reverse[0] * reverse[1])
+                    path: Tuple[Tuple[int, int], ...] = ((bomb, node), (other, last))
+                if random.random() >= ratio * exp((before - chain.energy) / temperature):
+                    for source, destination in reversed(path):
+                        chain.apply(destination, -1)
+                        chain.apply(source, 1)
+            elif move < 0.7 and len(chain.mines) != 0 and len(chain.free) != 0:
+                # Global swap of two random frontier nodes (symmetric)
+                bomb, node = chain.mines.choice(random), chain.free.choice(random)
+                change: int = chain.delta(bomb, -1)
+                chain.apply(bomb, -1)
+                change += chain.delta(node, 1)
+                if change <= 0 or random.random() < exp(-change / temperature):
+                    chain.apply(node, 1)
+                else:
+                    chain.apply(bomb, 1)
+            elif chain.size != 0:
+                # Move one bomb between a frontier node and the interior, with the ratio of C(interior, k)
+                cell: int = int(random.random() * chain.size)
+                k, interior = chain.interiorBombs, chain.interior
+                if chain.state[cell] == 1 and k < interior:
+                    ratio: float = (interior - k) / (k + 1) * exp(-chain.delta(cell, -1) / temperature)
+                    if random.random() < ratio:
+                        self._flip(chain, cell)
+                elif chain.state[cell] == 0 and k > 0:
+                    ratio: float = k / (interior - k + 1) * exp(-chain.delta(cell, 1) / temperature)
+                    if random.random() < ratio:
+                        self._flip(chain, cell)
+
+        self._counts += counts
+        self._interiorCounts += interior_counts
+        self._samples += samples
+        self._relaxedCounts += relaxed
+        self._relaxedInterior += relaxed_interior
+        self._relaxedSamples += relaxed_samples
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [2]: Estimation Function
+    def getProbabilities(self, game: minesweeper, deadline: Optional[float] = None) -> np.ndarray:
+        """
+        Return a (H, W) float array: the estimated probability that every unknown node is a bomb, NaN for the other
+        nodes. The chain runs until deadline (perf_counter() time, default: now + self.budget). If no consistent state
+        has been reached yet, the estimation uses every visited state (biased), else the density of the bombs.
+        """
+        deadline: float = deadline if deadline is not None else perf_counter() + self.budget
+        cells, bombs, unknown, remaining = readConstraints(game)
+        probabilities: np.ndarray = np.full(shape=game.getNumberOfNodes(), fill_value=np.nan, dtype=np.float64)
+        if unknown.shape[0] == 0:
+            return probabilities.reshape(game.size)
+        remaining: int = min(max(remaining, 0), unknown.shape[0])
+
+        self._prepare(cells, bombs, unknown, remaining)
+        chain: _Chain = self._chain
+        if chain.size != 0:
+            self._search(chain, deadline)
+            self._sample(chain, deadline)
+            self._placement = dict(zip(self._frontier.tolist(), chain.state))
+
+        if self._samples != 0:
+            counts, interior_bombs, samples = self._counts, self._interiorCounts, self._samples
+        elif self._relaxedSamples != 0:
+            counts, interior_bombs, samples = self._relaxedCounts, self._relaxedInterior, self._relaxedSamples
+        else:
+            probabilities[unknown] = remaining / unknown.shape[0]
+            return probabilities.reshape(game.size)
+
+        probabilities[self._frontier] = counts / samples
+        if chain.interior > 0:
+            interior_nodes: np.ndarray = np.setdiff1d(unknown, self._frontier, assume_unique=True)
+            probabilities[interior_nodes] = interior_bombs / samples / chain.interior
+        return probabilities.reshape(game.size)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Solver Interface (see simulation.py): Sampling cannot prove a node, so the guaranteed nodes come from the rules
+    def solve(self, game: minesweeper) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+        return self._fallback.solve(game)
+
+    def guess(self, game: minesweeper, rng: np.random.Generator) -> Tuple[int, int]:
+        # Open the hidden node with the lowest estimated bomb probability (ties broken at random)
+        hidden: np.ndarray = (game.getInterfaceMatrix() == 0).ravel()
+        probabilities: np.ndarray = self.getProbabilities(game).ravel()
+        probabilities: np.ndarray = np.where(hidden & ~np.isnan(probabilities), probabilities, np.inf)
+        candidates: np.ndarray = np.flatnonzero(probabilities <= probabilities.min() + 1e-12)
+        return divmod(int(candidates[rng.integers(0, candidates.shape[0])]), game.getNumberOfNodesInHorizontalAxis())
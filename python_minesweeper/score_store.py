@@ -0,0 +1,174 @@
+import csv
+import hashlib
+import os
+import sqlite3
+from logging import warning
+from typing import Dict, List, Optional, Tuple
+
+# Storage of the game results (one row per finished game) in a SQLite database, replacing the whole-file rewrite of
+# resources/score/<difficulty>.csv. Recording a result is a single INSERT (O(log N) in the B-tree), and the queries of
+# the ending interface only read the rows they return through the indexes:
+# + idx_scores_latest: (difficulty, id) --> The latest N results
+# + idx_scores_best: (difficulty, performance, playing_time, id) --> The N fastest winning games
+# + idx_scores_player: (difficulty, player, performance, playing_time, id) --> The best results of a player
+SCORE_COLUMNS: Tuple[str, ...] = ("Starting Date", "Starting Time", "Player Name", "Playing Time", "Performance")
+SCORE_PERFORMANCE: Tuple[str, ...] = ("WIN", "LOSE", "DROP")
+Score = Tuple[str, str, str, float, str]  # Same order as SCORE_COLUMNS
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    difficulty TEXT NOT NULL,
+    starting_date TEXT NOT NULL,
+    starting_time TEXT NOT NULL,
+    player TEXT NOT NULL,
+    playing_time REAL NOT NULL,
+    performance TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_latest ON scores (difficulty, id);
+CREATE INDEX IF NOT EXISTS idx_scores_best ON scores (difficulty, performance, playing_time, id);
+CREATE INDEX IF NOT EXISTS idx_scores_player ON scores (difficulty, player, performance, playing_time, id);
+CREATE TABLE IF NOT EXISTS imports (
+    source TEXT PRIMARY KEY,
+    rows INTEGER NOT NULL
+);
+"""
+_SELECT: str = "SELECT starting_date, starting_time, player, playing_time, performance FROM scores "
+
+
+class ScoreStore:
+    """
+    Append-only score database. Every method runs in its own transaction, so a crash of the game never leaves a
+    partially written result. The database is opened in WAL mode: a result is appended to the log instead of
+    rewriting the pages of the file.
+    """
+    __slots__ = ("path", "_connection")
+
+    def __init__(self, path: str):
+        if not isinstance(path, str):
+            raise TypeError("The path ({}) of the score database should be a string".format(path))
+        self.path: str = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection: sqlite3.Connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "ScoreStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [1]: Writing Function
+    def record(self, difficulty: str, startingDate: str, startingTime: str, player: str, playingTime: float,
+               performance: str) -> int:
+        # Append one result. Return its id (increasing with the time of recording)
+        if performance not in SCORE_PERFORMANCE:
+            raise ValueError("performance ({}) is in-valid. Only accept performance = {} only"
+                             .format(performance, SCORE_PERFORMANCE))
+        with self._connection:
+            cursor: sqlite3.Cursor = self._connection.execute(
+                "INSERT INTO scores (difficulty, starting_date, starting_time, player, playing_time, performance) "
+                "VALUES (?, ?, ?, ?, ?, ?)", (difficulty, startingDate, startingTime, player, float(playingTime),
+                                              performance))
+        return cursor.lastrowid
+
+    def importCSV(self, path: str, difficulty: str) -> int:
+        """
+        One-time import of a score file of the previous versions (resources/score/<difficulty>.csv, newest row first).
+        The columns are read by position (see SCORE_COLUMNS), the empty rows are skipped. A file is imported only
+        once: the imported files are kept in the table "imports", by the hash of their content so that moving or
+        renaming the game directory does not import them again. Return the number of imported rows.
+        """
+        with open(path, "rb") as file:
+            source: str = "sha256:" + hashlib.sha256(file.read()).hexdigest()
+        if self._connection.execute("SELECT 1 FROM imports WHERE source = ?", (source, )).fetchone() is not None:
+            return 0
+        with self._connection:
+            # The databases of the previous version kept the absolute path of the file: keep its hash instead
+            legacy: sqlite3.Cursor = self._connection.execute("UPDATE imports SET source = ? WHERE source = ?",
+                                                              (source, os.path.abspath(path)))
+        if legacy.rowcount != 0:
+            return 0
+        rows: List[Tuple[str, str, str, str, float, str]] = []
+        with open(path, "r", newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Header
+            for line, row in enumerate(reader, start=2):
+                if len(row) < len(SCORE_COLUMNS) or not any(value.strip() for value in row):
+                    continue
+                try:
+                    playing_time: float = float(row[3])
+                except ValueError:
+                    warning(" Skip the row {} of {}: The playing time ({}) is not a number".format(line, path, row[3]))
+                    continue
+                if row[4] not in SCORE_PERFORMANCE:
+                    warning(" Skip the row {} of {}: Unknown performance ({})".format(line, path, row[4]))
+                    continue
+                rows.append((difficulty, row[0], row[1], row[2], playing_time, row[4]))
+
+        with self._connection:
+            # The file is newest-first: insert the oldest first so that the id follows the time of recording
+            self._connection.executemany(
+                "INSERT INTO scores (difficulty, starting_date, starting_time, player, playing_time, performance) "
+                "VALUES (?, ?, ?, ?, ?, ?)", reversed(rows))
+            self._connection.execute("INSERT INTO imports (source, rows) VALUES (?, ?)", (source, len(rows)))
+        return len(rows)
+
+    def importDirectory(self, directory: str) -> int:
+        # Import every <difficulty>.csv of the directory (see importCSV()). Return the number of imported rows
+        total: int = 0
+        if os.path.isdir(directory):
+            for name in sorted(os.listdir(directory)):
+                if name.lower().endswith(".csv"):
+                    total += self.importCSV(os.path.join(directory, name), difficulty=os.path.splitext(name)[0])
+        return total
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [2]: Query Function
+    def getLatest(self, difficulty: str, n: int) -> List[Score]:
+        # The n latest results (newest first)
+        return self._connection.execute(_SELECT + "WHERE difficulty = ? ORDER BY id DESC LIMIT ?",
+                                        (difficulty, n)).fetchall()
+
+    def getTop(self, difficulty: str, n: int, player: Optional[str] = None) -> List[Score]:
+        # The n fastest winning games (ties: the earliest recorded first), of every player or of one player
+        if player is None:
+            return self._connection.execute(
+                _SELECT + "WHERE difficulty = ? AND performance = 'WIN' ORDER BY playing_time, id LIMIT ?",
+                (difficulty, n)).fetchall()
+        return self._connection.execute(
+            _SELECT + "WHERE difficulty = ? AND player = ? AND performance = 'WIN' ORDER BY playing_time, id LIMIT ?",
+            (difficulty, player, n)).fetchall()
+
+    def getTopEntries(self, difficulty: str, n: int, after: Optional[Tuple[float, int]] = None) \
+            -> List[Tuple[int, str, str, str, float]]:
+        # Same as getTop() with the id of the result: (id, starting date, starting time, player, playing time).
+        # Keyset pagination: after = (playing time, id) of the last entry of the previous page
+        if after is None:
+            return self._connection.execute(
+                "SELECT id, starting_date, starting_time, player, playing_time FROM scores "
+                "WHERE difficulty = ? AND performance = 'WIN' ORDER BY playing_time, id LIMIT ?",
+                (difficulty, n)).fetchall()
+        return self._connection.execute(
+            "SELECT id, starting_date, starting_time, player, playing_time FROM scores "
+            "WHERE difficulty = ? AND performance = 'WIN' AND (playing_time, id) > (?, ?) ORDER BY playing_time, id "
+            "LIMIT ?", (difficulty, float(after[0]), int(after[1]), n)).fetchall()
+
+    def getPlayerBests(self, difficulty: str) -> Dict[str, float]:
+        # Best winning time of every player (read from the index idx_scores_player)
+        return dict(self._connection.execute(
+            "SELECT player, MIN(playing_time) FROM scores WHERE difficulty = ? AND performance = 'WIN' GROUP BY player",
+            (difficulty, )).fetchall())
+
+    def count(self, difficulty: Optional[str] = None) -> int:
+        if difficulty is None:
+            return self._connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+        return self._connection.execute("SELECT COUNT(*) FROM scores WHERE difficulty = ?",
+                                        (difficulty, )).fetchone()[0]
@@ -0,0 +1,152 @@
+import numpy as np
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from core import minesweeper
+from solver import ConstraintSolver
+from probability import ProbabilityEngine
+from elimination import EliminationSolver
+from sampling import SamplingEstimator
+
+# Headless game loop shared by the command line (cli.py) and every batch simulation. Only NumPy & the core are needed.
+# A solver is any object with:
+# + solve(game) -> (safe, mines): The unrevealed nodes (y, x) that are guaranteed to be safe / to be a bomb
+# + guess(game, rng) -> (y, x): [Optional] The node to open when nothing is guaranteed (default: random node)
+# + reset(): [Optional] Called before each game to drop the state of the previous game
+
+
+class GameResult(NamedTuple):
+    victory: bool
+    moves: int  # Number of clicks (left & right)
+    guesses: int  # Number of clicks which were not guaranteed by the solver
+    elapsed: float  # Wall time of the game (seconds)
+    latencies: List[float]  # Time spent by the solver for every decision (seconds)
+    openedNodes: int
+
+
+class RandomSolver:
+    """ Baseline solver: No deduction, every move is a guess on a random unrevealed node """
+
+    def solve(self, game: minesweeper) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+        return set(), set()
+
+    @staticmethod
+    def guess(game: minesweeper, rng: np.random.Generator) -> Tuple[int, int]:
+        unknown: np.ndarray = np.flatnonzero(game.getInterfaceMatrix() == 0)
+        return divmod(int(unknown[rng.integers(0, unknown.shape[0])]), game.getNumberOfNodesInHorizontalAxis())
+
+
+SOLVERS: Dict[str, type] = {
+    "random": RandomSolver,
+    "constraint": ConstraintSolver,
+    "probability": ProbabilityEngine,
+    "elimination": EliminationSolver,
+    "sampling": SamplingEstimator,
+}
+
+
+def getSolver(name: str) -> object:
+    if name in SOLVERS.keys():
+        return SOLVERS[name]()
+    raise ValueError("Solver ({}) is in-valid. Only accept solver = {} only".format(name, list(SOLVERS.keys())))
+
+
+def applyMoves(game: minesweeper, moves: List[str]) -> int:
+    # Apply moves written as "<L|R|M>:<y>,<x>" (Left Mouse, Right Mouse, Multi-Click). Return the applied moves
+    applied: int = 0
+    for move in moves:
+        try:
+            action, position = move.split(":")
+            y, x = (int(value) for value in position.split(","))
+        except ValueError:
+            raise ValueError("Move ({}) is in-valid. Only accept move = <L|R|M>:<y>,<x> only".format(move))
+
+        action: str = action.upper()
+        if action == "L":
+            game.click(y=y, x=x, message="LeftMouse")
+        elif action == "R":
+            game.click(y=y, x=x, message="RightMouse")
+        elif action == "M":
+            game.multiClick(y=y, x=x)
+        else:
+            raise ValueError("Move ({}) is in-valid. Only accept move = <L|R|M>:<y>,<x> only".format(move))
+        applied += 1
+        if game.checkIfPlayable() is False:
+            break
+    return applied
+
+
+def _decide(game: minesweeper, solver: object, unknown: np.ndarray) \
+        -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+    # The guaranteed nodes (safe, mines). Every remaining node is a bomb when they are as many as the remaining flags
+    if unknown.shape[0] == game.getRemainingFlags():
+        return set(), {divmod(int(index), game.size[1]) for index in unknown}
+    return solver.solve(game)
+
+
+def _applyDecision(game: minesweeper, interface: np.ndarray, safe: Set[Tuple[int, int]],
+                   mines: Set[Tuple[int, int]]) -> int:
+    # Flag the mines, then open the safe nodes. Return the number of clicks
+    moves: int = 0
+    for y, x in mines:
+        if game.checkIfPlayable() is True and interface[y, x] == 0:
+            game.click(y=y, x=x, message="RightMouse")
+            moves += 1
+    for y, x in safe:
+        if game.checkIfPlayable() is True and interface[y, x] == 0:
+            game.click(y=y, x=x, message="LeftMouse")
+            moves += 1
+    return moves
+
+
+def isSolvableWithoutGuess(game: minesweeper, solver: Optional[object] = None,
+                           deadline: Optional[float] = None) -> bool:
+    """
+    Play the game with the deductions of the solver only (default: EliminationSolver) and return True if it is won
+    without any guess. Return False as soon as the solver is stuck, or when perf_counter() passes the deadline.
+    The game is played (modified): pass a copy (e.g. minesweeper(boardID=game.getBoardID())) to keep the original.
+    """
+    solver: object = solver if solver is not None else EliminationSolver()
+    if hasattr(solver, "reset"):
+        solver.reset()
+    interface: np.ndarray = game.getInterfaceMatrix()
+    while game.checkIfPlayable() is True:
+        unknown: np.ndarray = np.flatnonzero(interface == 0)
+        if unknown.shape[0] == 0 or (deadline is not None and perf_counter() > deadline):
+            break
+        safe, mines = _decide(game, solver=solver, unknown=unknown)
+        if _applyDecision(game, interface=interface, safe=safe, mines=mines) == 0:
+            break
+    return game.checkIfVictory()
+
+
+def playGame(game: minesweeper, solver: object, rng: Optional[np.random.Generator] = None,
+             maxMoves: Optional[int] = None) -> GameResult:
+    # Play the game until it is finished by repeatedly asking the solver for guaranteed nodes, or guessing otherwise
+    rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
+    maxMoves: int = maxMoves if maxMoves is not None else 2 * game.getNumberOfNodes()
+    guess = getattr(solver, "guess", RandomSolver.guess)
+    if hasattr(solver, "reset"):
+        solver.reset()
+
+    interface: np.ndarray = game.getInterfaceMatrix()
+    moves, guesses = 0, 0
+    latencies: List[float] = []
+    start: float = perf_counter()
+    while game.checkIfPlayable() is True and moves < maxMoves:
+        unknown: np.ndarray = np.flatnonzero(interface == 0)
+        if unknown.shape[0] == 0:
+            break  # Every node is opened or marked but the game is not won (wrong flags)
+
+        # [1]: Decision
+        timer: float = perf_counter()
+        safe, mines = _decide(game, solver=solver, unknown=unknown)
+        if not safe and not mines:
+            safe = {guess(game, rng)}
+            guesses += 1
+        latencies.append(perf_counter() - timer)
+
+        # [2]: Apply the decision
+        moves += _applyDecision(game, interface=interface, safe=safe, mines=mines)
+
+    return GameResult(victory=game.checkIfVictory(), moves=moves, guesses=guesses, elapsed=perf_counter() - start,
+                      latencies=latencies, openedNodes=int(np.count_nonzero(interface == 1)))
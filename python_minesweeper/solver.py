@@ -0,0 +1,154 @@
+import numpy as np
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from core import minesweeper
+from neighbor import NeighborTable
+
+
+class ConstraintSolver:
+    """
+    Deterministic solver reading only what the player can see: the interface matrix and the numbers of the opened nodes.
+    Every opened number gives a constraint (unknown neighbors, number of bombs among them), flags are trusted as bombs.
+    Rules applied on the frontier until no new node is found:
+    + Single-point: A constraint with 0 bomb --> Every node is safe. As many bombs as nodes --> Every node is a bomb
+    + Subset: If the nodes of A are included in B, then (B - A) holds (bombs of B - bombs of A) bombs
+    The solver is incremental: only the constraints around the nodes changed since the previous call are rebuilt.
+    + self._constraints: Graph index of the opened node --> (unknown neighbors, remaining bombs)
+    + self._cellConstraints: Graph index of an unknown node --> The opened nodes constraining it
+    + self._safe / self._mines: Graph index of the nodes deduced so far
+    """
+    __slots__ = ("_game", "_seen", "_table", "_constraints", "_cellConstraints", "_safe", "_mines")
+
+    def __init__(self):
+        self._game: Optional[int] = None
+        self._seen: Optional[np.ndarray] = None
+        self._table: Optional[NeighborTable] = None
+        self._constraints: Dict[int, Tuple[FrozenSet[int], int]] = {}
+        self._cellConstraints: Dict[int, Set[int]] = {}
+        self._safe: Set[int] = set()
+        self._mines: Set[int] = set()
+
+    def reset(self) -> None:
+        self._game = None
+        self._seen = None
+        self._table = None
+        self._constraints.clear()
+        self._cellConstraints.clear()
+        self._safe.clear()
+        self._mines.clear()
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [1]: Constraint Function
+    def _setConstraint(self, index: int, cells: FrozenSet[int], bombs: int) -> None:
+        self._dropConstraint(index)
+        if cells and 0 <= bombs <= len(cells):  # An inconsistent constraint (wrong flags) is ignored
+            self._constraints[index] = (cells, bombs)
+            for cell in cells:
+                self._cellConstraints.setdefault(cell, set()).add(index)
+
+    def _dropConstraint(self, index: int) -> None:
+        constraint = self._constraints.pop(index, None)
+        if constraint is not None:
+            for cell in constraint[0]:
+                related: Set[int] = self._cellConstraints[cell]
+                related.discard(index)
+                if not related:
+                    del self._cellConstraints[cell]
+
+    def _buildConstraint(self, index: int, interface: np.ndarray, core: np.ndarray, flag: int) -> None:
+        # Unknown neighbors: hidden or question nodes which are not deduced yet. Known bombs: flags & deduced bombs
+        if interface[index] != 1 or core[index] <= 0:
+            self._dropConstraint(index)
+            return None
+        row: np.ndarray = self._table.table[index]
+        cells: Set[int] = set()
+        bombs: int = int(core[index])
+        for neighbor in row[row != -1].tolist():
+            if interface[neighbor] == flag or neighbor in self._mines:
+                bombs -= 1
+            elif interface[neighbor] != 1 and neighbor not in self._safe:
+                cells.add(neighbor)
+        self._setConstraint(index, frozenset(cells), bombs)
+
+    def _deduce(self, cells: FrozenSet[int], bombs: int, worklist: List[int]) -> None:
+        # All (cells) are bombs if bombs == len(cells), all safe if bombs == 0. Reduce every constraint on them
+        if bombs != 0 and bombs != len(cells):
+            return None
+        known: Set[int] = self._mines if bombs != 0 else self._safe
+        for cell in cells:
+            if cell in self._mines or cell in self._safe:
+                continue
+            known.add(cell)
+            for index in tuple(self._cellConstraints.get(cell, ())):
+                remaining, count = self._constraints[index]
+                self._setConstraint(index, remaining - {cell}, count - 1 if bombs != 0 else count)
+                worklist.append(index)
+
+    def _propagate(self, worklist: List[int]) -> None:
+        while worklist:
+            index: int = worklist.pop()
+            if index not in self._constraints:
+                continue
+            cells, bombs = self._constraints[index]
+
+            # [1]: Single-point rule
+            if bombs == 0 or bombs == len(cells):
+                self._deduce(cells, bombs, worklist)
+                continue
+
+            # [2]: Subset rule against every constraint sharing a node
+            others: Set[int] = set()
+            for cell in cells:
+                others.update(self._cellConstraints.get(cell, ()))
+            others.discard(index)
+            for other in others:
+                if index not in self._constraints:
+                    break
+                if other not in self._constraints:
+                    continue
+                cells, bombs = self._constraints[index]
+                other_cells, other_bombs = self._constraints[other]
+                if cells < other_cells:
+                    self._deduce(other_cells - cells, other_bombs - bombs, worklist)
+                elif other_cells < cells:
+                    self._deduce(cells - other_cells, bombs - other_bombs, worklist)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # [2]: Solving Function
+    def solve(self, game: minesweeper) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+        """
+        Return the hidden nodes (y, x) which are guaranteed to be safe, and the ones guaranteed to be a bomb.
+        Cost: O(N) to find the changed nodes (vectorized), then O(changed constraints) in Python.
+        """
+        interface: np.ndarray = game.getInterfaceMatrix().ravel()
+        if self._seen is not None and self._seen.shape == interface.shape and \
+                ((self._seen == game.FlagNotation) & (interface != game.FlagNotation)).any():
+            self._game = None  # A flag has been removed: The deductions relying on it are dropped
+        if self._game != id(game) or self._seen is None or self._seen.shape != interface.shape:
+            self.reset()
+            self._game = id(game)
+            self._table = game.getNeighborTable()
+            self._seen = np.zeros(shape=interface.shape, dtype=interface.dtype)
+
+        # [1]: Rebuild the constraints around the changed nodes
+        changed: np.ndarray = np.flatnonzero(interface != self._seen)
+        if changed.shape[0] != 0:
+            core: np.ndarray = np.where(interface == 1, game.getCoreView().ravel(), 0)
+            affected: np.ndarray = np.unique(np.concatenate((changed, self._table.table[changed].ravel())))
+            affected: np.ndarray = affected[affected != -1]
+
+            # Only the opened numbers on the frontier (with a not-opened neighbor) hold a constraint
+            rows: np.ndarray = self._table.table[affected]
+            frontier: np.ndarray = (core[affected] > 0) & ((rows != -1) & (interface[rows] != 1)).any(axis=1)
+            affected: np.ndarray = affected[frontier | np.isin(affected, list(self._constraints.keys()))]
+            worklist: List[int] = []
+            for index in affected.tolist():
+                self._buildConstraint(index, interface, core, game.FlagNotation)
+                worklist.append(index)
+            self._propagate(worklist)
+            self._seen = interface.copy()
+
+        # [2]: Report the deduced nodes which are still hidden
+        max_x: int = game.getNumberOfNodesInHorizontalAxis()
+        safe: Set[Tuple[int, int]] = {divmod(index, max_x) for index in self._safe if interface[index] == 0}
+        mines: Set[Tuple[int, int]] = {divmod(index, max_x) for index in self._mines if interface[index] == 0}
+        return safe, mines